@@ -13,7 +13,7 @@
 
 import xlsxwriter
 from datetime import datetime as dt
-from util.gar_classes import GARExcel, TotalArea, CellArea
+from util.gar_classes import GARExcel, GARSheet, TotalArea, CellArea
 from collections import defaultdict
 
 
@@ -114,17 +114,18 @@ class Gar8005:
             None
         """
         self.logger.info('Writing to excel')
-        wb = xlsxwriter.Workbook(filename=self.output_xls)
+        wb = xlsxwriter.Workbook(filename=self.output_xls, options={'in_memory': True})
         gar_excel = GARExcel(wb=wb)
+        date_now = dt.today().strftime("%B, %Y")
+        datestring = f'Created: {date_now}. GAR ORDER: {self.gar}'
 
         for op_area in [o for o in sorted(self.dict_total_area)]:
             if op_area == '':
-                ws = wb.add_worksheet(name='No Operating Area')
+                worksheet = wb.add_worksheet(name='No Operating Area')
             else:
-                ws = wb.add_worksheet(name=op_area)
+                worksheet = wb.add_worksheet(name=op_area)
 
-            date_now = dt.today().strftime("%B, %Y")
-            datestring = 'Created: {}. GAR ORDER: {}'.format(date_now, self.gar)
+            ws = GARSheet()
             ws.write(0, 0, datestring)
 
             i_row = 1
@@ -169,10 +170,10 @@ class Gar8005:
                 ws.merge_range(i_row, 0, i_row, 11, line, style)
                 ws.set_row(i_row, 15 * num_lines)
 
-            i_col = 12
-            while i_col <= end_col:
-                ws.write(end_row, i_col, None, gar_excel.black_style_top_light_border)
-                i_col += 1
+            end_style = gar_excel.black_style_top_light_border
+            for i_col in range(12, end_col + 1):
+                ws.write_blank(end_row, i_col, end_style)
+            ws.flush(worksheet=worksheet)
 
         wb.close()
 
@@ -313,7 +313,7 @@ class Gar8007:
         self.logger.info("Writing U-8-007 results to Excel")
         self.calculate_targets()
 
-        workbook = xlsxwriter.Workbook(filename=self.output_xls)
+        workbook = xlsxwriter.Workbook(filename=self.output_xls, options={'in_memory': True})
         gar_excel = GARExcel(wb=workbook)
         worksheet = workbook.add_worksheet(name="U-8-007")
 
@@ -413,7 +413,7 @@ class Gar8008:
         self.logger.info("Writing U-8-008 results to Excel")
         self.calculate_targets()
 
-        workbook = xlsxwriter.Workbook(filename=self.output_xls)
+        workbook = xlsxwriter.Workbook(filename=self.output_xls, options={'in_memory': True})
         gar_excel = GARExcel(wb=workbook)
         worksheet = workbook.add_worksheet(name="U-8-008")
 
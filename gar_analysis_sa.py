@@ -9,16 +9,17 @@
 """
 
 # Import libraries
-import gc
-import traceback
 import arcpy
+import hashlib
 import os
+import re
 import sys
 import logging
+import multiprocessing
 
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime as dt, timedelta
-from collections import defaultdict
 
 sys.path.insert(0, r"V:\srm\wml\Workarea\ofedyshy\Projects\Selkirk Biodiversity Project\scripts\github\gar_analysis")
 
@@ -27,6 +28,7 @@ sys.path.insert(1, r'\\spatialfiles2.bcgov\work\FOR\RSI\TOC\Projects\ESRI_Script
 from environment import Environment
 
 from util.gar_classes import GARInput, GARConfig, SICReplacement
+from util.gar_cache import add_to_cache, extract_worker, get_cached, get_or_extract, prune_cache
 from gar.gar_4001 import Gar4001
 from gar.gar_8007 import Gar8007
 from gar.gar_8008 import Gar8008
@@ -41,13 +43,189 @@ from gar.gar_8232 import Gar8232
 from gar.lrmp_sheep import LrmpSheep
 
 
+# BC Albers (EPSG:3005); one instance shared by every geoprocessing call that needs the spatial reference
+SR_BCALBERS = arcpy.SpatialReference(3005)
+
+# Pulls the target percentage out of cell notes such as 'SIC = 30'
+RE_TARGET = re.compile(r"=\s*(\d+)")
+
+# Report name labels of the LRMP analyses
+LRMP_LABEL = {"lrmp-bhs": "Big_Horn_Sheep", "lrmp-ds": "Derenzy_Sheep"}
+
+# ---------------- GAR registry ----------------
+# Per gar: Gar class, cell sql template, cells layer, cell field, aoi, erase and identity layers.
+# Values are GARAnalysis attribute names ("__" names are the private BCGW source layers). The sql templates are
+# formatted with gar (the gar without the -tfl49 suffix) and tag (the gar without the leading "u-").
+UWR_SQL = "UWR_NUMBER = '{gar}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'"
+IDENTITY_FCS = ["fc_bec", "fc_road_dissolve", "fc_vri_clip"]
+ERASE_FCS = ["fc_private_land", "fc_woodlots"]
+
+GAR_REGISTRY = {
+    "u-4-001": {
+        "class": Gar4001, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_uwr_num", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc",
+        "erase_fcs": ERASE_FCS + ["fc_prov_parks", "fc_nat_parks", "fc_crown_grants"],
+        "identity_fcs": IDENTITY_FCS,
+    },
+    # Local __uwr_golden is replaced with the BCGW UWR, so the BCGW cell field is used instead of MGT
+    "u-4-007": {
+        "class": Gar4007, "sql": None, "cells": "__uwr", "cell_field": "fld_uwr_unit", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc",
+        "erase_fcs": ["fc_private_land", "fc_prov_parks", "fc_nat_parks", "fc_xmas_trees"],
+        "identity_fcs": IDENTITY_FCS,
+    },
+    "u-4-010": {
+        "class": Gar4010, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_notes", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc",
+        "erase_fcs": ["fc_private_land", "fc_prov_parks", "fc_nat_parks"],
+        "identity_fcs": IDENTITY_FCS,
+    },
+    "u-8-001": {
+        "class": Gar8001, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_uwr_num", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc", "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+    # AOI is TFL 49, prepared in prepare_data by selecting FOREST_FILE_ID = 'TFL49'
+    "u-8-001-tfl49": {
+        "class": Gar8001, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_uwr_num", "aoi": "fc_tfl49",
+        "private_land": "__private_land_pmbc", "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+    "u-8-005": {
+        "class": Gar8005, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_uwr_num", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc", "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+    "u-8-006": {
+        "class": Gar8006, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_uwr_num", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc", "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+    "u-8-007": {
+        "class": Gar8007, "sql": "UWR_NUMBER = 'u-8-007'", "cells": "__uwr", "cell_field": "fld_uwr_num",
+        "aoi": "fc_aoi_clean", "private_land": None,
+        # The u-8-007 order says U-8-008 takes precedence where they overlap
+        "erase_fcs": ["fc_woodlots", "fc_u8008_overlap"],
+        "identity_fcs": ["fc_vri_clip"],
+    },
+    "u-8-008": {
+        "class": Gar8008, "sql": "UWR_NUMBER = 'u-8-008'", "cells": "__uwr", "cell_field": "fld_uwr_num",
+        "aoi": "fc_aoi_clean", "private_land": None,
+        "erase_fcs": ["fc_woodlots"],
+        "identity_fcs": ["fc_bec", "fc_vri_clip"],
+    },
+    # Uses the BEC label as the cell field
+    "u-8-012": {
+        "class": Gar8012, "sql": UWR_SQL, "cells": "__uwr", "cell_field": "fld_bec", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc", "erase_fcs": ["fc_private_land"], "identity_fcs": IDENTITY_FCS,
+    },
+    # LU name is added to the WHA cells via the identity with fc_lu
+    "u-8-232": {
+        "class": Gar8232, "sql": "TAG = '{tag}' AND ORG_ORGANIZATION_ID IN (4, 8)", "cells": "__wha",
+        "cell_field": "fld_lu", "aoi": "fc_aoi_clean", "private_land": "__private_land_pmbc",
+        "erase_fcs": ERASE_FCS,
+        "identity_fcs": ["fc_lu"] + IDENTITY_FCS,
+    },
+    "lrmp-bhs": {
+        "class": LrmpSheep,
+        "sql": (
+            "STRGC_LAND_RSRCE_PLAN_NAME = 'Okanagan Shuswap Land and Resource Management Plan' "
+            "AND LEGAL_FEAT_OBJECTIVE = 'Big Horn Sheep Areas'"
+        ),
+        "cells": "__lrmp2", "cell_field": "fld_lrmp2", "aoi": "fc_aoi_clean", "private_land": "__private_land_pmbc",
+        "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+    "lrmp-ds": {
+        "class": LrmpSheep,
+        "sql": (
+            "STRGC_LAND_RSRCE_PLAN_NAME = 'Okanagan Shuswap Land and Resource Management Plan' "
+            "AND NON_LEGAL_FEAT_OBJECTIVE = 'Derenzy Bighorn Sheep Habitat RMZ' "
+            "AND NON_LEGAL_FEAT_ATRB_1_VALUE = '2'"
+        ),
+        "cells": "__lrmp", "cell_field": "fld_lrmp", "aoi": "fc_aoi_clean", "private_land": "__private_land_pmbc",
+        "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+    # Local __sec7 is replaced with the BCGW UWR; supply the Golden Sec 7 polygons as the AOI if they are needed
+    "section-7": {
+        "class": Gar8006, "sql": None, "cells": "__uwr", "cell_field": "fld_uwr_unit", "aoi": "fc_aoi_clean",
+        "private_land": "__private_land_pmbc", "erase_fcs": ERASE_FCS, "identity_fcs": IDENTITY_FCS,
+    },
+}
+
+
+# ---------------- GAR inputs ----------------
+# Per input: source layer, optional sql and output, as GARAnalysis attribute names. The sql templates are formatted
+# with last_year and five_years_ago. Mandatory inputs stop the run when they cannot be extracted.
+GAR_INPUTS = {
+    # Fire perimeters (kept, but not mandatory since we dropped burn-severity logic)
+    "fire_perimeters": {"path": "__fire_perimeters", "output": "fc_fire_perimeters"},
+    "fire_perimeters_hist": {
+        "path": "__fire_perimeters_hist", "sql": "FIRE_YEAR = {last_year}", "output": "fc_fire_perimeters_hist",
+    },
+
+    # Core layers
+    "bec": {"path": "__bec", "output": "fc_bec", "mandatory": True},
+    "mot_roads": {"path": "__mot_roads", "output": "fc_mot_roads", "mandatory": True},
+    "ften_roads": {
+        "path": "__ften_roads", "sql": "FILE_TYPE_DESCRIPTION IN('Forest Service Road','Road Permit')",
+        "output": "fc_ften_roads", "mandatory": True,
+    },
+    "private_land": {
+        "path": "__private_land_pmbc",
+        "sql": "OWNER_TYPE NOT IN ('Crown Agency','Crown Provincial','Unclassified','Untitled Provincial')",
+        "output": "fc_private_land", "mandatory": True,
+    },
+
+    # Useful but optional (copied when referenced in erase_fcs/identity_fcs for a given GAR)
+    "woodlots": {"path": "__woodlots", "sql": "LIFE_CYCLE_STATUS_CODE = 'ACTIVE'", "output": "fc_woodlots"},
+    "u8008_overlap": {"path": "__uwr", "sql": "UWR_NUMBER = 'u-8-008'", "output": "fc_u8008_overlap"},
+    "lu": {"path": "__lu", "output": "fc_lu"},
+    "prov_parks": {"path": "__prov_parks", "sql": "PROTECTED_LANDS_CODE <> 'RC'", "output": "fc_prov_parks"},
+    "nat_parks": {"path": "__nat_parks", "output": "fc_nat_parks"},
+    "crown_grants": {"path": "__crown_grants", "output": "fc_crown_grants"},
+    "xmas_trees": {
+        "path": "__xmas_tree_permits", "sql": "LIFE_CYCLE_STATUS_CODE = 'ACTIVE' AND FEATURE_CLASS_SKEY = 489",
+        "output": "fc_xmas_trees",
+    },
+
+    # Recent FTEN blocks (5 years)
+    "recent_ften_blks": {
+        "path": "__ften_blks", "sql": "DISTURBANCE_START_DATE > TO_DATE('{five_years_ago}', 'YYYY-MM-DD')",
+        "output": "fc_recent_ften_blks",
+    },
+
+    # RESULTS reserves (typo fixed vs original extra quote/paren)
+    "results_reserves": {
+        "path": "__results_inv",
+        "sql": (
+            "(SILV_RESERVE_CODE = 'W' OR SILV_RESERVE_OBJECTIVE_CODE = 'WTR') OR "
+            "(STOCKING_STATUS_CODE = 'MAT' AND STOCKING_TYPE_CODE = 'NAT')"
+        ),
+        "output": "fc_results_res",
+    },
+}
+
+
+def has_rows(in_rows):
+    """
+    True if the table, feature class or layer has at least one row. Only the first row is fetched, where
+    GetCount would count them all.
+    """
+    with arcpy.da.SearchCursor(in_rows, ["OID@"]) as s_cursor:
+        return next(iter(s_cursor), None) is not None
+
+
+def exceeds_vertex_limit(in_fc, vertex_limit=10000):
+    """
+    True if any polygon in the feature class has more vertices than the limit; stops at the first one found.
+    """
+    with arcpy.da.SearchCursor(in_fc, ["SHAPE@"]) as s_cursor:
+        return any(row[0] and row[0].pointCount > vertex_limit for row in s_cursor)
+
+
 def run_app():
     """
     Runs the main logic of the tool (BCGW-only, no ConsolidatedCutblock).
     Expects get_input_parameters() to return:
-        gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, logger
+        gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, use_cache, disk_scratch, logger
     """
-    gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, logger = get_input_parameters()
+    gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, use_cache, disk_scratch, logger = get_input_parameters()
 
     analysis = GARAnalysis(
         gar=gar,
@@ -57,7 +235,9 @@ def run_app():
         bcgw_un=b_un,
         bcgw_pw=b_pw,
         logger=logger,
-        aoi=aoi_fc  # NEW: optional AOI for small/fast test runs
+        aoi=aoi_fc,  # NEW: optional AOI for small/fast test runs
+        use_cache=use_cache,
+        disk_scratch=disk_scratch
     )
 
     logger.info(f"Starting GAR analysis: {gar}")
@@ -85,6 +265,9 @@ def run_app():
                 logger.warning(f"Excel export skipped: {e}")
 
     finally:
+        # Release the intermediates held in the memory workspace
+        if not disk_scratch:
+            arcpy.Delete_management("memory")
         # Ensures any connection cleanup in __del__ is executed
         del analysis
 
@@ -95,7 +278,7 @@ def get_input_parameters():
     Sets up parameters and the logger object.
 
     Returns:
-        tuple: (gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, logger)
+        tuple: (gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, use_cache, disk_scratch, logger)
 
     ArcGIS Pro Script Tool parameter order (recommended):
       0 gar        (String)
@@ -135,7 +318,7 @@ def get_input_parameters():
             _a.log_dir   = log_dir
             logger = Environment.setup_logger(_a)
 
-            return gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, logger
+            return gar, out_gdb, out_fld, bec, aoi_fc, b_un, b_pw, True, False, logger
 
         # --- CLI mode ---
         parser = ArgumentParser(
@@ -152,11 +335,16 @@ def get_input_parameters():
         parser.add_argument("--log_level", default="INFO",
                             choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Log level")
         parser.add_argument("--log_dir", help="Path to log directory")
+        parser.add_argument("--no-cache", dest="no_cache", action="store_true",
+                            help="Always re-extract the BCGW inputs instead of reusing cached extracts")
+        parser.add_argument("--disk-scratch", dest="disk_scratch", action="store_true",
+                            help="Write the overlay intermediates to the scratch gdb instead of memory")
 
         args = parser.parse_args()
         logger = Environment.setup_logger(args)
 
-        return args.gar, args.out_gdb, args.out_fld, args.bec, args.aoi_fc, args.b_un, args.b_pw, logger
+        return (args.gar, args.out_gdb, args.out_fld, args.bec, args.aoi_fc, args.b_un, args.b_pw,
+                not args.no_cache, args.disk_scratch, logger)
 
     except Exception as e:
         logging.error(f"Unexpected exception. Program terminating: {str(e)}")
@@ -169,7 +357,8 @@ class GARAnalysis:
     GAR Analysis class containing methods for running the gar analysis
     """
 
-    def __init__(self, gar, output_gdb, output_folder, bcgw_un, bcgw_pw, bec, logger, aoi=None):
+    def __init__(self, gar, output_gdb, output_folder, bcgw_un, bcgw_pw, bec, logger, aoi=None, use_cache=True,
+                 disk_scratch=False):
         """
         Initializes the GARAnalysis class and all its attributes
 
@@ -182,30 +371,28 @@ class GARAnalysis:
             bec (str): the BEC type to run in the analysis (use 'CURRENT' for BCGW-only)
             logger (logger): logger object
             aoi (str|None): optional AOI polygon feature class/layer to limit processing
+            use_cache (bool): reuse extracts of the BCGW inputs cached by earlier runs over the same cells
+            disk_scratch (bool): keep the overlay intermediates in the scratch gdb rather than the memory workspace
         """
         arcpy.env.overwriteOutput = True
+        # All BCGW sources are in BC Albers; fixing the output system keeps every overlay planar in 3005
+        arcpy.env.outputCoordinateSystem = SR_BCALBERS
 
         # Inputs & paths
+        # One timestamp for the whole run so the report name, year and dated sql always agree
+        self.run_date = dt.now()
         self.gar = gar
         self.output_gdb = output_gdb
-        self.output_fd = os.path.join(self.output_gdb, self.gar.replace('-', ''))
+        self.gar_flat = self.gar.replace('-', '')
+        self.output_fd = os.path.join(self.output_gdb, self.gar_flat)
         self.output_folder = os.path.join(output_folder, self.gar.replace('-', '_'))
 
-        if self.gar in ['lrmp-bhs', 'lrmp-ds']:
-            self.output_xls = os.path.join(
-                self.output_folder,
-                'Report_LRMP_{0}_{1}_{2}_{3}.xlsx'.format(
-                    self.gar.replace('lrmp-bhs', 'Big_Horn_Sheep').replace('lrmp-ds', 'Derenzy_Sheep'),
-                    dt.now().year, dt.now().month, dt.now().day
-                )
-            )
+        report_date = f"{self.run_date.year}_{self.run_date.month}_{self.run_date.day}"
+        if self.gar in LRMP_LABEL:
+            report_name = f"Report_LRMP_{LRMP_LABEL[self.gar]}_{report_date}.xlsx"
         else:
-            self.output_xls = os.path.join(
-                self.output_folder,
-                'Report_GAR_{0}_{1}_{2}_{3}.xlsx'.format(
-                    self.gar.replace('-', ''), dt.now().year, dt.now().month, dt.now().day
-                )
-            )
+            report_name = f"Report_GAR_{self.gar_flat}_{report_date}.xlsx"
+        self.output_xls = os.path.join(self.output_folder, report_name)
 
         self.bcgw_un = bcgw_un
         self.bcgw_pw = bcgw_pw
@@ -213,9 +400,21 @@ class GARAnalysis:
         self.logger = logger
         self.aoi = aoi  # NEW: optional AOI
         self.scratch_gdb = os.path.join(os.path.dirname(self.output_gdb), 'GAR_Scratch.gdb')
+        self.use_cache = use_cache
+        self.disk_scratch = disk_scratch
+        # Short-lived overlay intermediates fit in RAM for AOI sized runs; very large runs can keep them on disk
+        self.scratch_ws = self.scratch_gdb if disk_scratch else "memory"
+        self.cache_gdb = os.path.join(os.path.dirname(self.output_gdb), 'GAR_Cache.gdb')
+        self.cache_ttl_days = 1
         self.sde_folder = output_folder
-        self.cur_year = dt.now().year
+        self.cur_year = self.run_date.year
         self.gar_class = None
+        self.dict_identity_src = {}  # identity layer -> diced copy made in prepare_data
+        self.set_identity_simple = set()  # identity layers (or their diced copies) with no polygon over the vertex limit
+
+        # Fail before the BCGW connection and geodatabase setup when the gar has no registry entry
+        if self.gar not in GAR_REGISTRY:
+            raise ValueError(f"Unknown gar '{self.gar}'; expected one of: {', '.join(GAR_REGISTRY)}")
 
         self.logger.info('Running analysis on {0}'.format(self.gar))
 
@@ -238,7 +437,7 @@ class GARAnalysis:
             arcpy.CreateFeatureDataset_management(
                 out_dataset_path=os.path.dirname(self.output_fd),
                 out_name=os.path.basename(self.output_fd),
-                spatial_reference=arcpy.SpatialReference(3005)
+                spatial_reference=SR_BCALBERS
             )
 
         if not arcpy.Exists(self.scratch_gdb):
@@ -247,6 +446,14 @@ class GARAnalysis:
                 out_name=os.path.basename(self.scratch_gdb)
             )
 
+        if self.use_cache:
+            if not arcpy.Exists(self.cache_gdb):
+                arcpy.CreateFileGDB_management(
+                    out_folder_path=os.path.dirname(self.cache_gdb),
+                    out_name=os.path.basename(self.cache_gdb)
+                )
+            prune_cache(cache_gdb=self.cache_gdb, ttl_days=self.cache_ttl_days, logger=self.logger)
+
         if not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder)
 
@@ -306,13 +513,12 @@ class GARAnalysis:
         self.fc_tfl49 = os.path.join(self.scratch_gdb, 'tfl49')
 
         # Selected cells (UWR/WHA/LRMP) and working copies
-        self.fc_gar_cells        = os.path.join(self.output_fd, f"{self.gar.replace('-', '')}_UWR")
+        self.fc_gar_cells        = os.path.join(self.output_fd, f"{self.gar_flat}_UWR")
         self.fc_gar_cells_erase  = os.path.join(self.scratch_gdb, 'gar_cells_erase')
         self.fc_u8008_overlap = os.path.join(self.scratch_gdb, 'u8008_overlap') # the u-8007 order says U-8-008 takes precedence here
 
         # BCGW layers clipped to AOI/cells
         self.fc_lu               = os.path.join(self.scratch_gdb, 'lu')
-        self.fc_vri              = os.path.join(self.scratch_gdb, 'vri')
         self.fc_vri_clip         = os.path.join(self.scratch_gdb, 'vri_clip')
         self.fc_fire_perimeters  = os.path.join(self.scratch_gdb, 'fire_perimeters')
         self.fc_fire_perimeters_hist = os.path.join(self.scratch_gdb, 'fire_perimeters_hist')
@@ -327,17 +533,17 @@ class GARAnalysis:
         self.fc_xmas_trees       = os.path.join(self.scratch_gdb, 'xmas_trees')
 
         # Combine/remove features, roads, identity chain
-        self.fc_erase_features   = os.path.join(self.scratch_gdb, 'erase_features')
+        self.fc_erase_features   = os.path.join(self.scratch_ws, 'erase_features')
         self.fc_road_merge       = os.path.join(self.scratch_gdb, 'road_merge')
-        self.fc_road_buffer      = os.path.join(self.scratch_gdb, 'road_buffer')
-        self.fc_road_dissolve    = os.path.join(self.scratch_gdb, 'road_dissolve')
-        self.fc_gar_cells_identity = os.path.join(self.scratch_gdb, 'gar_identity')
-        self.fc_gar_cells_single = os.path.join(self.scratch_gdb, 'gar_single')
+        self.fc_road_buffer      = os.path.join(self.scratch_ws, 'road_buffer')
+        self.fc_road_dissolve    = os.path.join(self.scratch_ws, 'road_dissolve')
+        self.fc_gar_cells_identity = os.path.join(self.scratch_ws, 'gar_identity')
+        self.fc_gar_cells_single = os.path.join(self.scratch_ws, 'gar_single')
 
         # Results
-        self.fc_resultant           = os.path.join(self.output_fd, f"{self.gar.replace('-', '')}_Resultant")
+        self.fc_resultant           = os.path.join(self.output_fd, f"{self.gar_flat}_Resultant")
         self.fc_resultant_dissolve  = f"{self.fc_resultant}_Dissolve"
-        self.fc_resultant_rank      = os.path.join(self.output_fd, f"{self.gar.replace('-', '')}_Resultant_Rank")
+        self.fc_resultant_rank      = os.path.join(self.output_fd, f"{self.gar_flat}_Resultant_Rank")
 
         # Optional/derived subsets (still BCGW-based)
         self.fc_recent_ften_blks = os.path.join(self.scratch_gdb, 'recent_ften_blks')
@@ -346,98 +552,20 @@ class GARAnalysis:
 
 
 
-        # Dictionary of all inputs required for this analysis including selection criteria for creating a subset
-        # Dictionary of inputs (BCGW-only) with optional SQL filters
+        # Dictionary of all inputs required for this analysis including selection criteria for creating a subset,
+        # built from the GAR_INPUTS table
+        dict_sql_values = {
+            "last_year": self.cur_year - 1,
+            "five_years_ago": (self.run_date - timedelta(days=5*365)).strftime('%Y-%m-%d'),
+        }
         self.dict_gar_inputs = {
-            # Fire perimeters (kept, but not mandatory since we dropped burn-severity logic)
-            'fire_perimeters': GARInput(
-                path=self.__fire_perimeters,
-                output=self.fc_fire_perimeters
-            ),
-            'fire_perimeters_hist': GARInput(
-                path=self.__fire_perimeters_hist,
-                sql='FIRE_YEAR = {0}'.format(dt.now().year - 1),
-                output=self.fc_fire_perimeters_hist
-            ),
-
-            # Core layers
-            'bec': GARInput(
-                path=self.__bec,
-                output=self.fc_bec,
-                mandatory=True
-            ),
-            'mot_roads': GARInput(
-                path=self.__mot_roads,
-                output=self.fc_mot_roads,
-                mandatory=True
-            ),
-            'ften_roads': GARInput(
-                path=self.__ften_roads,
-                sql="FILE_TYPE_DESCRIPTION IN('Forest Service Road','Road Permit')",
-                output=self.fc_ften_roads,
-                mandatory=True
-            ),
-            'private_land': GARInput(
-                path=self.__private_land_pmbc,
-                sql=(
-                    "OWNER_TYPE NOT IN ('Crown Agency','Crown Provincial','Unclassified','Untitled Provincial')"
-                ),
-                output=self.fc_private_land,
-                mandatory=True
-            ),
-
-            # Useful but optional (copied when referenced in erase_fcs/identity_fcs for a given GAR)
-            'woodlots': GARInput(
-                path=self.__woodlots,
-                sql="LIFE_CYCLE_STATUS_CODE = 'ACTIVE'",
-                output=self.fc_woodlots
-            ),
-            'u8008_overlap': GARInput(
-                path=self.__uwr,
-                sql="UWR_NUMBER = 'u-8-008'",
-                output=self.fc_u8008_overlap
-            ),
-            'lu': GARInput(
-                path=self.__lu,
-                output=self.fc_lu
-            ),
-            'prov_parks': GARInput(
-                path=self.__prov_parks,
-                sql="PROTECTED_LANDS_CODE <> 'RC'",
-                output=self.fc_prov_parks
-            ),
-            'nat_parks': GARInput(
-                path=self.__nat_parks,
-                output=self.fc_nat_parks
-            ),
-            'crown_grants': GARInput(
-                path=self.__crown_grants,
-                output=self.fc_crown_grants
-            ),
-            'xmas_trees': GARInput(
-                path=self.__xmas_tree_permits,
-                sql="LIFE_CYCLE_STATUS_CODE = 'ACTIVE' AND FEATURE_CLASS_SKEY = 489",
-                output=self.fc_xmas_trees
-            ),
-
-            # Recent FTEN blocks (5 years)
-            'recent_ften_blks': GARInput(
-                path=self.__ften_blks,
-                sql="DISTURBANCE_START_DATE > TIMESTAMP '{0}'".format(
-                    (dt.now() - timedelta(days=5*365)).strftime('%Y-%m-%d %H:%M:%S')
-                ),
-                output=self.fc_recent_ften_blks
-            ),
-
-            # RESULTS reserves (typo fixed vs original extra quote/paren)
-            'results_reserves': GARInput(
-                path=self.__results_inv,
-                sql=(
-                    "(SILV_RESERVE_CODE = 'W' OR SILV_RESERVE_OBJECTIVE_CODE = 'WTR') OR "
-                    "(STOCKING_STATUS_CODE = 'MAT' AND STOCKING_TYPE_CODE = 'NAT')"
-                ),
-                output=self.fc_results_res
-            ),
+            name: GARInput(
+                path=self.resolve(dict_input["path"]),
+                sql=dict_input["sql"].format(**dict_sql_values) if dict_input.get("sql") else None,
+                output=self.resolve(dict_input["output"]),
+                mandatory=dict_input.get("mandatory", False)
+            )
+            for name, dict_input in GAR_INPUTS.items()
         }
 
 
@@ -483,6 +611,7 @@ class GARAnalysis:
         self.fld_bclcs_2 = 'BCLCS_LEVEL_2'
         self.fld_open_ind = 'OPENING_IND'
         self.fld_uwr_num = 'Name' if self.gar == 'section-7' else ('MGT' if self.gar == 'u-4-007' else 'UWR_UNIT_NUMBER')
+        self.fld_uwr_unit = 'UWR_UNIT_NUMBER'  # BCGW UWR cell field for gars whose local cell field is not in BCGW
         self.fld_bec_zone = 'BEC_ZONE_CODE'
         self.fld_bec_subzone = 'BEC_SUBZONE'
         self.fld_bec_variant = 'BEC_VARIANT'
@@ -505,336 +634,37 @@ class GARAnalysis:
 
         #--------------------------------------------------------------------------------------------------------------------------------------------------
 
-        # Set up the analysis configuration using the GarConfig class based on the input gar analysis to be run
-        # Creates the applicable Gar class based on the selected gar
-        if self.gar == 'u-4-001':
-            gar_config = GARConfig(
-                sql=f"UWR_NUMBER = '{self.gar}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'",
-                cells=self.__uwr,
-                cell_field=self.fld_uwr_num,
-                aoi=self.fc_aoi_clean,  # was fc_toc_area (BCTS boundary); now your AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,   # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,       # ACTIVE woodlots
-                    self.fc_prov_parks,     # provincial parks (excluding RC)
-                    self.fc_nat_parks,      # national parks
-                    self.fc_crown_grants    # ILRR Crown Grants
-                ],
-                identity_fcs=[
-                    self.fc_bec,            # BEC (BCGW CURRENT)
-                    self.fc_road_dissolve,  # buffered/dissolved road ROWs
-                    self.fc_vri_clip        # VRI clipped to AOI/cells
-                ]
-            )
-            self.gar_class = Gar4001(
-                gar=self.gar,
-                output_xls=self.output_xls,
-                logger=self.logger,
-                gar_config=gar_config
-            )
-
-        elif self.gar == 'u-4-007':
-            # NOTE: __uwr_golden (local) is replaced with BCGW UWR,
-            # and the cell_field must be a BCGW field (e.g., UWR_UNIT_NUMBER).
-            gar_config = GARConfig(
-                cells=self.__uwr,                  # BCGW: WHSE_WILDLIFE_MANAGEMENT.WCP_UNGULATE_WINTER_RANGE_SP
-                cell_field='UWR_UNIT_NUMBER',      # override; don't use the old 'MGT' field (local-only)
-                aoi=self.fc_aoi_clean,             # your user-supplied AOI instead of fc_toc_area (BCTS boundary)
-                private_land=self.__private_land_pmbc,
-
-                # Keep erase list strictly BCGW-based
-                erase_fcs=[
-                    self.fc_private_land,          # PMBC parcels (non-Crown etc.)
-                    self.fc_prov_parks,
-                    self.fc_nat_parks,
-                    self.fc_xmas_trees
-                ],
-
-                # Keep identity chain lean and BCGW-only
-                identity_fcs=[
-                    self.fc_bec,                   # BEC (CURRENT)
-                    self.fc_road_dissolve,         # buffered/dissolved road ROWs
-                    self.fc_vri_clip               # VRI clipped to AOI/cells
-                ]
-            )
-            self.gar_class = Gar4007(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-
-        elif self.gar == 'u-4-010':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = '{}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'".format(self.gar),
-                cells=self.__uwr,                 # BCGW UWR source
-                cell_field=self.fld_notes,        # FEATURE_NOTES (as in your original)
-                aoi=self.fc_aoi_clean,            # was fc_toc_area (BCTS); now your AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,
-                    self.fc_prov_parks,
-                    self.fc_nat_parks,
-                ],
-                identity_fcs=[
-                    self.fc_bec,
-                    self.fc_road_dissolve,
-                    self.fc_vri_clip,
-                ],
-            )
-            self.gar_class = Gar4010(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-
-        elif self.gar == 'u-8-001':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = '{}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'".format(self.gar.replace('-tfl49', '')),
-                cells=self.__uwr,                 # BCGW UWR source
-                cell_field=self.fld_uwr_num,      # typically 'UWR_UNIT_NUMBER' for BCGW
-                aoi=self.fc_aoi_clean,            # replace fc_toc_area with your small user AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,         # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,             # ACTIVE woodlots
-                ],
-                identity_fcs=[
-                    self.fc_bec,                  # BEC (CURRENT)
-                    self.fc_road_dissolve,        # buffered/dissolved road ROWs
-                    self.fc_vri_clip,             # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = Gar8001(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-
-        elif self.gar == 'u-8-001-tfl49':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = '{}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'".format(self.gar.replace('-tfl49', '')),
-                cells=self.__uwr,                 # BCGW UWR source
-                cell_field=self.fld_uwr_num,      # typically 'UWR_UNIT_NUMBER' for BCGW
-                aoi=self.fc_tfl49,                # AOI is TFL 49 (prepare in prepare_data by selecting FOREST_FILE_ID='TFL49')
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,         # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,             # ACTIVE woodlots
-                ],
-                identity_fcs=[
-                    self.fc_bec,                  # BEC (CURRENT)
-                    self.fc_road_dissolve,        # buffered/dissolved road ROWs
-                    self.fc_vri_clip,             # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = Gar8001(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-        elif self.gar == 'u-8-005':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = '{}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'".format(self.gar),
-                cells=self.__uwr,                 # BCGW UWR source
-                cell_field=self.fld_uwr_num,      # typically 'UWR_UNIT_NUMBER' for BCGW
-                aoi=self.fc_aoi_clean,            # replace fc_toc_area with your AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,         # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,             # ACTIVE woodlots
-                ],
-                identity_fcs=[
-                    self.fc_bec,                  # BEC (CURRENT)
-                    self.fc_road_dissolve,        # buffered/dissolved road ROWs
-                    self.fc_vri_clip,             # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = Gar8005(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-
-        elif self.gar == 'u-8-006':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = '{}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'".format(self.gar),
-                cells=self.__uwr,                 # BCGW UWR source
-                cell_field=self.fld_uwr_num,      # typically 'UWR_UNIT_NUMBER' in BCGW
-                aoi=self.fc_aoi_clean,            # replace fc_toc_area with your user AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,         # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,             # ACTIVE woodlots
-                ],
-                identity_fcs=[
-                    self.fc_bec,                  # BEC (CURRENT)
-                    self.fc_road_dissolve,        # buffered/dissolved road ROWs
-                    self.fc_vri_clip,             # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = Gar8006(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-        elif self.gar == 'u-8-007':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = 'u-8-007'",
-                cells=self.__uwr,
-                cell_field=self.fld_uwr_num,
-                aoi=self.fc_aoi_clean,
-                erase_fcs=[
-                    self.fc_woodlots,
-                    self.fc_u8008_overlap,
-                ],
-                identity_fcs=[
-                    self.fc_vri_clip,
-                ],
-            )
-
-            self.gar_class = Gar8007(
-                gar=self.gar,
-                output_xls=self.output_xls,
-                logger=self.logger,
-                gar_config=gar_config,
-            )
-
-        elif self.gar == 'u-8-008':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = 'u-8-008'",
-                cells=self.__uwr,
-                cell_field=self.fld_uwr_num,
-                aoi=self.fc_aoi_clean,
-                erase_fcs=[
-                    self.fc_woodlots,
-                ],
-                identity_fcs=[
-                    self.fc_bec,
-                    self.fc_vri_clip,
-                ],
-            )
-
-            self.gar_class = Gar8008(
-                gar=self.gar,
-                output_xls=self.output_xls,
-                logger=self.logger,
-                gar_config=gar_config,
-            )
-
-        elif self.gar == 'u-8-012':
-            gar_config = GARConfig(
-                sql="UWR_NUMBER = '{}' AND FEATURE_NOTES NOT LIKE '%SIC = 0%'".format(self.gar),
-                cells=self.__uwr,                 # BCGW UWR source
-                cell_field=self.fld_bec,          # uses BEC label (e.g., BGC_LABEL) as in your original
-                aoi=self.fc_aoi_clean,            # replace fc_toc_area with your AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,         # PMBC parcels (non-Crown etc.)
-                ],
-                identity_fcs=[
-                    self.fc_bec,                  # BEC (CURRENT)
-                    self.fc_road_dissolve,        # buffered/dissolved road ROWs
-                    self.fc_vri_clip,             # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = Gar8012(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-
-        elif self.gar == 'u-8-232':
-            gar_config = GARConfig(
-                sql="TAG = '{}' AND ORG_ORGANIZATION_ID IN (4, 8)".format(self.gar[2:]),
-                cells=self.__wha,                 # BCGW: WHSE_WILDLIFE_MANAGEMENT.WCP_WILDLIFE_HABITAT_AREA_POLY
-                cell_field=self.fld_lu,           # LU name will be added via identity with fc_lu
-                aoi=self.fc_aoi_clean,            # replace fc_op_areas (LRM) with your AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,
-                    self.fc_woodlots,
-                    # If you later want a federal mask, we can add a PMBC-based subset back in.
-                ],
-                identity_fcs=[
-                    self.fc_lu,                   # brings LANDSCAPE_UNIT_NAME onto the features
-                    self.fc_bec,
-                    self.fc_road_dissolve,
-                    self.fc_vri_clip,
-                ],
-            )
-            self.gar_class = Gar8232(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-
-
-        elif self.gar == 'lrmp-bhs':
-            gar_config = GARConfig(
-                sql=(
-                    "STRGC_LAND_RSRCE_PLAN_NAME = 'Okanagan Shuswap Land and Resource Management Plan' "
-                    "AND LEGAL_FEAT_OBJECTIVE = 'Big Horn Sheep Areas'"
-                ),
-                cells=self.__lrmp2,             # BCGW: RMP_PLAN_LEGAL_POLY_SVW
-                cell_field=self.fld_lrmp2,      # typically 'LEGAL_FEAT_PROVID'
-                aoi=self.fc_aoi_clean,          # use user AOI instead of BCTS boundary
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,       # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,           # ACTIVE woodlots
-                ],
-                identity_fcs=[
-                    self.fc_bec,                # BEC (CURRENT)
-                    self.fc_road_dissolve,      # buffered/dissolved road ROWs
-                    self.fc_vri_clip,           # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = LrmpSheep(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
+        # Set up the analysis configuration and the applicable Gar class from the registry entry of the gar
+        self.gar_class = self.create_gar_class(GAR_REGISTRY[self.gar])
+        #--------------------------------------------------------------------------------------------------------------------------------------------------
 
 
-        elif self.gar == 'lrmp-ds':
-            gar_config = GARConfig(
-                sql=(
-                    "STRGC_LAND_RSRCE_PLAN_NAME = 'Okanagan Shuswap Land and Resource Management Plan' "
-                    "AND NON_LEGAL_FEAT_OBJECTIVE = 'Derenzy Bighorn Sheep Habitat RMZ' "
-                    "AND NON_LEGAL_FEAT_ATRB_1_VALUE = '2'"
-                ),
-                cells=self.__lrmp,            # BCGW: RMP_PLAN_NON_LEGAL_POLY_SVW
-                cell_field=self.fld_lrmp,     # typically 'NON_LEGAL_FEAT_PROVID'
-                aoi=self.fc_aoi_clean,        # replace fc_toc_area with user AOI
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,
-                    self.fc_woodlots,
-                ],
-                identity_fcs=[
-                    self.fc_bec,
-                    self.fc_road_dissolve,
-                    self.fc_vri_clip,
-                ],
-            )
-            self.gar_class = LrmpSheep(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
+    def resolve(self, name):
+        """
+        Returns the value of a GARAnalysis attribute named in GAR_REGISTRY or GAR_INPUTS.
+        """
+        # Private source layers are name mangled on the class
+        return getattr(self, f"_GARAnalysis{name}" if name.startswith("__") else name)
 
-            
-        elif self.gar == 'section-7':
-            # NOTE: Replaces local __sec7 with BCGW UWR. If you specifically need the Golden Sec 7 polygons,
-            # supply them as the AOI (fc_aoi_clean) or provide a BCGW-accessible equivalent.
-            gar_config = GARConfig(
-                cells=self.__uwr,                 # BCGW: WCP_UNGULATE_WINTER_RANGE_SP
-                cell_field='UWR_UNIT_NUMBER',     # override; the old 'Name' field was from the local dataset
-                aoi=self.fc_aoi_clean,            # use your user-provided AOI instead of fc_toc_area
-                private_land=self.__private_land_pmbc,
-                erase_fcs=[
-                    self.fc_private_land,         # PMBC parcels (non-Crown etc.)
-                    self.fc_woodlots,             # ACTIVE woodlots
-                ],
-                identity_fcs=[
-                    self.fc_bec,                  # BEC (CURRENT)
-                    self.fc_road_dissolve,        # buffered/dissolved road ROWs
-                    self.fc_vri_clip,             # VRI clipped to AOI/cells
-                ],
-            )
-            self.gar_class = Gar8006(
-                gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config
-            )
-        #--------------------------------------------------------------------------------------------------------------------------------------------------
 
+    def create_gar_class(self, dict_gar):
+        """
+        Builds the GARConfig for the gar from its GAR_REGISTRY entry and creates the Gar class object.
+        """
+        resolve = self.resolve
+        sql = dict_gar["sql"]
+        if sql:
+            sql = sql.format(gar=self.gar.replace("-tfl49", ""), tag=self.gar[2:])
+        gar_config = GARConfig(
+            sql=sql,
+            cells=resolve(dict_gar["cells"]),
+            cell_field=resolve(dict_gar["cell_field"]),
+            aoi=resolve(dict_gar["aoi"]),
+            private_land=resolve(dict_gar["private_land"]) if dict_gar["private_land"] else None,
+            erase_fcs=[resolve(fc) for fc in dict_gar["erase_fcs"]],
+            identity_fcs=[resolve(fc) for fc in dict_gar["identity_fcs"]],
+        )
+        return dict_gar["class"](gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config)
 
 
     def __del__(self):
@@ -867,6 +697,9 @@ class GARAnalysis:
         layers for identity/erase. Uses a small user AOI (or TFL49 for the
         -tfl49 variant) to keep runs fast.
         """
+        # Let the pairwise overlay tools use every core
+        arcpy.env.parallelProcessingFactor = "100%"
+
         # ---------------- AOI ----------------
         aoi_fc = None
         try:
@@ -888,7 +721,7 @@ class GARAnalysis:
                         if getattr(sr, "factoryCode", None) == 3005:
                             arcpy.CopyFeatures_management(self.aoi, self.fc_aoi_clean)
                         else:
-                            arcpy.Project_management(self.aoi, self.fc_aoi_clean, arcpy.SpatialReference(3005))
+                            arcpy.Project_management(self.aoi, self.fc_aoi_clean, SR_BCALBERS)
                     except Exception:
                         # Fallback: try a straight copy
                         arcpy.CopyFeatures_management(self.aoi, self.fc_aoi_clean)
@@ -913,6 +746,8 @@ class GARAnalysis:
             where_clause=self.gar_class.gar_config.sql
         )
         if aoi_fc and arcpy.Exists(aoi_fc):
+            # Bounding box pre-filter: only cells passing through the AOI extent reach the location select
+            arcpy.env.extent = arcpy.Describe(aoi_fc).extent
             aoi_lyr = arcpy.MakeFeatureLayer_management(aoi_fc, "aoi_lyr")
             arcpy.SelectLayerByLocation_management(in_layer=gar_lyr, overlap_type="INTERSECT", select_features=aoi_lyr)
             arcpy.Delete_management(aoi_lyr)
@@ -921,7 +756,7 @@ class GARAnalysis:
         arcpy.Delete_management(gar_lyr)
 
         # Ensure we actually have cells
-        if int(arcpy.GetCount_management(self.fc_gar_cells).getOutput(0)) == 0:
+        if not has_rows(self.fc_gar_cells):
             raise RuntimeError("No GAR cells found inside the AOI. Check your AOI and GAR selection parameters.")
 
         # Merge/clean cells if that GAR needs it (keeps behavior of original)
@@ -931,31 +766,62 @@ class GARAnalysis:
         self.logger.info("Setting processing extent to GAR cells.")
         arcpy.env.extent = arcpy.Describe(self.fc_gar_cells).extent
 
+        # Cached extracts are keyed by the gar and the cell geometry, so a rerun over the same AOI reuses them
+        key_suffix = None
+        if self.use_cache:
+            cells_hash = hashlib.sha1()
+            with arcpy.da.SearchCursor(self.fc_gar_cells, ["SHAPE@WKB"]) as s_cursor:
+                for row in s_cursor:
+                    cells_hash.update(bytes(row[0] or b""))
+            key_suffix = f"{self.gar}|{cells_hash.hexdigest()}"
+
         # ---------------- VRI subset + clip ----------------
-        self.logger.info("Subsetting VRI by GAR cells.")
-        gar_lyr = arcpy.MakeFeatureLayer_management(self.fc_gar_cells, "gar_lyr_for_vri")
-        vri_lyr = arcpy.MakeFeatureLayer_management(self.__vri, "vri_lyr")
-        arcpy.SelectLayerByLocation_management(in_layer=vri_lyr, overlap_type="INTERSECT", select_features=gar_lyr)
-        arcpy.CopyFeatures_management(in_features=vri_lyr, out_feature_class=self.fc_vri)
-        arcpy.Delete_management(vri_lyr)
-        arcpy.Delete_management(gar_lyr)
+        # The clip is cached like the other inputs; it is usually the largest BCGW read of the run
+        gi_vri = GARInput(path=self.__vri, output=self.fc_vri_clip)
+        vri_key = f"{key_suffix}|clip"
+        cached_fc = get_cached(gar_input=gi_vri, cache_gdb=self.cache_gdb, key_suffix=vri_key,
+                               ttl_days=self.cache_ttl_days) if self.use_cache else None
+        if cached_fc:
+            self.logger.info("Copying VRI clip from cache.")
+            arcpy.CopyFeatures_management(in_features=cached_fc, out_feature_class=self.fc_vri_clip)
+        else:
+            self.logger.info("Subsetting VRI by GAR cells.")
+            gar_lyr = arcpy.MakeFeatureLayer_management(self.fc_gar_cells, "gar_lyr_for_vri")
+            vri_lyr = arcpy.MakeFeatureLayer_management(self.__vri, "vri_lyr")
+            arcpy.SelectLayerByLocation_management(in_layer=vri_lyr, overlap_type="INTERSECT", select_features=gar_lyr)
 
-        self.logger.info("Clipping VRI to GAR cells.")
-        arcpy.Clip_analysis(in_features=self.fc_vri, clip_features=self.fc_gar_cells, out_feature_class=self.fc_vri_clip)
+            # Clip the selected layer directly; the selection is only needed as the clip input, so it is not copied
+            self.logger.info("Clipping VRI to GAR cells.")
+            try:
+                arcpy.analysis.PairwiseClip(in_features=vri_lyr, clip_features=self.fc_gar_cells,
+                                            out_feature_class=self.fc_vri_clip)
+            except Exception:
+                arcpy.Clip_analysis(in_features=vri_lyr, clip_features=self.fc_gar_cells,
+                                    out_feature_class=self.fc_vri_clip)
+            arcpy.Delete_management(vri_lyr)
+            arcpy.Delete_management(gar_lyr)
+            if self.use_cache:
+                add_to_cache(gar_input=gi_vri, cache_gdb=self.cache_gdb, key_suffix=vri_key,
+                             ttl_days=self.cache_ttl_days)
 
         # ---------------- Copy other required inputs (BCGW-only) ----------------
         self.logger.info("Preparing additional BCGW inputs as required by the GAR config.")
         gar_lyr = arcpy.MakeFeatureLayer_management(self.fc_gar_cells, "gar_lyr_for_inputs")
+        lst_extract = []
         for key, gi in self.dict_gar_inputs.items():
             # Only copy when needed for the current run
             if key.startswith("private_land") and gi.path != self.gar_class.gar_config.private_land:
                 continue
             if gi.mandatory or gi.output in self.gar_class.gar_config.erase_fcs or gi.output in self.gar_class.gar_config.identity_fcs:
-                self.logger.info(f"  - Copying {key}")
-                input_lyr = arcpy.MakeFeatureLayer_management(in_features=gi.path, out_layer="input_lyr", where_clause=gi.sql)
-                arcpy.SelectLayerByLocation_management(in_layer=input_lyr, overlap_type="INTERSECT", select_features=gar_lyr)
-                arcpy.CopyFeatures_management(in_features=input_lyr, out_feature_class=gi.output)
-                arcpy.Delete_management(input_lyr)
+                cached_fc = get_cached(gar_input=gi, cache_gdb=self.cache_gdb, key_suffix=key_suffix,
+                                       ttl_days=self.cache_ttl_days) if self.use_cache else None
+                if cached_fc:
+                    self.logger.info(f"  - Copying {key} from cache")
+                    arcpy.CopyFeatures_management(in_features=cached_fc, out_feature_class=gi.output)
+                else:
+                    lst_extract.append(key)
+
+        self.extract_inputs(lst_extract=lst_extract, select_features=gar_lyr, key_suffix=key_suffix)
         arcpy.Delete_management(gar_lyr)
 
         # ---------------- Erase masks ----------------
@@ -964,205 +830,267 @@ class GARAnalysis:
         for fc in self.gar_class.gar_config.erase_fcs:
             if arcpy.Exists(fc):
                 try:
-                    if int(arcpy.GetCount_management(fc).getOutput(0)) > 0:
+                    if has_rows(fc):
                         erase_inputs.append(fc)
                 except Exception:
                     pass
 
         if erase_inputs:
             self.logger.info("Combining erase features.")
-            arcpy.Merge_management(inputs=erase_inputs, output=self.fc_erase_features)
+            erase_merge = os.path.join("memory", "erase_merge")
+            arcpy.Merge_management(inputs=erase_inputs, output=erase_merge)
 
+            # Parcels, parks and woodlots overlap and arrive as multipart polygons; dissolve them into single part
+            # masks so the erase indexes each area once and tests only the parts near each cell
+            try:
+                arcpy.analysis.PairwiseDissolve(in_features=erase_merge, out_feature_class=self.fc_erase_features,
+                                                multi_part="SINGLE_PART")
+            except Exception:
+                self.logger.warning("PairwiseDissolve of erase features failed; erasing with the merged features.")
+                arcpy.CopyFeatures_management(erase_merge, self.fc_erase_features)
+            arcpy.Delete_management(erase_merge)
+
+            # Parks and private land parcels can be very large; dice them so the erase tests smaller pieces
+            erase_features = self.fc_erase_features
+            if exceeds_vertex_limit(erase_features):
+                self.logger.info("Erase features have polygons over 10000 vertices; dicing.")
+                erase_features = os.path.join(self.scratch_gdb, "erase_dice")
+                arcpy.Dice_management(in_features=self.fc_erase_features, out_feature_class=erase_features,
+                                      vertex_limit=10000)
+
+            # PairwiseErase indexes the erase features and runs across all cores, so each cell is only tested
+            # against the erase polygons near it
             self.logger.info("Erasing features from GAR cells.")
-            arcpy.Erase_analysis(
-                in_features=self.fc_gar_cells,
-                erase_features=self.fc_erase_features,
-                out_feature_class=self.fc_gar_cells_erase
-            )
+            try:
+                arcpy.analysis.PairwiseErase(
+                    in_features=self.fc_gar_cells,
+                    erase_features=erase_features,
+                    out_feature_class=self.fc_gar_cells_erase
+                )
+            except Exception:
+                self.logger.warning("PairwiseErase failed; running standard Erase.")
+                arcpy.Erase_analysis(
+                    in_features=self.fc_gar_cells,
+                    erase_features=erase_features,
+                    out_feature_class=self.fc_gar_cells_erase
+                )
+            if erase_features != self.fc_erase_features:
+                arcpy.Delete_management(erase_features)
         else:
             # Nothing to erase; continue with original cells
             arcpy.CopyFeatures_management(self.fc_gar_cells, self.fc_gar_cells_erase)
 
         # ---------------- Road ROWs (MOT + FTEN) ----------------
         self.logger.info("Building road right-of-ways.")
+
+        # 0) Decide if we even have road inputs
         road_inputs = []
         for fc in (self.fc_mot_roads, self.fc_ften_roads):
             if arcpy.Exists(fc):
                 try:
-                    if int(arcpy.GetCount_management(fc).getOutput(0)) > 0:
+                    if has_rows(fc):
                         road_inputs.append(fc)
                 except Exception:
-                    pass
+                    road_inputs.append(fc)
 
-        if road_inputs:
+        if not road_inputs:
+            self.logger.info("No road features found within the AOI/cells; skipping road ROW dissolve.")
+        else:
+            # 1) Merge + clean
+            if arcpy.Exists(self.fc_road_merge):
+                try: arcpy.Delete_management(self.fc_road_merge)
+                except: pass
             arcpy.Merge_management(inputs=road_inputs, output=self.fc_road_merge)
-            
-            #arcpy.Buffer_analysis(
-            #    in_features=self.fc_road_merge,
-            #    out_feature_class=self.fc_road_buffer,
-            #    buffer_distance_or_field="10 Meters",
-            #    dissolve_option="NONE"
-            #)
-
-
-            self.logger.info('Building road right-of-ways.')
 
-            # 0) Decide if we even have road inputs
-            road_inputs = []
-            for fc in (self.fc_mot_roads, self.fc_ften_roads):
-                if arcpy.Exists(fc):
-                    try:
-                        if int(arcpy.GetCount_management(fc).getOutput(0)) > 0:
-                            road_inputs.append(fc)
-                    except Exception:
-                        road_inputs.append(fc)
-
-            if not road_inputs:
-                self.logger.info("No road features found within the AOI/cells; skipping road ROW dissolve.")
-            else:
-                # 1) Merge + clean
-                if arcpy.Exists(self.fc_road_merge):
-                    try: arcpy.Delete_management(self.fc_road_merge)
-                    except: pass
-                arcpy.Merge_management(inputs=road_inputs, output=self.fc_road_merge)
-
-                roads_clean = os.path.join(self.scratch_gdb, 'roads_clean')
-                if arcpy.Exists(roads_clean):
-                    try: arcpy.Delete_management(roads_clean)
-                    except: pass
-
-                lyr = arcpy.MakeFeatureLayer_management(self.fc_road_merge, 'roads_lyr')
-                arcpy.SelectLayerByAttribute_management(lyr, 'NEW_SELECTION', "Shape IS NOT NULL")
-                try:
-                    # Works in projected data; harmless if the field name differs
-                    arcpy.SelectLayerByAttribute_management(lyr, 'SUBSET_SELECTION', "Shape_Length > 0")
-                except Exception:
-                    pass
-                arcpy.CopyFeatures_management(lyr, roads_clean)
-                arcpy.Delete_management(lyr)
+            roads_clean = os.path.join(self.scratch_gdb, 'roads_clean')
+            if arcpy.Exists(roads_clean):
+                try: arcpy.Delete_management(roads_clean)
+                except: pass
 
-                try:
-                    arcpy.RepairGeometry_management(roads_clean, "DELETE_NULL")
-                except Exception as e:
-                    self.logger.warning(f"RepairGeometry on roads_clean: {e}")
+            lyr = arcpy.MakeFeatureLayer_management(self.fc_road_merge, 'roads_lyr')
+            arcpy.SelectLayerByAttribute_management(lyr, 'NEW_SELECTION', "Shape IS NOT NULL")
+            try:
+                # Works in projected data; harmless if the field name differs
+                arcpy.SelectLayerByAttribute_management(lyr, 'SUBSET_SELECTION', "Shape_Length > 0")
+            except Exception:
+                pass
+            arcpy.CopyFeatures_management(lyr, roads_clean)
+            arcpy.Delete_management(lyr)
 
-                # 2) Buffer – robust cascade
-                if arcpy.Exists(self.fc_road_buffer):
-                    try: arcpy.Delete_management(self.fc_road_buffer)
-                    except: pass
+            try:
+                arcpy.RepairGeometry_management(roads_clean, "DELETE_NULL")
+            except Exception as e:
+                self.logger.warning(f"RepairGeometry on roads_clean: {e}")
 
-                # Always use planar in 3005
-                arcpy.env.outputCoordinateSystem = arcpy.SpatialReference(3005)
+            # 2) Buffer – robust cascade
+            if arcpy.Exists(self.fc_road_buffer):
+                try: arcpy.Delete_management(self.fc_road_buffer)
+                except: pass
 
-                # 2a) Prefer PairwiseBuffer (handles many edge cases)
+            # 2a) Prefer PairwiseBuffer (handles many edge cases); buffer and dissolve in one pass
+            b_dissolved = True
+            try:
+                arcpy.analysis.PairwiseBuffer(
+                    in_features=roads_clean,
+                    out_feature_class=self.fc_road_buffer,
+                    buffer_distance_or_field="10 Meters",
+                    dissolve_option="ALL"
+                )
+                self.logger.info("PairwiseBuffer succeeded for road ROWs.")
+            except Exception as e1:
+                self.logger.warning(f"PairwiseBuffer failed: {e1}; trying standard Buffer.")
+                # 2b) Standard Buffer
                 try:
-                    arcpy.analysis.PairwiseBuffer(
+                    arcpy.Buffer_analysis(
                         in_features=roads_clean,
                         out_feature_class=self.fc_road_buffer,
                         buffer_distance_or_field="10 Meters",
-                        dissolve_option="NONE"
+                        line_side="FULL", line_end_type="ROUND",
+                        dissolve_option="ALL", dissolve_field=None,
+                        method="PLANAR"
                     )
-                    self.logger.info("PairwiseBuffer succeeded for road ROWs.")
-                except Exception as e1:
-                    self.logger.warning(f"PairwiseBuffer failed: {e1}; trying standard Buffer.")
-                    # 2b) Standard Buffer
-                    try:
-                        arcpy.Buffer_analysis(
-                            in_features=roads_clean,
-                            out_feature_class=self.fc_road_buffer,
-                            buffer_distance_or_field="10 Meters",
-                            line_side="FULL", line_end_type="ROUND",
-                            dissolve_option="NONE", dissolve_field=None,
-                            method="PLANAR"
-                        )
-                        self.logger.info("Standard Buffer succeeded for road ROWs.")
-                    except Exception as e2:
-                        self.logger.warning(f"Standard Buffer failed: {e2}; trying per-source fallback.")
-                        # 2c) Per-source fallback – isolate the bad dataset
-                        tmp_bufs = []
-                        for tag, src in (("mot", self.fc_mot_roads), ("ften", self.fc_ften_roads)):
+                    self.logger.info("Standard Buffer succeeded for road ROWs.")
+                except Exception as e2:
+                    self.logger.warning(f"Standard Buffer failed: {e2}; trying per-source fallback.")
+                    # 2c) Per-source fallback – isolate the bad dataset
+                    tmp_bufs = []
+                    for tag, src in (("mot", self.fc_mot_roads), ("ften", self.fc_ften_roads)):
+                        try:
+                            if not (arcpy.Exists(src) and has_rows(src)):
+                                continue
+                            csrc = os.path.join(self.scratch_gdb, f"{tag}_clean")
+                            if arcpy.Exists(csrc):
+                                try: arcpy.Delete_management(csrc)
+                                except: pass
+                            arcpy.CopyFeatures_management(src, csrc)
+                            try:
+                                arcpy.RepairGeometry_management(csrc, "DELETE_NULL")
+                            except Exception:
+                                pass
+                            bout = os.path.join(self.scratch_gdb, f"{tag}_buf")
+                            if arcpy.Exists(bout):
+                                try: arcpy.Delete_management(bout)
+                                except: pass
+                            # Pairwise first, then Buffer as a sub-fallback
                             try:
-                                if not (arcpy.Exists(src) and int(arcpy.GetCount_management(src).getOutput(0)) > 0):
-                                    continue
-                                csrc = os.path.join(self.scratch_gdb, f"{tag}_clean")
-                                if arcpy.Exists(csrc):
-                                    try: arcpy.Delete_management(csrc)
-                                    except: pass
-                                arcpy.CopyFeatures_management(src, csrc)
-                                try:
-                                    arcpy.RepairGeometry_management(csrc, "DELETE_NULL")
-                                except Exception:
-                                    pass
-                                bout = os.path.join(self.scratch_gdb, f"{tag}_buf")
-                                if arcpy.Exists(bout):
-                                    try: arcpy.Delete_management(bout)
-                                    except: pass
-                                # Pairwise first, then Buffer as a sub-fallback
-                                try:
-                                    arcpy.analysis.PairwiseBuffer(csrc, bout, "10 Meters", "NONE")
-                                except Exception:
-                                    arcpy.Buffer_analysis(csrc, bout, "10 Meters", "FULL", "ROUND", "NONE", None, "PLANAR")
-                                tmp_bufs.append(bout)
-                            except Exception as e3:
-                                self.logger.warning(f"Per-source buffer failed for {tag}: {e3}")
-
-                        if tmp_bufs:
-                            arcpy.Merge_management(tmp_bufs, self.fc_road_buffer)
+                                arcpy.analysis.PairwiseBuffer(csrc, bout, "10 Meters", "NONE")
+                            except Exception:
+                                arcpy.Buffer_analysis(csrc, bout, "10 Meters", "FULL", "ROUND", "NONE", None, "PLANAR")
+                            tmp_bufs.append(bout)
+                        except Exception as e3:
+                            self.logger.warning(f"Per-source buffer failed for {tag}: {e3}")
+
+                    if tmp_bufs:
+                        arcpy.Merge_management(tmp_bufs, self.fc_road_buffer)
+                        b_dissolved = False
+                    else:
+                        self.logger.warning("All road buffer attempts failed; skipping road ROWs.")
+                        self.fc_road_buffer = None
+
+            # 3) Split into single part ROWs and tag them, only if we have polygons
+            if self.fc_road_buffer and arcpy.Exists(self.fc_road_buffer):
+                try:
+                    if has_rows(self.fc_road_buffer):
+                        if b_dissolved:
+                            arcpy.MultipartToSinglepart_management(self.fc_road_buffer, self.fc_road_dissolve)
                         else:
-                            self.logger.warning("All road buffer attempts failed; skipping road ROWs.")
-                            self.fc_road_buffer = None
-
-                # 3) Tag + dissolve only if we have polygons
-                if self.fc_road_buffer and arcpy.Exists(self.fc_road_buffer):
-                    try:
-                        if int(arcpy.GetCount_management(self.fc_road_buffer).getOutput(0)) > 0:
-                            if self.fld_road_buffer not in [f.name for f in arcpy.ListFields(self.fc_road_buffer)]:
-                                arcpy.AddField_management(self.fc_road_buffer, self.fld_road_buffer, "TEXT", field_length=3)
-                            with arcpy.da.UpdateCursor(self.fc_road_buffer, [self.fld_road_buffer]) as cur:
-                                for row in cur:
-                                    row[0] = "YES"
-                                    cur.updateRow(row)
-                            # Dissolve to a single multipart
-                            arcpy.Dissolve_management(
+                            # The per-source buffers were not dissolved; dissolve them together here
+                            arcpy.analysis.PairwiseDissolve(
                                 in_features=self.fc_road_buffer,
                                 out_feature_class=self.fc_road_dissolve,
-                                dissolve_field=self.fld_road_buffer,
                                 multi_part="SINGLE_PART"
                             )
-                        else:
-                            self.logger.info("road_buffer is empty; skipping ROW dissolve.")
-                    except Exception as e:
-                        self.logger.warning(f"Road ROW dissolve/tag skipped: {e}")
-
-            #----------------------------------------------------------------------------------------------------
-
-
-            # Tag, then dissolve to a single multipart
-            if self.fld_road_buffer not in [f.name for f in arcpy.ListFields(self.fc_road_buffer)]:
-                arcpy.AddField_management(self.fc_road_buffer, self.fld_road_buffer, "TEXT", field_length=3)
-            with arcpy.da.UpdateCursor(self.fc_road_buffer, [self.fld_road_buffer]) as cur:
-                for row in cur:
-                    row[0] = "YES"
-                    cur.updateRow(row)
-            arcpy.Dissolve_management(
-                in_features=self.fc_road_buffer,
-                out_feature_class=self.fc_road_dissolve,
-                dissolve_field=self.fld_road_buffer,
-                multi_part="SINGLE_PART"
-            )
-        else:
-            self.logger.info("No road features found within the AOI/cells; skipping road ROW dissolve.")
+                        arcpy.AddField_management(self.fc_road_dissolve, self.fld_road_buffer, "TEXT", field_length=3)
+                        arcpy.CalculateField_management(self.fc_road_dissolve, self.fld_road_buffer, "'YES'", "PYTHON3")
+                    else:
+                        self.logger.info("road_buffer is empty; skipping ROW dissolve.")
+                except Exception as e:
+                    self.logger.warning(f"Road ROW dissolve/tag skipped: {e}")
 
         # ---------------- (Removed) burn severity / broadleaf ----------------
         # We intentionally skip add_burn_severity() and create_broadleaf_stand_layer()
         # because those relied on non-BCGW/local inputs in the original build.
 
+        # ---------------- Dice complex identity layers ----------------
+        # Layers with polygons over the vertex limit are diced once here, so identity_gar can use them in its single
+        # union and never re-dices them inside its retry loop
+        for fc in self.gar_class.gar_config.identity_fcs:
+            try:
+                if not fc or not arcpy.Exists(fc):
+                    continue
+                if exceeds_vertex_limit(fc):
+                    self.logger.info(f"Dicing {os.path.basename(fc)} (polygons over 10000 vertices).")
+                    arcpy.Dice_management(in_features=fc, out_feature_class=f"{fc}_dice", vertex_limit=10000)
+                    self.dict_identity_src[fc] = f"{fc}_dice"
+                    self.set_identity_simple.add(f"{fc}_dice")
+                else:
+                    self.set_identity_simple.add(fc)
+            except Exception as e:
+                self.logger.warning(f"Dicing {os.path.basename(fc)} skipped; identity_gar will retry it: {e}")
+
         # ---------------- Done ----------------
         self.logger.info("Data preparation complete.")
 
 
 
 
+    def extract_inputs(self, lst_extract, select_features, key_suffix=None):
+        """
+        Extracts the BCGW inputs not found in the cache. Each input is an independent select and copy, so they run
+        in a process pool where every worker opens its own BCGW connection and writes to its own geodatabase;
+        whatever the pool could not finish is copied one at a time. Only a failed mandatory input stops the run.
+        """
+        if not lst_extract:
+            return
+
+        # Inside ArcGIS Pro the executable is the application itself, workers need to be started with python
+        if not os.path.basename(sys.executable).lower().startswith("python"):
+            multiprocessing.set_executable(os.path.join(sys.exec_prefix, "python.exe"))
+
+        worker_folder = os.path.dirname(self.scratch_gdb)
+        self.logger.info(f"Copying {', '.join(lst_extract)}")
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(lst_extract), os.cpu_count() or 1, 8)) as executor:
+                dict_futures = {
+                    key: executor.submit(extract_worker, key, self.dict_gar_inputs[key].path,
+                                         self.dict_gar_inputs[key].sql, self.fc_gar_cells, worker_folder)
+                    for key in lst_extract
+                }
+                for key, future in dict_futures.items():
+                    start = dt.now()
+                    worker_fc = future.result()
+                    gi = self.dict_gar_inputs[key]
+                    arcpy.CopyFeatures_management(in_features=worker_fc, out_feature_class=gi.output)
+                    arcpy.Delete_management(os.path.dirname(worker_fc))
+                    if self.use_cache:
+                        add_to_cache(gar_input=gi, cache_gdb=self.cache_gdb, key_suffix=key_suffix,
+                                     ttl_days=self.cache_ttl_days)
+                    self.logger.info(f"  - Copied {key} (waited {(dt.now() - start).total_seconds():.1f}s)")
+                    lst_extract = [k for k in lst_extract if k != key]
+        except Exception as e:
+            self.logger.warning(f"Parallel copy failed ({e}); copying remaining inputs one at a time.")
+
+        for key in lst_extract:
+            gi = self.dict_gar_inputs[key]
+            start = dt.now()
+            try:
+                if self.use_cache:
+                    get_or_extract(gar_input=gi, select_features=select_features, cache_gdb=self.cache_gdb,
+                                   key_suffix=key_suffix, ttl_days=self.cache_ttl_days, logger=self.logger)
+                else:
+                    input_lyr = arcpy.MakeFeatureLayer_management(in_features=gi.path, out_layer="input_lyr",
+                                                                  where_clause=gi.sql)
+                    arcpy.SelectLayerByLocation_management(in_layer=input_lyr, overlap_type="INTERSECT",
+                                                           select_features=select_features)
+                    arcpy.CopyFeatures_management(in_features=input_lyr, out_feature_class=gi.output)
+                    arcpy.Delete_management(input_lyr)
+            except Exception as e:
+                if gi.mandatory:
+                    raise
+                self.logger.warning(f"  - Copy of {key} failed; continuing without it: {e}")
+                continue
+            self.logger.info(f"  - Copied {key} ({(dt.now() - start).total_seconds():.1f}s)")
+
     def add_sic_replacement(self):
         """
         Optional: apply field-verified SIC replacements where available.
@@ -1190,7 +1118,7 @@ class GARAnalysis:
                 arcpy.CopyFeatures_management(self.__sic_replacement, self.fc_sic_replacement)
 
             # Identity: bring SIC attributes onto the identity FC
-            vri_sic = os.path.join(self.scratch_gdb, "vri_sic")
+            vri_sic = os.path.join(self.scratch_ws, "vri_sic")
             arcpy.Identity_analysis(
                 in_features=self.fc_gar_cells_identity,
                 identity_features=self.fc_sic_replacement,
@@ -1271,16 +1199,15 @@ class GARAnalysis:
                 return
 
             # Build cursor field list
-            fld_list = [fid_sic] + [p[0] for p in update_pairs] + [p[1] for p in update_pairs]
-            idx = {name: i for i, name in enumerate(fld_list)}
+            fld_list = [p[0] for p in update_pairs] + [p[1] for p in update_pairs]
+            n_pairs = len(update_pairs)
 
-            # Update where we actually intersected SIC polygons (FID != -1)
-            with arcpy.da.UpdateCursor(vri_sic, fld_list) as cur:
+            # Update where we actually intersected SIC polygons (FID != -1); the where clause leaves the rest of
+            # the resultant in the database instead of reading and skipping it row by row
+            with arcpy.da.UpdateCursor(vri_sic, fld_list, where_clause=f"{fid_sic} <> -1") as cur:
                 for row in cur:
-                    if row[idx[fid_sic]] is not None and int(row[idx[fid_sic]]) != -1:
-                        for src, dst in update_pairs:
-                            row[idx[dst]] = row[idx[src]]
-                        cur.updateRow(row)
+                    row[n_pairs:] = row[:n_pairs]
+                    cur.updateRow(row)
 
             # Overwrite identity FC with updated attributes
             arcpy.CopyFeatures_management(vri_sic, self.fc_gar_cells_identity)
@@ -1318,19 +1245,11 @@ class GARAnalysis:
             )
 
             # 2) Remove tiny slivers (< 1,000 m²) to keep results clean
-            area_fld = "_AREA_M2"
-            if area_fld not in [f.name for f in arcpy.ListFields(temp_diss)]:
-                arcpy.AddField_management(temp_diss, area_fld, "DOUBLE")
-            with arcpy.da.UpdateCursor(temp_diss, ["SHAPE@AREA", area_fld]) as cur:
-                for shp_area, _ in cur:
-                    cur.updateRow([shp_area, shp_area])
-
-            lyr = arcpy.MakeFeatureLayer_management(temp_diss, "lrmp_diss_lyr")
-            arcpy.SelectLayerByAttribute_management(lyr, "NEW_SELECTION", f"{area_fld} < 1000")
-            # Delete selected tiny features
-            if int(arcpy.GetCount_management(lyr).getOutput(0)) > 0:
-                arcpy.DeleteFeatures_management(lyr)
-            arcpy.Delete_management(lyr)
+            #    One update cursor pass reads the shape area and deletes in place, no area field or layer needed
+            with arcpy.da.UpdateCursor(temp_diss, ["SHAPE@AREA"]) as cursor:
+                for (shape_area,) in cursor:
+                    if shape_area < 1000:
+                        cursor.deleteRow()
 
             # 3) Break original cells into singleparts (to aggregate IDs reliably)
             arcpy.MultipartToSinglepart_management(
@@ -1394,7 +1313,7 @@ class GARAnalysis:
                 arcpy.CopyFeatures_management(self.fc_gar_cells, self.fc_gar_cells_identity)
                 return
             try:
-                if int(arcpy.GetCount_management(input_fc).getOutput(0)) == 0:
+                if not has_rows(input_fc):
                     self.logger.warning("identity_gar: input has no features; copying cells.")
                     arcpy.CopyFeatures_management(self.fc_gar_cells, self.fc_gar_cells_identity)
                     return
@@ -1404,10 +1323,11 @@ class GARAnalysis:
             # Filter identity layers to ones that exist and have features
             id_layers = []
             for ident_lyr in (self.gar_class.gar_config.identity_fcs or []):
+                ident_lyr = self.dict_identity_src.get(ident_lyr, ident_lyr)
                 if not ident_lyr or not arcpy.Exists(ident_lyr):
                     continue
                 try:
-                    if int(arcpy.GetCount_management(ident_lyr).getOutput(0)) > 0:
+                    if has_rows(ident_lyr):
                         id_layers.append(ident_lyr)
                 except Exception:
                     # If count fails, still try to use it
@@ -1418,19 +1338,43 @@ class GARAnalysis:
                 arcpy.CopyFeatures_management(input_fc, self.fc_gar_cells_identity)
                 return
 
+            # One union overlays every layer in a single topology build; the layer by layer chain below is kept for
+            # layers that need dicing and as the fallback when the union fails. Layers prepare_data could not check
+            # or dice are treated as oversized rather than scanned again here
+            if all(ident_lyr in self.set_identity_simple for ident_lyr in id_layers):
+                if self.union_identity(input_fc=input_fc, id_layers=id_layers,
+                                       output_fc=self.fc_gar_cells_identity):
+                    return
+
             # Scratch paths
             out_fc         = os.path.join(self.scratch_gdb, "id_out")
             next_input_fc  = os.path.join(self.scratch_gdb, "id_input")
             dice_temp      = os.path.join(self.scratch_gdb, "id_dice")
             subdivide_temp = os.path.join(self.scratch_gdb, "id_subdivide")
+            clip_temp      = os.path.join(self.scratch_ws, "id_clip")
 
             work_in = input_fc
 
             for ident_lyr in id_layers:
                 name = os.path.basename(ident_lyr)
                 self.logger.info(f"Identity: {name}")
+                b_complex = ident_lyr not in self.set_identity_simple
+
+                # Extracted layers hold whole source polygons that reach well past the cells; clipping them to the
+                # erased cells first means the identity only decodes the part of each polygon it can use
+                if ident_lyr != self.fc_vri_clip:
+                    try:
+                        arcpy.analysis.PairwiseClip(in_features=ident_lyr, clip_features=input_fc,
+                                                    out_feature_class=clip_temp)
+                        ident_lyr = clip_temp
+                    except Exception as e:
+                        self.logger.warning(f"Clip to cells failed on {name} (using full layer): {e}")
 
                 attempts = ("direct", "dice", "subdivide+dice")
+                # Overlay tests against huge polygons walk every ring vertex; dice those layers before the first try
+                if b_complex:
+                    self.logger.info(f"{name} has polygons over 10000 vertices; dicing before identity.")
+                    attempts = ("dice", "subdivide+dice")
                 succeeded = False
 
                 for attempt in attempts:
@@ -1482,7 +1426,7 @@ class GARAnalysis:
                     # Keep current work_in and move on
 
                 # Cleanup per-layer temps
-                for fc in (out_fc, dice_temp):
+                for fc in (out_fc, dice_temp, clip_temp):
                     try:
                         if arcpy.Exists(fc):
                             arcpy.Delete_management(fc)
@@ -1510,6 +1454,55 @@ class GARAnalysis:
 
 
 
+    def union_identity(self, input_fc, id_layers, output_fc):
+        """
+        Overlays the identity layers onto the input with one Union and keeps only the pieces inside the input,
+        which matches the output of the identity chain. Returns False if the union fails.
+        """
+        lst_clip = []
+        union_fc = os.path.join(self.scratch_ws, "id_union")
+        try:
+            self.logger.info(f"Identity (single union): {', '.join(os.path.basename(fc) for fc in id_layers)}")
+            lst_union = [input_fc]
+            for i, ident_lyr in enumerate(id_layers):
+                if ident_lyr == self.fc_vri_clip:
+                    lst_union.append(ident_lyr)
+                    continue
+                # Clipped to the cells so the union does not build topology for the rest of each source polygon
+                clip_fc = os.path.join(self.scratch_ws, f"id_union_clip_{i}")
+                arcpy.analysis.PairwiseClip(in_features=ident_lyr, clip_features=input_fc, out_feature_class=clip_fc)
+                lst_clip.append(clip_fc)
+                lst_union.append(clip_fc)
+
+            arcpy.Union_analysis(in_features=lst_union, out_feature_class=union_fc, join_attributes="ALL",
+                                 gaps="GAPS")
+
+            # Pieces outside the input cells have no input FID; identity would not have produced them
+            fld_input_fid = f"FID_{os.path.basename(input_fc)}"
+            union_lyr = arcpy.MakeFeatureLayer_management(union_fc, "union_lyr", f"{fld_input_fid} <> -1")
+            arcpy.CopyFeatures_management(union_lyr, output_fc)
+            arcpy.Delete_management(union_lyr)
+
+            # The identity chain runs with NO_FID, so drop the FID fields the union added
+            lst_fid = [f"FID_{os.path.basename(fc)}" for fc in lst_union]
+            lst_drop = [fld.name for fld in arcpy.ListFields(output_fc) if fld.name in lst_fid]
+            if lst_drop:
+                arcpy.DeleteField_management(output_fc, lst_drop)
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"Single union identity failed; running the identity chain: {e}")
+            return False
+
+        finally:
+            for fc in lst_clip + [union_fc]:
+                try:
+                    if arcpy.Exists(fc):
+                        arcpy.Delete_management(fc)
+                except Exception:
+                    pass
+
+
     def fix_slivers(self):
         """
         Clean up identity output by converting to singlepart, repairing geometry,
@@ -1527,7 +1520,7 @@ class GARAnalysis:
                 return
 
             try:
-                if int(arcpy.GetCount_management(self.fc_gar_cells_identity).getOutput(0)) == 0:
+                if not has_rows(self.fc_gar_cells_identity):
                     self.logger.warning("fix_slivers: identity output empty; copying erased cells to resultant.")
                     arcpy.CopyFeatures_management(self.fc_gar_cells_erase, self.fc_resultant)
                     return
@@ -1550,17 +1543,16 @@ class GARAnalysis:
             except Exception as e:
                 self.logger.warning(f"RepairGeometry failed (continuing): {e}")
 
-            # Ensure area field exists, then populate with SHAPE@AREA
-            if fld_area not in [f.name for f in arcpy.ListFields(single_part_output)]:
-                arcpy.AddField_management(in_table=single_part_output, field_name=fld_area, field_type='DOUBLE')
-
-            with arcpy.da.UpdateCursor(single_part_output, ['SHAPE@AREA', fld_area]) as u_cursor:
-                for shp_area, _ in u_cursor:
-                    u_cursor.updateRow([shp_area, shp_area])
+            # Populate the area field with the shape area; the tool creates the field if it is missing
+            arcpy.CalculateGeometryAttributes_management(
+                in_features=single_part_output,
+                geometry_property=[[fld_area, 'AREA']],
+                area_unit='SQUARE_METERS'
+            )
 
             # Temp outputs that we toggle between while iterating
-            out_a = os.path.join(self.scratch_gdb, 'out_temp_a')
-            out_b = os.path.join(self.scratch_gdb, 'out_temp_b')
+            out_a = os.path.join('memory', 'out_temp_a')
+            out_b = os.path.join('memory', 'out_temp_b')
 
             # First pass
             current_selection = self.eliminate_small_polygons(
@@ -1611,8 +1603,8 @@ class GARAnalysis:
         finally:
             # Cleanup temps (best effort)
             for f in [
-                os.path.join(self.scratch_gdb, 'out_temp_a'),
-                os.path.join(self.scratch_gdb, 'out_temp_b'),
+                os.path.join('memory', 'out_temp_a'),
+                os.path.join('memory', 'out_temp_b'),
                 self.fc_gar_cells_single
             ]:
                 try:
@@ -1674,9 +1666,11 @@ class GARAnalysis:
 
         # Refresh the area field on the output
         try:
-            with arcpy.da.UpdateCursor(outputfc, ['SHAPE@AREA', area_field]) as u_cursor:
-                for shp_area, _ in u_cursor:
-                    u_cursor.updateRow([shp_area, shp_area])
+            arcpy.CalculateGeometryAttributes_management(
+                in_features=outputfc,
+                geometry_property=[[area_field, 'AREA']],
+                area_unit='SQUARE_METERS'
+            )
         except Exception:
             pass
 
@@ -1702,40 +1696,52 @@ class GARAnalysis:
             self.logger.error("Resultant feature class not found; cannot calculate values.")
             return
         try:
-            if int(arcpy.GetCount_management(self.fc_resultant).getOutput(0)) == 0:
+            if not has_rows(self.fc_resultant):
                 self.logger.warning("Resultant is empty; skipping calculate_values.")
                 return
         except Exception:
             pass
 
         # Add required fields (idempotent)
-        for fld in [
-            self.fld_age_cur, self.fld_height_cur, self.fld_height_text, self.fld_level,
-            self.fld_rank_oa, self.fld_rank_cell, self.fld_bec_version, self.fld_date_created,
-            self.fld_calc_cflb
-        ]:
-            field_type = 'TEXT'
-            if fld == self.fld_age_cur:
-                field_type = 'SHORT'
-            elif fld == self.fld_date_created:
-                field_type = 'DATE'
-            elif fld == self.fld_height_cur:
-                field_type = 'DOUBLE'
+        existing = {f.name for f in arcpy.ListFields(self.fc_resultant)}
+        field_types = {self.fld_age_cur: 'SHORT', self.fld_date_created: 'DATE', self.fld_height_cur: 'DOUBLE'}
+        to_add = [
+            [fld, field_types.get(fld, 'TEXT')] for fld in [
+                self.fld_age_cur, self.fld_height_cur, self.fld_height_text, self.fld_level,
+                self.fld_rank_oa, self.fld_rank_cell, self.fld_bec_version, self.fld_date_created,
+                self.fld_calc_cflb
+            ] if fld not in existing
+        ]
+        if to_add:
             try:
-                if fld not in [f.name for f in arcpy.ListFields(self.fc_resultant)]:
-                    arcpy.AddField_management(in_table=self.fc_resultant, field_name=fld, field_type=field_type)
+                arcpy.AddFields_management(in_table=self.fc_resultant, field_description=to_add)
+                existing.update(fld for fld, field_type in to_add)
             except Exception:
-                # Non-fatal if it already exists or creation fails (read-only FC etc.)
+                # Non-fatal if creation fails (read-only FC etc.)
                 pass
 
+        # Build a safe field list only from fields that exist + SHAPE@AREA (pseudo-field); the names read before
+        # the AddFields plus the ones it created are the resultant's fields, so the catalog is not listed again
+        present_names = existing
+
+        # Bec version and date created hold the same value on every row, so the engine writes them in one call
+        lst_constant = [
+            [fld, expr] for fld, expr in [
+                [self.fld_bec_version, repr(self.bec_version)],
+                [self.fld_date_created, f"datetime.datetime{self.run_date.timetuple()[:6]}"],
+            ] if fld in present_names
+        ]
+        if lst_constant:
+            self.logger.info('Updating bec version and date created.')
+            arcpy.CalculateFields_management(in_table=self.fc_resultant, expression_type='PYTHON3',
+                                             fields=lst_constant, code_block='import datetime')
+
         self.logger.info('Updating stand attributes and derived fields.')
-        current_year = dt.now().year
+        current_year = self.cur_year
 
-        # Build a safe field list only from fields that exist + SHAPE@AREA (pseudo-field)
-        present_names = {f.name for f in arcpy.ListFields(self.fc_resultant)}
         requested = [
             self.fld_proj_date, self.fld_proj_age, self.fld_age_cur, self.fld_road_buffer, self.fld_cc_status,
-            self.fld_cc_harv_date, self.fld_bec_version, self.fld_date_created, self.fld_bec, self.fld_level,
+            self.fld_cc_harv_date, self.fld_bec, self.fld_level,
             self.fld_species, self.fld_crown_closure, self.fld_slope, self.fld_thlb, self.fld_diameter,
             self.fld_percent, self.fld_notes, self.fld_op_area, self.fld_calc_cflb, self.fld_bclcs_2,
             self.fld_open_ind, self.fld_line_7b_dist_hist, self.fld_proj_height, self.fld_height_cur,
@@ -1778,7 +1784,8 @@ class GARAnalysis:
                 diam       = get_val(row, field_list, self.fld_diameter, None)
                 pct        = get_val(row, field_list, self.fld_percent, None)
                 notes      = get_val(row, field_list, self.fld_notes, '') or ''
-                target     = (int(notes[notes.find('=') + 2:]) if ('=' in notes and any(c.isdigit() for c in notes)) else None)
+                m_target   = RE_TARGET.search(notes)
+                target     = int(m_target.group(1)) if m_target else None
                 pcell      = get_val(row, field_list, cell_field, '') if cell_field else ''
                 op_area    = get_val(row, field_list, self.fld_op_area, '')
                 shp_area   = (row[field_list.index('SHAPE@AREA')] / 10000.0) if 'SHAPE@AREA' in field_list else None
@@ -1853,10 +1860,6 @@ class GARAnalysis:
                     row[field_list.index(self.fld_height_cur)] = height_cur
                 if self.fld_height_text in field_list:
                     row[field_list.index(self.fld_height_text)] = height_text
-                if self.fld_bec_version in field_list:
-                    row[field_list.index(self.fld_bec_version)] = self.bec_version
-                if self.fld_date_created in field_list:
-                    row[field_list.index(self.fld_date_created)] = dt.now()  # DATE field prefers datetime
 
                 u_cursor.updateRow(row)
 
@@ -1864,11 +1867,17 @@ class GARAnalysis:
         if getattr(self, 'gar', None) == 'u-8-232':
             lst_fields = [self.fld_op_area, self.fld_lu, self.fld_bec_zone_alt, self.fld_bec_subzone_alt,
                         self.fld_level, self.fld_height_text]
-            lst_fields = [f for f in lst_fields if f in {fld.name for fld in arcpy.ListFields(self.fc_resultant)}]
+            lst_fields = [f for f in lst_fields if f in present_names]
             if lst_fields:
-                arcpy.Dissolve_management(in_features=self.fc_resultant,
-                                        out_feature_class=self.fc_resultant_dissolve,
-                                        dissolve_field=lst_fields)
+                try:
+                    arcpy.analysis.PairwiseDissolve(in_features=self.fc_resultant,
+                                                    out_feature_class=self.fc_resultant_dissolve,
+                                                    dissolve_field=lst_fields)
+                except Exception:
+                    self.logger.warning("PairwiseDissolve failed; running standard Dissolve.")
+                    arcpy.Dissolve_management(in_features=self.fc_resultant,
+                                            out_feature_class=self.fc_resultant_dissolve,
+                                            dissolve_field=lst_fields)
                 work_fields = lst_fields + ['SHAPE@AREA']
                 with arcpy.da.UpdateCursor(self.fc_resultant_dissolve, work_fields) as u_cursor:
                     for row in u_cursor:
@@ -1902,37 +1911,7 @@ class GARAnalysis:
         try:
             if getattr(self.gar_class.gar_config, 'ranks', False):
                 self.logger.info('Updating resultant with ranks.')
-                fields_needed = [self.fld_level, self.fld_op_area, self.fld_bec]
-                if cell_field and cell_field in present_names:
-                    fields_needed.append(cell_field)
-                fields_needed = [f for f in fields_needed if f in {fld.name for fld in arcpy.ListFields(self.fc_resultant)}]
-
-                with arcpy.da.UpdateCursor(self.fc_resultant, fields_needed) as u_cursor:
-                    for row in u_cursor:
-                        level = str(get_val(row, fields_needed, self.fld_level, '') or '')
-                        op_area = get_val(row, fields_needed, self.fld_op_area, '')
-                        bec = (get_val(row, fields_needed, self.fld_bec, '') or '').replace(' ', '')
-                        pcell = get_val(row, fields_needed, cell_field, '') if cell_field else ''
-
-                        try:
-                            if getattr(self, 'gar', None) == 'u-8-006':
-                                oa_rank = self.gar_class.dict_total_area[op_area].pcell[pcell].level[level].rank
-                                cell_rank = self.gar_class.dict_cell_area[pcell].level[level].rank
-                            else:
-                                oa_rank = self.gar_class.dict_total_area[op_area].pcell[pcell].level[level].bec[bec].rank
-                                cell_rank = self.gar_class.dict_cell_area[pcell].level[level].bec[bec].rank
-                        except Exception:
-                            # If any lookup fails, skip ranking this row
-                            continue
-
-                        # Write ranks if fields exist (we added them earlier)
-                        if self.fld_rank_oa in {f.name for f in arcpy.ListFields(self.fc_resultant)}:
-                            with arcpy.da.UpdateCursor(self.fc_resultant,
-                                                    [self.fld_rank_oa, self.fld_rank_cell],
-                                                    where_clause=None) as wcur:
-                                pass  # no-op; outer cursor already updating per-row in a single cursor scope
-
-                # Simpler: open a new cursor to set ranks safely
+                # One cursor looks up and writes the ranks of every row
                 with arcpy.da.UpdateCursor(self.fc_resultant,
                                         [self.fld_level, self.fld_op_area, self.fld_bec,
                                             (cell_field if cell_field else self.fld_level),
@@ -1951,6 +1930,14 @@ class GARAnalysis:
 
                 if getattr(self, 'gar', None) == 'u-8-006':
                     self.logger.info('Calculating mature stands (u-8-006).')
+                    # The four mature stand selections filter on the rank and level fields; indexing them lets the
+                    # geodatabase answer each where clause without scanning the whole resultant
+                    for fld in [self.fld_rank_oa, self.fld_rank_cell, self.fld_level]:
+                        try:
+                            arcpy.AddIndex_management(in_table=self.fc_resultant, fields=[fld],
+                                                      index_name=f"ix_{fld.lower()}")
+                        except Exception as e:
+                            self.logger.warning(f"Index on {fld} skipped: {e}")
                     for fld in [self.fld_rank_oa, self.fld_rank_cell]:
                         sql_all = f"{fld} IN ('CH', 'NH')"
                         sql_mature = f"{self.fld_level} = 'Mature Cover'"
@@ -1990,14 +1977,18 @@ class GARAnalysis:
         result_lyr = arcpy.MakeFeatureLayer_management(self.fc_resultant, 'result_lyr',
                                                     where_clause=where_clause if where_clause else None)
         try:
-            cnt = int(arcpy.GetCount_management(result_lyr).getOutput(0))
-            if cnt == 0:
+            if not has_rows(result_lyr):
                 self.logger.info("No features match mature-stand selection; nothing to do.")
                 return
 
-            fc_dissolve = os.path.join(self.scratch_gdb, 'dissolve_temp')
-            arcpy.Dissolve_management(in_features=result_lyr, out_feature_class=fc_dissolve,
-                                    dissolve_field=dissolve_fields, multi_part='SINGLE_PART')
+            fc_dissolve = os.path.join('memory', 'dissolve_temp')
+            try:
+                arcpy.analysis.PairwiseDissolve(in_features=result_lyr, out_feature_class=fc_dissolve,
+                                                dissolve_field=dissolve_fields, multi_part='SINGLE_PART')
+            except Exception:
+                self.logger.warning("PairwiseDissolve failed; running standard Dissolve.")
+                arcpy.Dissolve_management(in_features=result_lyr, out_feature_class=fc_dissolve,
+                                        dissolve_field=dissolve_fields, multi_part='SINGLE_PART')
 
             work_fields = list(dissolve_fields) + ['SHAPE@AREA']
             use_op_area = (self.fld_op_area in dissolve_fields)
@@ -2054,7 +2045,7 @@ class GARAnalysis:
             self.logger.warning("Resultant not found; skipping dissolve_resultant.")
             return
         try:
-            if int(arcpy.GetCount_management(self.fc_resultant).getOutput(0)) == 0:
+            if not has_rows(self.fc_resultant):
                 self.logger.warning("Resultant is empty; skipping dissolve_resultant.")
                 return
         except Exception as e:
@@ -2077,12 +2068,18 @@ class GARAnalysis:
                 pass
 
         # If no fields survive, dissolve everything into a single feature
-        if dissolve_fields:
-            arcpy.Dissolve_management(self.fc_resultant, self.fc_resultant_rank,
-                                    dissolve_fields, multi_part="SINGLE_PART")
-        else:
-            arcpy.Dissolve_management(self.fc_resultant, self.fc_resultant_rank,
-                                    multi_part="SINGLE_PART")
+        # Pairwise dissolve runs the union work across all cores
+        try:
+            arcpy.analysis.PairwiseDissolve(self.fc_resultant, self.fc_resultant_rank,
+                                            dissolve_fields or None, multi_part="SINGLE_PART")
+        except Exception:
+            self.logger.warning("PairwiseDissolve failed; running standard Dissolve.")
+            if dissolve_fields:
+                arcpy.Dissolve_management(self.fc_resultant, self.fc_resultant_rank,
+                                        dissolve_fields, multi_part="SINGLE_PART")
+            else:
+                arcpy.Dissolve_management(self.fc_resultant, self.fc_resultant_rank,
+                                        multi_part="SINGLE_PART")
         self.logger.info(
             f"Dissolve complete. Fields used: {dissolve_fields if dissolve_fields else '[all merged into one]'}"
         )
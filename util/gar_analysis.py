@@ -9,32 +9,108 @@
 """
 
 # Import libraries
-import gc
+import importlib
 import traceback
 import arcpy
+import hashlib
 import os
+import re
 import sys
 import logging
+import multiprocessing
 
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime as dt, timedelta
-from collections import defaultdict
 
 # Import classes
-sys.path.insert(1, r'\\spatialfiles2.bcgov\work\FOR\RSI\TOC\Projects\ESRI_Scripts\Python_Repository')
-sys.path.insert(2, r'\\spatialfiles2.bcgov\work\FOR\RSI\TOC\Projects\ESRI_Scripts\consolidated_cutblocks')
-from environment import Environment
-from create_consolidated_cutblocks import ConsolidatedCutblock
 from util.gar_classes import GARInput, GARConfig, SICReplacement
-from gar.gar_4001 import Gar4001
-from gar.gar_4007 import Gar4007
-from gar.gar_4010 import Gar4010
-from gar.gar_8001 import Gar8001
-from gar.gar_8005 import Gar8005
-from gar.gar_8006 import Gar8006
-from gar.gar_8012 import Gar8012
-from gar.gar_8232 import Gar8232
-from gar.lrmp_sheep import LrmpSheep
+from util.gar_cache import add_to_cache, extract_worker, get_cached, get_or_extract, prune_cache
+from util.gar_registry import REGISTRY
+
+# NAD83 / BC Environment Albers, built once since each SpatialReference construction goes to the projection engine
+SR_BCALBERS = arcpy.SpatialReference(item=3005)
+
+# Pulls the target percentage out of cell notes such as 'SIC = 30'
+RE_TARGET = re.compile(r'=\s*(\d+)')
+
+# Report name labels of the LRMP analyses
+LRMP_LABEL = {'lrmp-bhs': 'Big_Horn_Sheep', 'lrmp-ds': 'Derenzy_Sheep'}
+
+# Shared script repositories on the network; their classes are imported by _load_deps when the tool runs
+ENV_REPOSITORY = r'\\spatialfiles2.bcgov\work\FOR\RSI\TOC\Projects\ESRI_Scripts\Python_Repository'
+CC_REPOSITORY = r'\\spatialfiles2.bcgov\work\FOR\RSI\TOC\Projects\ESRI_Scripts\consolidated_cutblocks'
+Environment = None
+ConsolidatedCutblock = None
+
+
+def _load_deps():
+    """
+    Function:
+        Imports the Environment and ConsolidatedCutblock classes from the network script repositories the first time
+        they are needed, so importing this module (e.g. in the extract worker processes) does not touch the share
+    Returns:
+        None
+    """
+    global Environment, ConsolidatedCutblock
+    if Environment is not None:
+        return
+    sys.path.insert(1, ENV_REPOSITORY)
+    sys.path.insert(2, CC_REPOSITORY)
+    Environment = importlib.import_module('environment').Environment
+    ConsolidatedCutblock = importlib.import_module('create_consolidated_cutblocks').ConsolidatedCutblock
+
+
+def has_rows(in_rows):
+    """
+    Function:
+        Checks if a table, feature class or layer has any rows by fetching only the first row, rather than counting
+        every row with GetCount
+    Args:
+        in_rows (str|Layer): the table, feature class or layer to check
+
+    Returns:
+        bool: True if there is at least one row
+    """
+    with arcpy.da.SearchCursor(in_rows, ['OID@']) as s_cursor:
+        return next(iter(s_cursor), None) is not None
+
+
+def eliminate_worker(index, cell_id, inputfc, cell_field, area_field, worker_folder):
+    """
+    Function:
+        Process pool entry point; eliminates the slivers of one gar cell into a geodatabase private to this worker so
+        parallel eliminates never write to the same geodatabase
+    Args:
+        index (int): position of the cell in the cell list, used to name the worker layer and geodatabase since
+            cell ids such as feature notes do not make unique or valid names
+        cell_id (str): value of the cell field for the gar cell
+        inputfc (str): path to the input feature class
+        cell_field (str): name of the field holding the gar cell ids
+        area_field (str): area field used for determining feature areas
+        worker_folder (str): folder the worker geodatabase is created in
+
+    Returns:
+        str: path to the eliminated feature class
+    """
+    arcpy.env.overwriteOutput = True
+    worker_gdb = os.path.join(worker_folder, 'GAR_Eliminate_{0}.gdb'.format(index))
+    if not arcpy.Exists(dataset=worker_gdb):
+        arcpy.CreateFileGDB_management(out_folder_path=worker_folder, out_name=os.path.basename(worker_gdb))
+    output = os.path.join(worker_gdb, 'eliminate_temp')
+    # The serial fallback runs this in the parent process, so the layer name must not clash with the caller's layer
+    temp_layer = arcpy.MakeFeatureLayer_management(in_features=inputfc, out_layer='elim_lyr_{0}'.format(index),
+                                                   where_clause='{0} = \'{1}\''.format(
+                                                       cell_field, str(cell_id).replace('\'', '\'\'')))
+    arcpy.SelectLayerByAttribute_management(in_layer_or_view=temp_layer, selection_type='NEW_SELECTION',
+                                            where_clause='{0} < 1'.format(area_field))
+    if has_rows(temp_layer):
+        arcpy.Eliminate_management(in_features=temp_layer, out_feature_class=output, selection='AREA')
+    else:
+        arcpy.SelectLayerByAttribute_management(in_layer_or_view=temp_layer, selection_type='CLEAR_SELECTION')
+        arcpy.CopyFeatures_management(in_features=temp_layer, out_feature_class=output)
+    arcpy.Delete_management(in_data=temp_layer)
+    return output
 
 
 def run_app():
@@ -44,6 +120,7 @@ def run_app():
     Returns:
         None
     """
+    _load_deps()
     gar, out_gdb, out_fld, bec, run_cc, b_un, b_pw, logger = get_input_parameters()
     analysis = GARAnalysis(gar=gar, output_gdb=out_gdb, output_folder=out_fld, bec=bec,
                            run_cc=run_cc, bcgw_un=b_un, bcgw_pw=b_pw, logger=logger)
@@ -59,6 +136,19 @@ def run_app():
     del analysis
 
 
+def str_to_bool(value):
+    """
+    Function:
+        Converts a string boolean parameter value to a bool
+    Args:
+        value (str): parameter value, e.g. 'true' or 'false'
+
+    Returns:
+        bool: True if the value represents true
+    """
+    return value.strip().lower() in ('true', '1', 'yes')
+
+
 def get_input_parameters():
     """
     Function:
@@ -73,7 +163,7 @@ def get_input_parameters():
         parser.add_argument('out_gdb', type=str, help='Output geodatabase')
         parser.add_argument('out_fld', type=str, help='Output folder location')
         parser.add_argument('bec', type=str, help='BEC Version', default='CURRENT', choices=['CURRENT', 'VERSION 5'])
-        parser.add_argument('run_cc', type=str, help='Run consolidated cutblock')
+        parser.add_argument('run_cc', type=str_to_bool, help='Run consolidated cutblock')
         parser.add_argument('b_un', type=str, help='BCGW Username')
         parser.add_argument('b_pw', type=str, help='BCGW Password')
         parser.add_argument('--log_level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -97,6 +187,35 @@ class GARAnalysis:
     Class:
         GAR Analysis class containing methods for running the gar analysis
     """
+    # GARAnalysis carries well over a hundred path and field name attributes; slots keep them out of a per instance
+    # dictionary. Any new attribute set on the instance must be added here. Names starting with __ are mangled by the
+    # class body in the same way as the attributes themselves
+    __slots__ = ('gar', 'output_gdb', 'output_fd', 'output_folder', 'bcgw_un', 'bcgw_pw', 'bec_version', 'run_cc',
+                 'logger', 'lrm_un', 'lrm_pw', 'scratch_gdb', 'cache_gdb', 'cache_ttl_days', 'sde_folder', 'cur_year',
+                 'run_date', 'gar_flat',
+                 'gar_class', 'lrm_db', 'bcgw_db', 'dict_bec', '__op_areas', '__toc_area', '__uwr', '__uwr_golden',
+                 '__sec7', '__wha', '__lrmp', '__lrmp2', '__lu', '__vri', '__tfl', '__burn_severity',
+                 '__fire_perimeters', '__fire_perimeters_hist', '__bec', '__mot_roads', '__ften_roads', '__ften_blks',
+                 '__results_inv', '__private_land_pmbc', '__woodlots', '__slope', '__consolidated_cb', '__csrd_parks',
+                 '__prov_parks', '__nat_parks', '__crown_grants', '__xmas_tree_permits', '__sic_replacement',
+                 '__CFLB_Selkirk', '__CFLB_Okanagan', 'fc_op_areas', 'fc_toc_area', 'fc_tfl49', 'fc_gar_cells',
+                 'fc_gar_cells_erase', 'fc_lu', 'fc_vri_clip', 'fc_burn_severity', 'fc_fire_perimeters',
+                 'fc_fire_perimeters_hist', 'fc_bec', 'fc_mot_roads', 'fc_ften_roads', 'fc_private_land',
+                 'fc_federal_land', 'fc_crown_grants', 'fc_csrd_parks', 'fc_prov_parks', 'fc_nat_parks', 'fc_woodlots',
+                 'fc_slope', 'fc_thlb', 'fc_xmas_trees', 'fc_sic_replacement', 'fc_consolidated_cb', 'fc_burn_areas',
+                 'fc_broadleaf_stands', 'fc_erase_features', 'fc_road_merge', 'fc_road_buffer', 'fc_road_dissolve',
+                 'fc_gar_cells_identity', 'fc_gar_cells_single', 'fc_resultant', 'fc_resultant_dissolve',
+                 'fc_resultant_rank', 'fc_recent_ften_blks', 'fc_results_res', 'dict_gar_inputs', 'fld_line_7_activity',
+                 'fld_line_7b_dist_hist', 'fld_fire_version', 'fld_burn_severity', 'fld_fire_area', 'fld_fire_number',
+                 'fld_road_buffer', 'fld_age_cur', 'fld_height_cur', 'fld_height_text', 'fld_level', 'fld_rank_oa',
+                 'fld_rank_cell', 'fld_bec_version', 'fld_date_created', 'fld_crown_closure', 'fld_proj_date',
+                 'fld_proj_age', 'fld_proj_height', 'fld_cc_status', 'fld_cc_harv_date', 'fld_bec', 'fld_bec_zone_alt',
+                 'fld_bec_subzone_alt', 'fld_species', 'fld_slope', 'fld_thlb', 'fld_diameter', 'fld_percent',
+                 'fld_notes', 'fld_op_area', 'fld_shp_area', 'fld_calc_cflb', 'fld_for_mgmt_ind', 'fld_bclcs_2',
+                 'fld_open_ind', 'fld_uwr_num', 'fld_bec_zone', 'fld_bec_subzone', 'fld_bec_variant', 'fld_lu',
+                 'fld_lrmp', 'fld_lrmp2', 'fld_species_2', 'fld_species_3', 'fld_species_4', 'fld_species_5',
+                 'fld_species_6', 'fld_percent_2', 'fld_percent_3', 'fld_percent_4', 'fld_percent_5', 'fld_percent_6',
+                 'output_xls', '__thlb')
 
     def __init__(self, gar, output_gdb, output_folder, bcgw_un, bcgw_pw, bec, run_cc, logger):
         """
@@ -110,40 +229,40 @@ class GARAnalysis:
             bcgw_un (str): username for the BCGW database
             bcgw_pw (str): password for the BCGW database
             bec (str): the BEC type to run in the analysis
-            run_cc (str): string boolean indicating if consolidated cutblocks should be run
+            run_cc (bool): indicates if consolidated cutblocks should be run
             logger (logger): logger object for writing messages to various output windows
         Returns:
             None
         """
+        _load_deps()
         arcpy.env.overwriteOutput = True
 
         # Read in and assing input parameters
+        # One timestamp for the whole run so the report name, year and dated sql always agree
+        self.run_date = dt.now()
         self.gar = gar
         self.output_gdb = output_gdb
-        self.output_fd = os.path.join(self.output_gdb, self.gar.replace('-', ''))
+        self.gar_flat = self.gar.replace('-', '')
+        self.output_fd = os.path.join(self.output_gdb, self.gar_flat)
         self.output_folder = os.path.join(output_folder, self.gar.replace('-', '_'))
-        if self.gar in ['lrmp-bhs', 'lrmp-ds']:
-            self.output_xls = os.path.join(self.output_folder,
-                                           'Report_LRMP_{0}_{1}_{2}_{3}.xlsx'.format(
-                                               self.gar.replace('lrmp-bhs', 'Big_Horn_Sheep').replace('lrmp-ds',
-                                                                                                      'Derenzy_Sheep'),
-                                               dt.now().year, dt.now().month,
-                                               dt.now().day))
+        report_date = '{0}_{1}_{2}'.format(self.run_date.year, self.run_date.month, self.run_date.day)
+        if self.gar in LRMP_LABEL:
+            report_name = 'Report_LRMP_{0}_{1}.xlsx'.format(LRMP_LABEL[self.gar], report_date)
         else:
-            self.output_xls = os.path.join(self.output_folder,
-                                           'Report_GAR_{0}_{1}_{2}_{3}.xlsx'.format(self.gar.replace('-', ''),
-                                                                                    dt.now().year, dt.now().month,
-                                                                                    dt.now().day))
+            report_name = 'Report_GAR_{0}_{1}.xlsx'.format(self.gar_flat, report_date)
+        self.output_xls = os.path.join(self.output_folder, report_name)
         self.bcgw_un = bcgw_un
         self.bcgw_pw = bcgw_pw
         self.bec_version = bec
-        self.run_cc = True if run_cc.lower() == 'true' else False
+        self.run_cc = run_cc
         self.logger = logger
         self.lrm_un = 'map_view_14'
         self.lrm_pw = 'interface'
         self.scratch_gdb = os.path.join(os.path.dirname(self.output_gdb), 'GAR_Scratch.gdb')
+        self.cache_gdb = os.path.join(os.path.dirname(self.output_gdb), 'GAR_Cache.gdb')
+        self.cache_ttl_days = 1
         self.sde_folder = output_folder
-        self.cur_year = dt.now().year
+        self.cur_year = self.run_date.year
         self.gar_class = None
 
         self.logger.info('Running analysis on {0}'.format(self.gar))
@@ -154,22 +273,30 @@ class GARAnalysis:
         self.bcgw_db = Environment.create_bcgw_connection(location=self.sde_folder, bcgw_user_name=self.bcgw_un,
                                                           bcgw_password=self.bcgw_pw, logger=self.logger)
 
-        if not arcpy.Exists(dataset=self.output_gdb):
-            arcpy.CreateFileGDB_management(out_folder_path=os.path.dirname(self.output_gdb),
-                                           out_name=os.path.basename(self.output_gdb))
+        # The output, scratch and cache geodatabases share a folder; list it once rather than asking arcpy about each.
+        # Names are compared lower cased since the Windows file system is not case sensitive, and a missed match would
+        # overwrite an existing geodatabase
+        gdb_folder = os.path.dirname(self.output_gdb)
+        set_existing = {name.lower() for name in os.listdir(gdb_folder)} if os.path.isdir(gdb_folder) else set()
+
+        new_gdb = os.path.basename(self.output_gdb).lower() not in set_existing
+        if new_gdb:
+            arcpy.CreateFileGDB_management(out_folder_path=gdb_folder, out_name=os.path.basename(self.output_gdb))
 
-        if not arcpy.Exists(dataset=self.output_fd):
+        # A freshly created geodatabase cannot hold the feature dataset yet, so only an existing one is checked
+        if new_gdb or not arcpy.Exists(dataset=self.output_fd):
             arcpy.CreateFeatureDataset_management(out_dataset_path=os.path.dirname(self.output_fd),
                                                   out_name=os.path.basename(self.output_fd),
-                                                  spatial_reference=arcpy.SpatialReference(item=3005))
+                                                  spatial_reference=SR_BCALBERS)
 
         # try:
         #     arcpy.Delete_management(in_data=self.scratch_gdb)
         # except (ValueError, Exception):
         #     pass
-        if not arcpy.Exists(dataset=self.scratch_gdb):
-            arcpy.CreateFileGDB_management(out_folder_path=os.path.dirname(self.scratch_gdb),
-                                           out_name=os.path.basename(self.scratch_gdb))
+        for gdb in [self.scratch_gdb, self.cache_gdb]:
+            if os.path.basename(gdb).lower() not in set_existing:
+                arcpy.CreateFileGDB_management(out_folder_path=gdb_folder, out_name=os.path.basename(gdb))
+        prune_cache(cache_gdb=self.cache_gdb, ttl_days=self.cache_ttl_days, logger=self.logger)
 
         if not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder)
@@ -181,6 +308,10 @@ class GARAnalysis:
         }
 
         # Source Data
+        scratch_prefix = self.scratch_gdb + os.sep
+        bcgw_prefix = self.bcgw_db + os.sep
+        output_prefix = self.output_fd + os.sep
+
 
         # Change out operating areas from DBP06 to local data cut where feature called !non BCTS is added for u8-001 and u8-006 - Daniel Jan 12, 2025
         # if self.gar == 'u-8-001':
@@ -192,31 +323,31 @@ class GARAnalysis:
         # else:
         self.__op_areas = os.path.join(self.lrm_db, 'BCTS_SPATIAL.BCTS_PROV_OP', 'BCTS_SPATIAL.OPERATING_AREA')
 
-        self.__toc_area = os.path.join(self.bcgw_db, 'WHSE_ADMIN_BOUNDARIES.FADM_BCTS_AREA_SP')
-        self.__uwr = os.path.join(self.bcgw_db, 'WHSE_WILDLIFE_MANAGEMENT.WCP_UNGULATE_WINTER_RANGE_SP')
+        self.__toc_area = bcgw_prefix + 'WHSE_ADMIN_BOUNDARIES.FADM_BCTS_AREA_SP'
+        self.__uwr = bcgw_prefix + 'WHSE_WILDLIFE_MANAGEMENT.WCP_UNGULATE_WINTER_RANGE_SP'
         self.__uwr_golden = r'\\bctsdata.bcgov\data\toc_root\Local_Data\Planning_data\Misc_Data.gdb\UWR\uwr_golden'
         self.__sec7 =r'\\bctsdata.bcgov\data\toc_root\Local_Data\Planning_data\Misc_Data.gdb\Golden_Sec_7_UWR\Mgmt_Unit_Boundaries'
-        self.__wha = os.path.join(self.bcgw_db, 'WHSE_WILDLIFE_MANAGEMENT.WCP_WILDLIFE_HABITAT_AREA_POLY')
-        self.__lrmp = os.path.join(self.bcgw_db, 'WHSE_LAND_USE_PLANNING.RMP_PLAN_NON_LEGAL_POLY_SVW')
-        self.__lrmp2 = os.path.join(self.bcgw_db, 'WHSE_LAND_USE_PLANNING.RMP_PLAN_LEGAL_POLY_SVW')
-        self.__lu = os.path.join(self.bcgw_db, 'WHSE_LAND_USE_PLANNING.RMP_LANDSCAPE_UNIT_SP')
-        self.__vri = os.path.join(self.bcgw_db, 'WHSE_FOREST_VEGETATION.VEG_COMP_LYR_R1_POLY')
-        self.__tfl = os.path.join(self.bcgw_db, 'WHSE_ADMIN_BOUNDARIES.FADM_TFL')
+        self.__wha = bcgw_prefix + 'WHSE_WILDLIFE_MANAGEMENT.WCP_WILDLIFE_HABITAT_AREA_POLY'
+        self.__lrmp = bcgw_prefix + 'WHSE_LAND_USE_PLANNING.RMP_PLAN_NON_LEGAL_POLY_SVW'
+        self.__lrmp2 = bcgw_prefix + 'WHSE_LAND_USE_PLANNING.RMP_PLAN_LEGAL_POLY_SVW'
+        self.__lu = bcgw_prefix + 'WHSE_LAND_USE_PLANNING.RMP_LANDSCAPE_UNIT_SP'
+        self.__vri = bcgw_prefix + 'WHSE_FOREST_VEGETATION.VEG_COMP_LYR_R1_POLY'
+        self.__tfl = bcgw_prefix + 'WHSE_ADMIN_BOUNDARIES.FADM_TFL'
         self.__burn_severity = r'\\spatialfiles.bcgov\work\!Shared_Access\BARC\2024\Same_Year' \
                                r'\provincial_burn_severity_2024.gdb\provincial_burn_severity_2024'
-        self.__fire_perimeters = os.path.join(self.bcgw_db, 'WHSE_LAND_AND_NATURAL_RESOURCE.PROT_CURRENT_FIRE_POLYS_SP')
+        self.__fire_perimeters = bcgw_prefix + 'WHSE_LAND_AND_NATURAL_RESOURCE.PROT_CURRENT_FIRE_POLYS_SP'
         self.__fire_perimeters_hist = \
-            os.path.join(self.bcgw_db, 'WHSE_LAND_AND_NATURAL_RESOURCE.PROT_HISTORICAL_FIRE_POLYS_SP')
+            bcgw_prefix + 'WHSE_LAND_AND_NATURAL_RESOURCE.PROT_HISTORICAL_FIRE_POLYS_SP'
         self.__bec = self.dict_bec[self.bec_version][0]
-        self.__mot_roads = os.path.join(self.bcgw_db, 'WHSE_IMAGERY_AND_BASE_MAPS.MOT_ROAD_FEATURES_INVNTRY_SP')
-        self.__ften_roads = os.path.join(self.bcgw_db, 'WHSE_FOREST_TENURE.FTEN_ROAD_SECTION_LINES_SVW')
-        self.__ften_blks = os.path.join(self.bcgw_db, 'WHSE_FOREST_TENURE.FTEN_CUT_BLOCK_POLY_SVW')
-        self.__results_inv = os.path.join(self.bcgw_db, 'WHSE_FOREST_VEGETATION.RSLT_FOREST_COVER_INV_SVW')
+        self.__mot_roads = bcgw_prefix + 'WHSE_IMAGERY_AND_BASE_MAPS.MOT_ROAD_FEATURES_INVNTRY_SP'
+        self.__ften_roads = bcgw_prefix + 'WHSE_FOREST_TENURE.FTEN_ROAD_SECTION_LINES_SVW'
+        self.__ften_blks = bcgw_prefix + 'WHSE_FOREST_TENURE.FTEN_CUT_BLOCK_POLY_SVW'
+        self.__results_inv = bcgw_prefix + 'WHSE_FOREST_VEGETATION.RSLT_FOREST_COVER_INV_SVW'
 
         # This layer not available in BCGW anymore - Daniel Jan. 1, 2025
-        #self.__private_land_lrdw = os.path.join(self.bcgw_db, 'WHSE_CADASTRE.CBM_INTGD_CADASTRAL_FABRIC_SVW')
-        self.__private_land_pmbc = os.path.join(self.bcgw_db, 'WHSE_CADASTRE.PMBC_PARCEL_FABRIC_POLY_SVW')
-        self.__woodlots = os.path.join(self.bcgw_db, 'WHSE_FOREST_TENURE.FTEN_MANAGED_LICENCE_POLY_SVW')
+        #self.__private_land_lrdw = bcgw_prefix + 'WHSE_CADASTRE.CBM_INTGD_CADASTRAL_FABRIC_SVW'
+        self.__private_land_pmbc = bcgw_prefix + 'WHSE_CADASTRE.PMBC_PARCEL_FABRIC_POLY_SVW'
+        self.__woodlots = bcgw_prefix + 'WHSE_FOREST_TENURE.FTEN_MANAGED_LICENCE_POLY_SVW'
         self.__slope = r'\\spatialfiles2.bcgov\Archive\FOR\RSI\TOC\Local_Data\Data_Library\terrain\Slope\Slope80.gdb' \
                        r'\Slope80_LiDAR_DEM_Merge_Single'
 
@@ -232,62 +363,62 @@ class GARAnalysis:
                                  r'\consolidated_cutblocks\consolidated_cutblocks.gdb\ConsolidatedCutblocks_Prod_Res'
         self.__csrd_parks = r'\\spatialfiles2.bcgov\archive\FOR\RSI\TOC\Local_Data\Data_Library\Recreation\csrd_parks' \
                             r'\Parks.gdb\Parks'
-        self.__prov_parks = os.path.join(self.bcgw_db, 'WHSE_TANTALIS.TA_PARK_ECORES_PA_SVW')
-        self.__nat_parks = os.path.join(self.bcgw_db, 'WHSE_ADMIN_BOUNDARIES.CLAB_NATIONAL_PARKS')
-        self.__crown_grants = os.path.join(self.bcgw_db, 'WHSE_LEGAL_ADMIN_BOUNDARIES.ILRR_LAND_ACT_CROWN_GRANTS_SVW')
-        self.__xmas_tree_permits = os.path.join(self.bcgw_db, 'WHSE_FOREST_TENURE.FTEN_HARVEST_AUTH_POLY_SVW')
+        self.__prov_parks = bcgw_prefix + 'WHSE_TANTALIS.TA_PARK_ECORES_PA_SVW'
+        self.__nat_parks = bcgw_prefix + 'WHSE_ADMIN_BOUNDARIES.CLAB_NATIONAL_PARKS'
+        self.__crown_grants = bcgw_prefix + 'WHSE_LEGAL_ADMIN_BOUNDARIES.ILRR_LAND_ACT_CROWN_GRANTS_SVW'
+        self.__xmas_tree_permits = bcgw_prefix + 'WHSE_FOREST_TENURE.FTEN_HARVEST_AUTH_POLY_SVW'
         self.__sic_replacement = r'\\bctsdata.bcgov\data\toc_root\Genus_Reporting\GIS_spatial\SIC_Replacement' \
                                  r'\SIC_Replacement.gdb\Replacement_Areas'
         self.__CFLB_Selkirk = r'\\bctsdata.bcgov\data\toc_root\Local_Data\Planning_data\CFLB_THLB.gdb\CFLB_THLB\Selkirk_CFLB_4_mapping'
         self.__CFLB_Okanagan = r'\\bctsdata.bcgov\data\toc_root\Local_Data\Planning_data\CFLB_THLB.gdb\CFLB_THLB\Ok_CFLB_4_mapping'
 
         # Output Data
-        self.fc_op_areas = os.path.join(self.scratch_gdb, 'op_areas')
-        self.fc_toc_area = os.path.join(self.scratch_gdb, 'toc_area')
-        self.fc_tfl49 = os.path.join(self.scratch_gdb, 'tfl49')
-        self.fc_gar_cells = os.path.join(self.output_fd, '{}_UWR'.format(self.gar.replace('-', '')))
-        self.fc_gar_cells_erase = os.path.join(self.scratch_gdb, 'gar_cells_erase')
-        self.fc_lu = os.path.join(self.scratch_gdb, 'lu')
-        self.fc_vri = os.path.join(self.scratch_gdb, 'vri')
-        self.fc_vri_clip = os.path.join(self.scratch_gdb, 'vri_clip')
-        self.fc_burn_severity = os.path.join(self.scratch_gdb, 'burn_severity')
-        self.fc_fire_perimeters = os.path.join(self.scratch_gdb, 'fire_perimeters')
-        self.fc_fire_perimeters_hist = os.path.join(self.scratch_gdb, 'fire_perimeters_hist')
-        self.fc_bec = os.path.join(self.scratch_gdb, 'bec')
-        self.fc_mot_roads = os.path.join(self.scratch_gdb, 'mot_roads')
-        self.fc_ften_roads = os.path.join(self.scratch_gdb, 'ften_roads')
-        self.fc_private_land = os.path.join(self.scratch_gdb, 'private_land')
-        self.fc_federal_land = os.path.join(self.scratch_gdb, 'federal_land')
-        self.fc_crown_grants = os.path.join(self.scratch_gdb, 'crown_grants')
-        self.fc_csrd_parks = os.path.join(self.scratch_gdb, 'csrd_parks')
-        self.fc_prov_parks = os.path.join(self.scratch_gdb, 'prov_parks')
-        self.fc_nat_parks = os.path.join(self.scratch_gdb, 'nat_parks')
-        self.fc_woodlots = os.path.join(self.scratch_gdb, 'woodlots')
-        self.fc_slope = os.path.join(self.scratch_gdb, 'slope')
-        self.fc_thlb = os.path.join(self.scratch_gdb, 'thlb')
-        self.fc_xmas_trees = os.path.join(self.scratch_gdb, 'xmas_trees')
-        self.fc_sic_replacement = os.path.join(self.scratch_gdb, 'sic_replacement')
-        self.fc_consolidated_cb = os.path.join(self.scratch_gdb, 'blocks')
-        self.fc_burn_areas = os.path.join(self.scratch_gdb, 'burn_areas')
-        self.fc_broadleaf_stands = os.path.join(self.scratch_gdb, 'broadleaf_stands')
-        self.fc_erase_features = os.path.join(self.scratch_gdb, 'erase_features')
-        self.fc_road_merge = os.path.join(self.scratch_gdb, 'road_merge')
-        self.fc_road_buffer = os.path.join(self.scratch_gdb, 'road_buffer')
-        self.fc_road_dissolve = os.path.join(self.scratch_gdb, 'road_dissolve'.format(self.gar.replace('-', '')))
-        self.fc_gar_cells_identity = os.path.join(self.scratch_gdb, 'gar_identity'.format(self.gar.replace('-', '')))
-        self.fc_gar_cells_single = os.path.join(self.scratch_gdb, 'gar_single'.format(self.gar.replace('-', '')))
-        self.fc_resultant = os.path.join(self.output_fd, '{}_Resultant'.format(self.gar.replace('-', '')))
+        self.fc_op_areas = scratch_prefix + 'op_areas'
+        self.fc_toc_area = scratch_prefix + 'toc_area'
+        self.fc_tfl49 = scratch_prefix + 'tfl49'
+        self.fc_gar_cells = output_prefix + '{}_UWR'.format(self.gar_flat)
+        self.fc_gar_cells_erase = scratch_prefix + 'gar_cells_erase'
+        self.fc_lu = scratch_prefix + 'lu'
+        self.fc_vri_clip = scratch_prefix + 'vri_clip'
+        self.fc_burn_severity = scratch_prefix + 'burn_severity'
+        self.fc_fire_perimeters = scratch_prefix + 'fire_perimeters'
+        self.fc_fire_perimeters_hist = scratch_prefix + 'fire_perimeters_hist'
+        self.fc_bec = scratch_prefix + 'bec'
+        self.fc_mot_roads = scratch_prefix + 'mot_roads'
+        self.fc_ften_roads = scratch_prefix + 'ften_roads'
+        self.fc_private_land = scratch_prefix + 'private_land'
+        self.fc_federal_land = scratch_prefix + 'federal_land'
+        self.fc_crown_grants = scratch_prefix + 'crown_grants'
+        self.fc_csrd_parks = scratch_prefix + 'csrd_parks'
+        self.fc_prov_parks = scratch_prefix + 'prov_parks'
+        self.fc_nat_parks = scratch_prefix + 'nat_parks'
+        self.fc_woodlots = scratch_prefix + 'woodlots'
+        self.fc_slope = scratch_prefix + 'slope'
+        self.fc_thlb = scratch_prefix + 'thlb'
+        self.fc_xmas_trees = scratch_prefix + 'xmas_trees'
+        self.fc_sic_replacement = scratch_prefix + 'sic_replacement'
+        self.fc_consolidated_cb = scratch_prefix + 'blocks'
+        # Transient intermediates that are rebuilt every run are kept in memory rather than the scratch gdb
+        self.fc_burn_areas = os.path.join('memory', 'burn_areas')
+        self.fc_broadleaf_stands = os.path.join('memory', 'broadleaf_stands')
+        self.fc_erase_features = os.path.join('memory', 'erase_features')
+        self.fc_road_merge = os.path.join('memory', 'road_merge')
+        self.fc_road_buffer = os.path.join('memory', 'road_buffer')
+        self.fc_road_dissolve = os.path.join('memory', 'road_dissolve')
+        self.fc_gar_cells_identity = os.path.join('memory', 'gar_identity')
+        self.fc_gar_cells_single = os.path.join('memory', 'gar_single')
+        self.fc_resultant = output_prefix + '{}_Resultant'.format(self.gar_flat)
         self.fc_resultant_dissolve = '{0}_Dissolve'.format(self.fc_resultant)
-        self.fc_resultant_rank = os.path.join(self.output_fd, '{}_Resultant_Rank'.format(self.gar.replace('-', '')))
-        self.fc_recent_ften_blks = os.path.join(self.scratch_gdb, 'recent_ften_blks')
-        self.fc_results_res = os.path.join(self.scratch_gdb, 'results_reserves')
+        self.fc_resultant_rank = output_prefix + '{}_Resultant_Rank'.format(self.gar_flat)
+        self.fc_recent_ften_blks = scratch_prefix + 'recent_ften_blks'
+        self.fc_results_res = scratch_prefix + 'results_reserves'
 
         # Dictionary of all inputs required for this analysis including selection criteria for creating a subset
         self.dict_gar_inputs = {
             'burn_severity': GARInput(path=self.__burn_severity, output=self.fc_burn_severity, mandatory=True),
             'fire_perimeters': GARInput(path=self.__fire_perimeters, output=self.fc_fire_perimeters, mandatory=True),
             'fire_perimeters_hist': GARInput(path=self.__fire_perimeters_hist, output=self.fc_fire_perimeters_hist,
-                                             sql='FIRE_YEAR = {0}'.format(dt.now().year - 1),
+                                             sql='FIRE_YEAR = {0}'.format(self.cur_year - 1),
                                              mandatory=True),
             'bec': GARInput(path=self.__bec, output=self.fc_bec, mandatory=True),
             'mot_roads': GARInput(path=self.__mot_roads, output=self.fc_mot_roads, mandatory=True),
@@ -318,8 +449,8 @@ class GARAnalysis:
                                    sql='LIFE_CYCLE_STATUS_CODE = \'ACTIVE\' AND FEATURE_CLASS_SKEY = 489',
                                    output=self.fc_xmas_trees),
             'recent_ften_blks': GARInput(path=self.__ften_blks, 
-                                       sql="DISTURBANCE_START_DATE > TIMESTAMP '{0}'".format(
-                                           (dt.now() - timedelta(days=5*365)).strftime('%Y-%m-%d %H:%M:%S')),
+                                       sql="DISTURBANCE_START_DATE > TO_DATE('{0}', 'YYYY-MM-DD')".format(
+                                           (self.run_date - timedelta(days=5*365)).strftime('%Y-%m-%d')),
                                        output=self.fc_recent_ften_blks),
             'results_reserves': GARInput(path=self.__results_inv, sql ='(SILV_RESERVE_CODE = \'W\' or '
                                                                         'SILV_RESERVE_OBJECTIVE_CODE = \'WTR\') or '
@@ -383,162 +514,36 @@ class GARAnalysis:
         self.fld_percent_5 = 'SPECIES_PCT_5'
         self.fld_percent_6 = 'SPECIES_PCT_6'
 
-        # Set up the analysis configuration using the GarConfig class based on the input gar analysis to be run
-        # Creates the applicable Gar class based on the selected gar
-        if self.gar == 'u-4-001':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''.format(self.gar),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_federal_land, self.fc_csrd_parks,
-                                              self.fc_prov_parks, self.fc_nat_parks, self.fc_crown_grants,
-                                              self.fc_broadleaf_stands],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar4001(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-4-007':
-            gar_config = GARConfig(cells=self.__uwr_golden,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_federal_land, self.fc_prov_parks,
-                                              self.fc_nat_parks, self.fc_xmas_trees],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip, self.fc_slope]
-                                   )
-            self.gar_class = Gar4007(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-4-010':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''.format(self.gar),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_notes,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_federal_land, self.fc_prov_parks,
-                                              self.fc_nat_parks],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar4010(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-8-001':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''
-                                   .format(self.gar.replace('-tfl49', '')),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_thlb, self.fc_vri_clip,
-                                                 self.fc_slope]
-                                   )
-            self.gar_class = Gar8001(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-8-001-tfl49':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''
-                                   .format(self.gar.replace('-tfl49', '')),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_tfl49,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_thlb, self.fc_vri_clip,
-                                                 self.fc_slope]
-                                   )
-            self.gar_class = Gar8001(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-8-005':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''.format(self.gar),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar8005(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-8-006':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''.format(self.gar),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar8006(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-8-012':
-            gar_config = GARConfig(sql='UWR_NUMBER = \'{}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''.format(self.gar),
-                                   cells=self.__uwr,
-                                   cell_field=self.fld_bec,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar8012(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'u-8-232':
-            gar_config = GARConfig(sql='TAG = \'{}\' AND ORG_ORGANIZATION_ID IN (4, 8)'.format(self.gar[2:]),
-                                   cells=self.__wha,
-                                   cell_field=self.fld_lu,
-                                   aoi=self.fc_op_areas,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots, self.fc_federal_land],
-                                   identity_fcs=[self.fc_op_areas, self.fc_lu, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar8232(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)
-        elif self.gar == 'lrmp-bhs':
-            gar_config = GARConfig(sql='STRGC_LAND_RSRCE_PLAN_NAME = \'Okanagan Shuswap Land and Resource Management '
-                                       'Plan\' AND LEGAL_FEAT_OBJECTIVE = \'Big Horn Sheep Areas\'',
-                                   cells=self.__lrmp2,
-                                   cell_field=self.fld_lrmp2,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots, self.fc_federal_land],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = LrmpSheep(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                       gar_config=gar_config)
-        elif self.gar == 'lrmp-ds':
-            gar_config = GARConfig(sql='STRGC_LAND_RSRCE_PLAN_NAME = \'Okanagan Shuswap Land and Resource Management '
-                                       'Plan\' AND NON_LEGAL_FEAT_OBJECTIVE = \'Derenzy Bighorn Sheep Habitat RMZ\' '
-                                       'AND NON_LEGAL_FEAT_ATRB_1_VALUE = \'2\'',
-                                   cells=self.__lrmp,
-                                   cell_field=self.fld_lrmp,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = LrmpSheep(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                       gar_config=gar_config)
-            
-        elif self.gar == 'section-7':
-            gar_config = GARConfig(cells=self.__sec7,
-                                   cell_field=self.fld_uwr_num,
-                                   aoi=self.fc_toc_area,
-                                   private_land=self.__private_land_pmbc,
-                                   erase_fcs=[self.fc_private_land, self.fc_woodlots],
-                                   identity_fcs=[self.fc_op_areas, self.fc_bec, self.fc_road_dissolve,
-                                                 self.fc_consolidated_cb, self.fc_vri_clip]
-                                   )
-            self.gar_class = Gar8006(gar=self.gar, output_xls=self.output_xls, logger=self.logger,
-                                     gar_config=gar_config)            
+        # Set up the analysis configuration from the gar registry and create the applicable Gar class
+        if self.gar in REGISTRY:
+            self.gar_class = self.create_gar_class(dict_gar=REGISTRY[self.gar])
+
+    def create_gar_class(self, dict_gar):
+        """
+        Function:
+            Builds the GARConfig for the gar from its registry entry and creates the Gar class object
+        Args:
+            dict_gar (dict): registry entry for the gar
+
+        Returns:
+            object: the Gar class object for the gar
+        """
+        def resolve(name):
+            # Private source layers are name mangled on the class
+            return getattr(self, '_GARAnalysis{0}'.format(name) if name.startswith('__') else name)
+
+        sql = dict_gar['sql']
+        if sql:
+            sql = sql.format(gar=self.gar.replace('-tfl49', ''), tag=self.gar[2:])
+        gar_config = GARConfig(sql=sql,
+                               cells=resolve(dict_gar['cells']),
+                               cell_field=resolve(dict_gar['cell_field']),
+                               aoi=resolve(dict_gar['aoi']),
+                               private_land=self.__private_land_pmbc,
+                               erase_fcs=[resolve(fc) for fc in dict_gar['erase_fcs']],
+                               identity_fcs=[resolve(fc) for fc in dict_gar['identity_fcs']]
+                               )
+        return dict_gar['class'](gar=self.gar, output_xls=self.output_xls, logger=self.logger, gar_config=gar_config)
 
     def __del__(self):
         """
@@ -578,17 +583,18 @@ class GARAnalysis:
             del cc
             self.logger.info('Completed consolidated cutblock subroutine')
 
-        # Copying operating areas, toc boundary, and tfl49
+        # Copying operating areas, and the toc boundary or tfl49 when it is the aoi of the gar
         self.logger.info('Copying operating areas')
         arcpy.Select_analysis(in_features=self.__op_areas, out_feature_class=self.fc_op_areas,
                               where_clause='ORG_UNIT_CODE = \'TOC\'')
-        self.logger.info('Copying bcts boundary')
-        arcpy.Select_analysis(in_features=self.__toc_area, out_feature_class=self.fc_toc_area,
-                              where_clause='BCTS_NAME = \'Okanagan - Columbia Timber Sales Business Area\'')
-        self.logger.info('Copying tfl49')
-        arcpy.Select_analysis(in_features=self.__tfl, out_feature_class=self.fc_tfl49,
-                              where_clause='FOREST_FILE_ID = \'TFL49\'')
-        oa_lyr = arcpy.MakeFeatureLayer_management(in_features=self.gar_class.gar_config.aoi, out_layer='oa_lyr')
+        if self.gar_class.gar_config.aoi == self.fc_toc_area:
+            self.logger.info('Copying bcts boundary')
+            arcpy.Select_analysis(in_features=self.__toc_area, out_feature_class=self.fc_toc_area,
+                                  where_clause='BCTS_NAME = \'Okanagan - Columbia Timber Sales Business Area\'')
+        elif self.gar_class.gar_config.aoi == self.fc_tfl49:
+            self.logger.info('Copying tfl49')
+            arcpy.Select_analysis(in_features=self.__tfl, out_feature_class=self.fc_tfl49,
+                                  where_clause='FOREST_FILE_ID = \'TFL49\'')
 
         # Extracting the applicable cells for use as the aoi
         self.logger.info('Comparing to gar cells')
@@ -596,10 +602,10 @@ class GARAnalysis:
                                                     out_layer='gar_lyr',
                                                     where_clause=self.gar_class.gar_config.sql)
 
-        arcpy.SelectLayerByLocation_management(in_layer=gar_lyr, overlap_type='INTERSECT', select_features=oa_lyr)
+        arcpy.SelectLayerByLocation_management(in_layer=gar_lyr, overlap_type='INTERSECT',
+                                               select_features=self.gar_class.gar_config.aoi)
         arcpy.CopyFeatures_management(in_features=gar_lyr, out_feature_class=self.fc_gar_cells)
 
-        arcpy.Delete_management(in_data=oa_lyr)
         arcpy.Delete_management(in_data=gar_lyr)
 
         # Merging cells together as needed
@@ -609,36 +615,46 @@ class GARAnalysis:
         self.logger.info('Setting extent')
         arcpy.env.extent = arcpy.Describe(value=self.fc_gar_cells).extent
 
-        # Copy the vri and clip to the aoi
-        self.logger.info('Copying vri')
+        # Select the vri that intersects the aoi and clip the selection straight to the gar cells
+        self.logger.info('Clipping vri to gar cells')
         gar_lyr = arcpy.MakeFeatureLayer_management(in_features=self.fc_gar_cells, out_layer='gar_lyr')
         vri_lyr = arcpy.MakeFeatureLayer_management(in_features=self.__vri, out_layer='vri_lyr')
         arcpy.SelectLayerByLocation_management(in_layer=vri_lyr, overlap_type='INTERSECT', select_features=gar_lyr)
-        arcpy.CopyFeatures_management(in_features=vri_lyr, out_feature_class=self.fc_vri)
+        try:
+            # Pairwise clip runs the clip work across all cores
+            arcpy.analysis.PairwiseClip(in_features=vri_lyr, clip_features=self.fc_gar_cells,
+                                        out_feature_class=self.fc_vri_clip)
+        except (ValueError, Exception):
+            arcpy.Clip_analysis(in_features=vri_lyr, clip_features=self.fc_gar_cells,
+                                out_feature_class=self.fc_vri_clip)
         arcpy.Delete_management(in_data=vri_lyr)
 
-        self.logger.info('Clipping vri to gar cells')
-        arcpy.Clip_analysis(in_features=self.fc_vri, clip_features=self.fc_gar_cells,
-                            out_feature_class=self.fc_vri_clip)
-
-        # Copy the rest of the inputs, creating subsets where required
-        for gar_input in self.dict_gar_inputs:
-            if gar_input.startswith('private_land'):
-                if self.dict_gar_inputs[gar_input].path != self.gar_class.gar_config.private_land:
-                    continue
-            if self.dict_gar_inputs[gar_input].mandatory or \
-                    self.dict_gar_inputs[gar_input].output in self.gar_class.gar_config.erase_fcs or \
-                    self.dict_gar_inputs[gar_input].output in self.gar_class.gar_config.identity_fcs:
-                self.logger.info('Copying {0}'.format(gar_input))
-                input_lyr = arcpy.MakeFeatureLayer_management(in_features=self.dict_gar_inputs[gar_input].path,
-                                                              out_layer='input_lyr',
-                                                              where_clause=self.dict_gar_inputs[gar_input].sql)
-                arcpy.SelectLayerByLocation_management(in_layer=input_lyr, overlap_type='INTERSECT',
-                                                       select_features=gar_lyr)
-                arcpy.CopyFeatures_management(in_features=input_lyr,
-                                              out_feature_class=self.dict_gar_inputs[gar_input].output)
-                arcpy.Delete_management(in_data=input_lyr)
+        # Copy the rest of the inputs, creating subsets where required. Cached extracts are keyed by the gar and the
+        # cell geometry so a cached subset is only reused for the same cells
+        cells_hash = hashlib.sha1()
+        with arcpy.da.SearchCursor(self.fc_gar_cells, ['SHAPE@WKB']) as s_cursor:
+            for row in s_cursor:
+                cells_hash.update(bytes(row[0] or b''))
+        key_suffix = '{0}|{1}'.format(self.gar, cells_hash.hexdigest())
+
+        lst_extract = []
+        gar_config = self.gar_class.gar_config
+        set_required = set(gar_config.erase_fcs) | set(gar_config.identity_fcs)
+        for name, gar_input in self.dict_gar_inputs.items():
+            if name.startswith('private_land') and gar_input.path != gar_config.private_land:
+                continue
+            if gar_input.mandatory or gar_input.output in set_required:
+                cached_fc = None
+                if not self.is_rebuilt(gar_input=gar_input):
+                    cached_fc = get_cached(gar_input=gar_input, cache_gdb=self.cache_gdb, key_suffix=key_suffix,
+                                           ttl_days=self.cache_ttl_days)
+                if cached_fc:
+                    self.logger.info('Copying {0} from cache'.format(name))
+                    arcpy.CopyFeatures_management(in_features=cached_fc, out_feature_class=gar_input.output)
+                else:
+                    lst_extract.append(name)
 
+        self.extract_inputs(lst_extract=lst_extract, select_features=gar_lyr, key_suffix=key_suffix)
         arcpy.Delete_management(in_data=gar_lyr)
 
         # Add in burn severity if required for the selected gar
@@ -656,27 +672,86 @@ class GARAnalysis:
         arcpy.Merge_management(inputs=self.gar_class.gar_config.erase_fcs, output=self.fc_erase_features)
 
         self.logger.info('Erasing features from gar cells')
-        arcpy.Erase_analysis(in_features=self.fc_gar_cells, erase_features=self.fc_erase_features,
-                             out_feature_class=self.fc_gar_cells_erase)
+        arcpy.analysis.PairwiseErase(in_features=self.fc_gar_cells, erase_features=self.fc_erase_features,
+                                     out_feature_class=self.fc_gar_cells_erase)
 
         # Creating the road right of ways
         self.logger.info('Creating road right of ways')
         arcpy.Merge_management(inputs=[self.fc_mot_roads, self.fc_ften_roads], output=self.fc_road_merge)
-        arcpy.Buffer_analysis(in_features=self.fc_road_merge, out_feature_class=self.fc_road_buffer,
-                              buffer_distance_or_field='10 Meters', dissolve_option='NONE')
-        arcpy.AddField_management(in_table=self.fc_road_buffer, field_name=self.fld_road_buffer,
+        # Buffer and dissolve in one pass, then split back into single part right of ways and tag them
+        arcpy.analysis.PairwiseBuffer(in_features=self.fc_road_merge, out_feature_class=self.fc_road_buffer,
+                                      buffer_distance_or_field='10 Meters', dissolve_option='ALL')
+        arcpy.MultipartToSinglepart_management(in_features=self.fc_road_buffer, out_feature_class=self.fc_road_dissolve)
+        arcpy.AddField_management(in_table=self.fc_road_dissolve, field_name=self.fld_road_buffer,
                                   field_type='TEXT', field_length=3)
-        with arcpy.da.UpdateCursor(self.fc_road_buffer, self.fld_road_buffer) as u_cursor:
-            for row in u_cursor:
-                row[0] = 'YES'
-                u_cursor.updateRow(row)
-        arcpy.Dissolve_management(in_features=self.fc_road_buffer, out_feature_class=self.fc_road_dissolve,
-                                  dissolve_field=self.fld_road_buffer, multi_part='SINGLE_PART')
+        arcpy.CalculateField_management(in_table=self.fc_road_dissolve, field=self.fld_road_buffer,
+                                        expression='\'YES\'', expression_type='PYTHON3')
         
         #Creating Recent Harvest Area to account for harvest areas not yet populated by VRI - added by Daniel Otto March 24, 2025
         if self.gar == 'section-7':
             self.logger.info('Creating Recent Harvest Area')
 
+    def is_rebuilt(self, gar_input):
+        """
+        Function:
+            Checks if the source of an input was rebuilt during this run, in which case any cached extract of it is
+            out of date
+        Args:
+            gar_input (GARInput): input class object
+
+        Returns:
+            bool: True if the input source was rebuilt during this run
+        """
+        return self.run_cc and gar_input.path == self.__consolidated_cb
+
+    def extract_inputs(self, lst_extract, select_features, key_suffix):
+        """
+        Function:
+            Extracts the inputs that were not found in the cache; each input is an independent select and copy so
+            they are run in a process pool with each worker writing to its own geodatabase, falling back to a
+            sequential extract if the pool cannot be started
+        Args:
+            lst_extract (list): names of the gar inputs to extract
+            select_features (Layer): gar cell layer used to select the input subsets
+            key_suffix (str): cache key text identifying the gar and its cell geometry
+
+        Returns:
+            None
+        """
+        if not lst_extract:
+            return
+
+        # Inside ArcGIS Pro the executable is the application itself, workers need to be started with python
+        if not os.path.basename(sys.executable).lower().startswith('python'):
+            multiprocessing.set_executable(os.path.join(sys.exec_prefix, 'python.exe'))
+
+        worker_folder = os.path.dirname(self.scratch_gdb)
+        max_workers = min(len(lst_extract), os.cpu_count() or 1, 8)
+        self.logger.info('Copying {0}'.format(', '.join(lst_extract)))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                dict_futures = {
+                    gar_input: executor.submit(extract_worker, gar_input, self.dict_gar_inputs[gar_input].path,
+                                               self.dict_gar_inputs[gar_input].sql, self.fc_gar_cells, worker_folder)
+                    for gar_input in lst_extract
+                }
+                for gar_input, future in dict_futures.items():
+                    worker_fc = future.result()
+                    arcpy.CopyFeatures_management(in_features=worker_fc,
+                                                  out_feature_class=self.dict_gar_inputs[gar_input].output)
+                    arcpy.Delete_management(in_data=os.path.dirname(worker_fc))
+                    add_to_cache(gar_input=self.dict_gar_inputs[gar_input], cache_gdb=self.cache_gdb,
+                                 key_suffix=key_suffix, ttl_days=self.cache_ttl_days)
+                    lst_extract = [g for g in lst_extract if g != gar_input]
+        except (ValueError, Exception):
+            self.logger.warning('...Parallel copy failed, copying remaining inputs one at a time')
+
+        for gar_input in lst_extract:
+            self.logger.info('Copying {0}'.format(gar_input))
+            get_or_extract(gar_input=self.dict_gar_inputs[gar_input], select_features=select_features,
+                           cache_gdb=self.cache_gdb, key_suffix=key_suffix, ttl_days=self.cache_ttl_days,
+                           logger=self.logger, use_cached=not self.is_rebuilt(self.dict_gar_inputs[gar_input]))
+
     def add_burn_severity(self):
         """
         Function:
@@ -692,35 +767,44 @@ class GARAnalysis:
                                 schema_type='NO_TEST')
 
         # If there are no fires found in both this year and last year, then return
-        if int(arcpy.GetCount_management(in_rows=self.fc_fire_perimeters).getOutput(0)) == 0:
+        if not has_rows(in_rows=self.fc_fire_perimeters):
             self.logger.warning('No fires found within area of interest')
             # self.gar_class.gar_config.erase_fcs.remove(self.fc_burn_areas)
             return
 
-        fire_bs = os.path.join(self.scratch_gdb, 'fire_burn')
-        vri_burn = os.path.join(self.scratch_gdb, 'vri_burn')
+        vri_burn = os.path.join('memory', 'vri_burn')
+        vri_where = 'FID_{0} <> -1'.format(os.path.basename(self.fc_vri_clip))
         lst_fields = [self.fld_line_7_activity, self.fld_line_7b_dist_hist, self.fld_fire_version,
-                      self.fld_burn_severity, self.fld_fire_area, self.fld_fire_number, 'SHAPE@', self.fld_proj_age,
-                      self.fld_proj_height, self.fld_proj_date]
-
-        # Combine the fire perimeters, burn severity and vri
-        arcpy.Identity_analysis(in_features=self.fc_fire_perimeters, identity_features=self.fc_burn_severity,
-                                out_feature_class=fire_bs)
-        arcpy.Identity_analysis(in_features=self.fc_vri_clip, identity_features=fire_bs, out_feature_class=vri_burn)
+                      self.fld_proj_age, self.fld_proj_height, self.fld_proj_date]
+        # Field positions are looked up once rather than scanning the field list for every value of every row
+        dict_idx = {fld: i for i, fld in enumerate(lst_fields)}
 
-        # Loop through the resultant and find areas that need age and height adjusted to zero
-        with arcpy.da.UpdateCursor(vri_burn, lst_fields) as u_cursor:
+        # Combine the vri, fire perimeters and burn severity in a single overlay; parts outside the vri are dropped
+        # by the vri id filter below and when the result is written back. A union of more than two inputs needs an
+        # Advanced license, so fall back to the fire -> burn severity -> vri identity chain when it is not available
+        try:
+            arcpy.Union_analysis(in_features=[self.fc_vri_clip, self.fc_fire_perimeters, self.fc_burn_severity],
+                                 out_feature_class=vri_burn, join_attributes='ALL')
+        except (ValueError, Exception):
+            self.logger.warning('Union of vri, fires and burn severity failed; running the identity chain')
+            fire_bs = os.path.join('memory', 'fire_burn')
+            arcpy.Identity_analysis(in_features=self.fc_fire_perimeters, identity_features=self.fc_burn_severity,
+                                    out_feature_class=fire_bs)
+            arcpy.Identity_analysis(in_features=self.fc_vri_clip, identity_features=fire_bs,
+                                    out_feature_class=vri_burn)
+            arcpy.Delete_management(in_data=fire_bs)
+
+        # Only burned vri polygons that need adjusting are read: those with a fire number that are either under 100
+        # hectares with no burn severity value (assumed High) or have a Medium or High burn severity
+        where_clause = "{0} AND {1} <> '' AND (({2} < 100 AND ({3} IS NULL OR {3} = '')) OR {3} IN ('Medium', " \
+                       "'High'))".format(vri_where, self.fld_fire_number, self.fld_fire_area, self.fld_burn_severity)
+
+        # Loop through the burned areas and adjust age and height to zero and the projected date to the fire year
+        with arcpy.da.UpdateCursor(vri_burn, lst_fields, where_clause=where_clause) as u_cursor:
             for row in u_cursor:
-                line_7 = row[lst_fields.index(self.fld_line_7_activity)]
-                line_7b = str(row[lst_fields.index(self.fld_line_7b_dist_hist)])
-                fire_version = row[lst_fields.index(self.fld_fire_version)]
-                fire_burn_severity = row[lst_fields.index(self.fld_burn_severity)]
-                fire_area = row[lst_fields.index(self.fld_fire_area)]
-                fire_year = int(str(fire_version)[:4])
-                fire_num = row[lst_fields.index(self.fld_fire_number)]
-                proj_date = row[lst_fields.index(self.fld_proj_date)]
-                if fire_num == '':  # If there is no fire number, skip this row
-                    continue
+                line_7 = row[dict_idx[self.fld_line_7_activity]]
+                line_7b = str(row[dict_idx[self.fld_line_7b_dist_hist]])
+                fire_year = int(str(row[dict_idx[self.fld_fire_version]])[:4])
                 if line_7 == '$':  # If there is a disturbance identified in the vri layer
                     if line_7b.startswith('B'):  # If the disturbance is a fire
                         dist_year = line_7b[-2:]
@@ -728,26 +812,13 @@ class GARAnalysis:
                         # then it's already accounted for in the vri, skip this row
                         if dist_year == str(fire_year)[-2:]:
                             continue
-                if fire_area < 100:  # If the fire area is less than 100 hectares
-                    # If there is no burn severity value, then assume it's High and adjust age, height and date
-                    if not fire_burn_severity:
-                        row[lst_fields.index(self.fld_proj_age)] = 0
-                        row[lst_fields.index(self.fld_proj_height)] = 0
-                        new_date = proj_date.replace(year=fire_year)
-                        row[lst_fields.index(self.fld_proj_date)] = new_date
-                        u_cursor.updateRow(row)
-                        continue
-                # If the burn severity is Medium or High adjust age, height and date
-                if fire_burn_severity in ['Medium', 'High']:
-                    row[lst_fields.index(self.fld_proj_age)] = 0
-                    row[lst_fields.index(self.fld_proj_height)] = 0
-                    new_date = proj_date.replace(year=fire_year)
-                    row[lst_fields.index(self.fld_proj_date)] = new_date
-                    u_cursor.updateRow(row)
-                    continue
+                row[dict_idx[self.fld_proj_age]] = 0
+                row[dict_idx[self.fld_proj_height]] = 0
+                proj_date = row[dict_idx[self.fld_proj_date]]
+                row[dict_idx[self.fld_proj_date]] = proj_date.replace(year=fire_year)
+                u_cursor.updateRow(row)
 
-        arcpy.CopyFeatures_management(in_features=vri_burn, out_feature_class=self.fc_vri_clip)
-        arcpy.Delete_management(in_data=fire_bs)
+        arcpy.Select_analysis(in_features=vri_burn, out_feature_class=self.fc_vri_clip, where_clause=vri_where)
         arcpy.Delete_management(in_data=vri_burn)
 
     def add_sic_replacement(self):
@@ -773,11 +844,12 @@ class GARAnalysis:
         fld_perc6 = 'SPECIES_PCT_6'
         fld_survey_date = 'SURVEY_DATE'
 
-        dict_replacement = defaultdict(SICReplacement)
+        dict_replacement = {}
 
         lst_fields = ['OID@',fld_bec_zone, fld_bec_subzone, fld_bec_var, fld_age, fld_dbh, fld_height, fld_crown,
                       fld_slope, fld_spec1, fld_perc1, fld_spec2, fld_perc2, fld_spec3, fld_perc3, fld_spec4, fld_perc4,
                       fld_spec5, fld_perc5, fld_spec6, fld_perc6, fld_survey_date]
+        dict_idx = {fld: i for i, fld in enumerate(lst_fields)}
 
         self.logger.info('Copying SIC replacement areas')
         arcpy.CopyFeatures_management(in_features=self.__sic_replacement, out_feature_class=self.fc_sic_replacement)
@@ -785,30 +857,20 @@ class GARAnalysis:
         self.logger.info('Reading in replacement values')
         with arcpy.da.SearchCursor(self.fc_sic_replacement, lst_fields) as s_cursor:
             for row in s_cursor:
-                oid = row[lst_fields.index('OID@')]
-                dict_replacement[oid].zone = row[lst_fields.index(fld_bec_zone)]
-                dict_replacement[oid].sub = row[lst_fields.index(fld_bec_subzone)]
-                dict_replacement[oid].var = row[lst_fields.index(fld_bec_var)]
-                dict_replacement[oid].age = row[lst_fields.index(fld_age)]
-                dict_replacement[oid].dbh = row[lst_fields.index(fld_dbh)]
-                dict_replacement[oid].hgt = row[lst_fields.index(fld_height)]
-                dict_replacement[oid].cc = row[lst_fields.index(fld_crown)]
-                dict_replacement[oid].slp = '80+' if row[lst_fields.index(fld_slope)] >= 80 else None
-                dict_replacement[oid].sp1 = row[lst_fields.index(fld_spec1)]
-                dict_replacement[oid].per1 = row[lst_fields.index(fld_perc1)]
-                dict_replacement[oid].sp2 = row[lst_fields.index(fld_spec2)]
-                dict_replacement[oid].per2 = row[lst_fields.index(fld_perc2)]
-                dict_replacement[oid].sp3 = row[lst_fields.index(fld_spec3)]
-                dict_replacement[oid].per3 = row[lst_fields.index(fld_perc3)]
-                dict_replacement[oid].sp4 = row[lst_fields.index(fld_spec4)]
-                dict_replacement[oid].per4 = row[lst_fields.index(fld_perc4)]
-                dict_replacement[oid].sp5 = row[lst_fields.index(fld_spec5)]
-                dict_replacement[oid].per5 = row[lst_fields.index(fld_perc5)]
-                dict_replacement[oid].sp6 = row[lst_fields.index(fld_spec6)]
-                dict_replacement[oid].per6 = row[lst_fields.index(fld_perc6)]
-                dict_replacement[oid].survey_dt = row[lst_fields.index(fld_survey_date)]
-
-        vri_sic = os.path.join(self.scratch_gdb, 'vri_sic')
+                dict_replacement[row[dict_idx['OID@']]] = SICReplacement(
+                    zone=row[dict_idx[fld_bec_zone]], sub=row[dict_idx[fld_bec_subzone]],
+                    var=row[dict_idx[fld_bec_var]], age=row[dict_idx[fld_age]], dbh=row[dict_idx[fld_dbh]],
+                    hgt=row[dict_idx[fld_height]], cc=row[dict_idx[fld_crown]],
+                    slp='80+' if row[dict_idx[fld_slope]] >= 80 else None,
+                    sp1=row[dict_idx[fld_spec1]], per1=row[dict_idx[fld_perc1]],
+                    sp2=row[dict_idx[fld_spec2]], per2=row[dict_idx[fld_perc2]],
+                    sp3=row[dict_idx[fld_spec3]], per3=row[dict_idx[fld_perc3]],
+                    sp4=row[dict_idx[fld_spec4]], per4=row[dict_idx[fld_perc4]],
+                    sp5=row[dict_idx[fld_spec5]], per5=row[dict_idx[fld_perc5]],
+                    sp6=row[dict_idx[fld_spec6]], per6=row[dict_idx[fld_perc6]],
+                    survey_dt=row[dict_idx[fld_survey_date]])
+
+        vri_sic = os.path.join('memory', 'vri_sic')
         arcpy.Identity_analysis(in_features=self.fc_gar_cells_identity, identity_features=self.fc_sic_replacement,
                                 out_feature_class=vri_sic, join_attributes='ONLY_FID')
         fld_oid = 'FID_sic_replacement'
@@ -819,37 +881,26 @@ class GARAnalysis:
                       self.fld_species_5, self.fld_percent_5, self.fld_species_6, self.fld_percent_6,
                       self.fld_proj_date]
 
-        if self.fld_slope in [field.name for field in arcpy.ListFields(vri_sic)]:
+        set_fields = {field.name for field in arcpy.ListFields(dataset=vri_sic)}
+        b_slope = self.fld_slope in set_fields
+        if b_slope:
             lst_fields.append(self.fld_slope)
 
+        # Build the replacement values of each SIC area once, in the same order as the update fields after the id
+        dict_values = {}
+        for oid, sic in dict_replacement.items():
+            lst_values = ['{0} {1} {2}'.format(sic.zone, sic.sub, sic.var), sic.age, sic.dbh, sic.hgt, sic.cc,
+                          sic.sp1, sic.per1, sic.sp2, sic.per2, sic.sp3, sic.per3, sic.sp4, sic.per4, sic.sp5, sic.per5,
+                          sic.sp6, sic.per6, sic.survey_dt]
+            if b_slope:
+                lst_values.append(sic.slp)
+            dict_values[oid] = lst_values
+
         self.logger.info('Replacing values in vri')
         where_clause = '{0} <> -1'.format(fld_oid)
         with arcpy.da.UpdateCursor(vri_sic, lst_fields, where_clause=where_clause) as u_cursor:
             for row in u_cursor:
-                oid = row[lst_fields.index(fld_oid)]
-                row[lst_fields.index(self.fld_bec)] = \
-                    '{0} {1} {2}'.format(dict_replacement[oid].zone, dict_replacement[oid].sub,
-                                         dict_replacement[oid].var)
-                row[lst_fields.index(self.fld_proj_age)] = dict_replacement[oid].age
-                row[lst_fields.index(self.fld_diameter)] = dict_replacement[oid].dbh
-                row[lst_fields.index(self.fld_proj_height)] = dict_replacement[oid].hgt
-                row[lst_fields.index(self.fld_crown_closure)] = dict_replacement[oid].cc
-                if self.fld_slope in lst_fields:
-                    row[lst_fields.index(self.fld_slope)] = dict_replacement[oid].slp
-                row[lst_fields.index(self.fld_species)] = dict_replacement[oid].sp1
-                row[lst_fields.index(self.fld_percent)] = dict_replacement[oid].per1
-                row[lst_fields.index(self.fld_species_2)] = dict_replacement[oid].sp2
-                row[lst_fields.index(self.fld_percent_2)] = dict_replacement[oid].per2
-                row[lst_fields.index(self.fld_species_3)] = dict_replacement[oid].sp3
-                row[lst_fields.index(self.fld_percent_3)] = dict_replacement[oid].per3
-                row[lst_fields.index(self.fld_species_4)] = dict_replacement[oid].sp4
-                row[lst_fields.index(self.fld_percent_4)] = dict_replacement[oid].per4
-                row[lst_fields.index(self.fld_species_5)] = dict_replacement[oid].sp5
-                row[lst_fields.index(self.fld_percent_5)] = dict_replacement[oid].per5
-                row[lst_fields.index(self.fld_species_6)] = dict_replacement[oid].sp6
-                row[lst_fields.index(self.fld_percent_6)] = dict_replacement[oid].per6
-                row[lst_fields.index(self.fld_proj_date)] = dict_replacement[oid].survey_dt
-                u_cursor.updateRow(row)
+                u_cursor.updateRow([row[0]] + dict_values[row[0]])
 
         arcpy.CopyFeatures_management(in_features=vri_sic, out_feature_class=self.fc_gar_cells_identity)
         arcpy.Delete_management(in_data=vri_sic)
@@ -867,45 +918,49 @@ class GARAnalysis:
 
         # Dissolving gar cells into singlepart features and add in id field
         self.logger.info('Merging cells')
-        temp_fc = os.path.join(self.scratch_gdb, 'temp_fc')
-        arcpy.Dissolve_management(in_features=self.fc_gar_cells, out_feature_class=temp_fc, multi_part='SINGLE_PART')
+        temp_fc = os.path.join('memory', 'temp_fc')
+        arcpy.analysis.PairwiseDissolve(in_features=self.fc_gar_cells, out_feature_class=temp_fc,
+                                        multi_part='SINGLE_PART')
         arcpy.AddField_management(in_table=temp_fc, field_name=self.gar_class.gar_config.cell_field,
                                   field_type='TEXT', field_length=200)
 
 
-        arcpy.MultipartToSinglepart_management(in_features=self.fc_gar_cells, out_feature_class='singlepart_fc')
+        singlepart_fc = os.path.join('memory', 'singlepart_fc')
+        arcpy.MultipartToSinglepart_management(in_features=self.fc_gar_cells, out_feature_class=singlepart_fc)
 
-        # Create a new dictionary
+        # Create a new dictionary of cell id to shape and the shape's extent
         temp_dict = {}
 
         # Iterate over the features
-        with arcpy.da.SearchCursor('singlepart_fc', [self.gar_class.gar_config.cell_field, 'SHAPE@']) as s_cursor:
+        with arcpy.da.SearchCursor(singlepart_fc, [self.gar_class.gar_config.cell_field, 'SHAPE@']) as s_cursor:
             for row in s_cursor:
                 # Check the area of the feature
                 if row[1].getArea('PLANAR', 'SQUAREMETERS') >= 1000:
                     # If the area is 1000 or more, add it to the dictionary
-                    temp_dict[row[0]] = row[1]
-
+                    ext = row[1].extent
+                    temp_dict[row[0]] = (row[1], (ext.XMin, ext.YMin, ext.XMax, ext.YMax))
 
         # Loop through the records in the dissolved feature class creating strings of ids if they overlap
-        # with the shapes in the original gar cell dictionary
+        # with the shapes in the original gar cell dictionary. A cell can only be contained by a dissolved feature
+        # whose extent holds the cell's extent, so the geometry test is only run on those cells
         with arcpy.da.UpdateCursor(temp_fc, [self.gar_class.gar_config.cell_field, 'SHAPE@']) as u_cursor:
             for row in u_cursor:
                 if row[1].getArea('PLANAR', 'SQUAREMETERS') < 1000:
                     # If the area is less than 1000, delete the feature
                     u_cursor.deleteRow()
                 else:
-                    str_id = ''
-                    arcpy.AddMessage("Before checking contains: " + str_id)  # Print str_id before the loop
-                    for obj in temp_dict.keys():
-                        if row[1].contains(temp_dict[obj]):
-                            str_id += '{}, '.format(obj)
-                    arcpy.AddMessage("After checking contains: " + str_id)  # Print str_id after the loop
-                    row[0] = str_id[:-2] if str_id != '' else str_id
+                    ext = row[1].extent
+                    x_min, y_min, x_max, y_max = ext.XMin, ext.YMin, ext.XMax, ext.YMax
+                    lst_ids = [str(obj) for obj, (shp, bbox) in temp_dict.items()
+                               if bbox[0] >= x_min and bbox[1] >= y_min and bbox[2] <= x_max and bbox[3] <= y_max
+                               and row[1].contains(shp)]
+                    row[0] = ', '.join(lst_ids)
                     u_cursor.updateRow(row)
 
         # Overwrite the input gar cells with the dissolved features
         arcpy.CopyFeatures_management(in_features=temp_fc, out_feature_class=self.fc_gar_cells)
+        for fc in [temp_fc, singlepart_fc]:
+            arcpy.Delete_management(in_data=fc)
 
     def create_broadleaf_stand_layer(self):
         """
@@ -914,40 +969,31 @@ class GARAnalysis:
         Returns:
             None
         """
-        # Copy the vri
+        # Copy the broadleaf (TB) and mixed (TM) stands from the vri; every other land class is excluded
         fld_broadleaf_percent = 'Broadleaf_Percent'
         fld_bclcs_4 = 'BCLCS_LEVEL_4'
-        arcpy.CopyFeatures_management(self.fc_vri_clip, self.fc_broadleaf_stands)
+        arcpy.Select_analysis(in_features=self.fc_vri_clip, out_feature_class=self.fc_broadleaf_stands,
+                              where_clause='{0} IN (\'TB\', \'TM\')'.format(fld_bclcs_4))
         arcpy.AddField_management(self.fc_broadleaf_stands, fld_broadleaf_percent, 'SHORT')
 
-        layer_list = [fld_bclcs_4, fld_broadleaf_percent]
+        layer_list = [fld_broadleaf_percent]
         for i in range(1, 7):
             layer_list.append('SPECIES_CD_{0}'.format(i))
             layer_list.append('SPECIES_PCT_{0}'.format(i))
 
-        with arcpy.da.UpdateCursor(self.fc_broadleaf_stands, layer_list) as u_cursor:
+        # TM land class must be over 50% of deciduous leading
+        with arcpy.da.UpdateCursor(self.fc_broadleaf_stands, layer_list,
+                                   where_clause='{0} = \'TM\''.format(fld_bclcs_4)) as u_cursor:
             for row in u_cursor:
-                land_class = row[layer_list.index('BCLCS_LEVEL_4')]
-
-                if land_class == 'TB':
-                    # do nothing
-                    pass
-                elif land_class == 'TM':
-                    # TM land class must be over 50% of deciduous leading
-                    percent = 0
-                    for num in range(1, 7):
-                        spp = row[layer_list.index('SPECIES_CD_' + str(num))]
-                        pct = row[layer_list.index('SPECIES_PCT_' + str(num))]
-                        if spp:
-                            if spp.startswith('A') or spp.startswith('E') or spp in ['DR', 'MB']:
-                                percent += pct
-                    if percent <= 50:
-                        u_cursor.deleteRow()
-                    else:
-                        row[layer_list.index(fld_broadleaf_percent)] = percent
-                        u_cursor.updateRow(row)
-                else:
+                percent = 0
+                for spp, pct in zip(row[1::2], row[2::2]):
+                    if spp and (spp.startswith(('A', 'E')) or spp in ('DR', 'MB')):
+                        percent += pct
+                if percent <= 50:
                     u_cursor.deleteRow()
+                else:
+                    row[0] = percent
+                    u_cursor.updateRow(row)
 
     def identity_gar(self):
         """
@@ -956,28 +1002,41 @@ class GARAnalysis:
         Returns:
             None
         """
+        # Layers with polygons over the vertex limit are what break the overlay, so they skip the single union and go
+        # straight to the per layer identity, diced up front
+        set_complex = set(fc for fc in self.gar_class.gar_config.identity_fcs
+                          if self.exceeds_vertex_limit(in_fc=fc, vertex_limit=10000))
+
+        # Overlay all of the identity features in one pass, falling back to the per layer identity if it fails
+        if not set_complex and self.union_identity():
+            return
+
         input_fc = self.fc_gar_cells_erase
-        output_fc = os.path.join(self.scratch_gdb, 'temp_output')
+        temp_output = os.path.join(self.scratch_gdb, 'temp_output')
         temp_input = os.path.join(self.scratch_gdb, 'temp_input')
+        output_fc = temp_output
         dice_temp = os.path.join(self.scratch_gdb, 'dice_temp')
         subdivide_poly = os.path.join(self.scratch_gdb, 'subdivide_poly')
 
         # Loop through the identity features in the configuration for the gar
         for ident_lyr in self.gar_class.gar_config.identity_fcs:
             self.logger.info('Adding {0} to gar cells'.format(os.path.basename(ident_lyr)))
+            # Dice layers holding very large polygons up front rather than waiting for the identity to fail on them
+            b_diced = ident_lyr in set_complex
+            if b_diced:
+                self.logger.info('...Layer contains polygons over 10000 vertices, dicing')
+                arcpy.Dice_management(in_features=ident_lyr, out_feature_class=dice_temp, vertex_limit=10000)
             try:
                 # Try running the Identity tool
-                arcpy.Identity_analysis(in_features=input_fc, identity_features=ident_lyr,
+                arcpy.Identity_analysis(in_features=input_fc, identity_features=dice_temp if b_diced else ident_lyr,
                                         out_feature_class=output_fc, join_attributes='NO_FID')
 
             except (ValueError, Exception):
                 try:
-                    # If the Identity tool fails (often due to memory issues) run Dice on the features and try again
-                    self.logger.warning('...File too large, dicing')
-                    arcpy.Dice_management(in_features=ident_lyr, out_feature_class=dice_temp, vertex_limit=10000)
-                    self.logger.info('...Attempting identity again')
-                    arcpy.Identity_analysis(in_features=input_fc, identity_features=dice_temp,
-                                            out_feature_class=output_fc, join_attributes='NO_FID')
+                    # If the Identity tool fails (often due to memory issues) run it again one tile at a time
+                    self.logger.warning('...File too large, running identity by tile')
+                    self.tiled_identity(input_fc=input_fc, ident_fc=dice_temp if b_diced else ident_lyr,
+                                        output_fc=output_fc)
                 except (ValueError, Exception):
                     try:
                         # If the Identity fails again, subdivide the polygons, dice, then identity again
@@ -993,14 +1052,114 @@ class GARAnalysis:
                     except (ValueError, Exception):
                         self.logger.error(traceback.format_exc())
                         return
-            arcpy.CopyFeatures_management(in_features=output_fc, out_feature_class=temp_input)
-            input_fc = temp_input
+            # The next layer reads this output directly; the two scratch outputs swap roles instead of copying
+            input_fc, output_fc = output_fc, temp_input if output_fc != temp_input else temp_output
 
-        arcpy.CopyFeatures_management(in_features=output_fc, out_feature_class=self.fc_gar_cells_identity)
-        for lyr in [dice_temp, subdivide_poly, output_fc, temp_input]:
+        arcpy.CopyFeatures_management(in_features=input_fc, out_feature_class=self.fc_gar_cells_identity)
+        for lyr in [dice_temp, subdivide_poly, temp_output, temp_input]:
             if arcpy.Exists(lyr):
                 arcpy.Delete_management(in_data=lyr)
 
+    def tiled_identity(self, input_fc, ident_fc, output_fc, tile_count=4):
+        """
+        Function:
+            Splits the extent of the input into a grid of tiles and runs the identity one tile at a time so each run
+            only has to index the identity features inside its tile; the tile outputs are merged into the output
+        Args:
+            input_fc (str): path to the input feature class
+            ident_fc (str): path to the identity feature class
+            output_fc (str): path to the output feature class
+            tile_count (int): number of rows and columns in the tile grid
+
+        Returns:
+            None
+        """
+        tiles = os.path.join(self.scratch_gdb, 'identity_tiles')
+        tile_input = os.path.join(self.scratch_gdb, 'tile_input')
+        tile_ident = os.path.join(self.scratch_gdb, 'tile_ident')
+        ext = arcpy.Describe(value=input_fc).extent
+        arcpy.CreateFishnet_management(out_feature_class=tiles, origin_coord='{0} {1}'.format(ext.XMin, ext.YMin),
+                                       y_axis_coord='{0} {1}'.format(ext.XMin, ext.YMin + 10), cell_width=0,
+                                       cell_height=0, number_rows=tile_count, number_columns=tile_count,
+                                       corner_coord='{0} {1}'.format(ext.XMax, ext.YMax), labels='NO_LABELS',
+                                       geometry_type='POLYGON')
+        lst_outputs = []
+        with arcpy.da.SearchCursor(tiles, ['OID@', 'SHAPE@']) as s_cursor:
+            for oid, tile in s_cursor:
+                arcpy.analysis.PairwiseClip(in_features=input_fc, clip_features=tile, out_feature_class=tile_input)
+                if not has_rows(tile_input):
+                    continue
+                self.logger.info('...Tile {0} of {1}'.format(oid, tile_count * tile_count))
+                arcpy.analysis.PairwiseClip(in_features=ident_fc, clip_features=tile, out_feature_class=tile_ident)
+                tile_output = os.path.join(self.scratch_gdb, 'tile_identity_{0}'.format(oid))
+                arcpy.Identity_analysis(in_features=tile_input, identity_features=tile_ident,
+                                        out_feature_class=tile_output, join_attributes='NO_FID')
+                lst_outputs.append(tile_output)
+
+        arcpy.Merge_management(inputs=lst_outputs, output=output_fc)
+        for fc in [tiles, tile_input, tile_ident] + lst_outputs:
+            if arcpy.Exists(fc):
+                arcpy.Delete_management(in_data=fc)
+
+    @staticmethod
+    def exceeds_vertex_limit(in_fc, vertex_limit):
+        """
+        Function:
+            Checks if any polygon in a feature class has more vertices than the limit; stops at the first one found
+        Args:
+            in_fc (str): path to the feature class
+            vertex_limit (int): maximum number of vertices allowed in a polygon
+
+        Returns:
+            bool: True if a polygon exceeds the vertex limit
+        """
+        with arcpy.da.SearchCursor(in_fc, ['SHAPE@']) as s_cursor:
+            return any(row[0] and row[0].pointCount > vertex_limit for row in s_cursor)
+
+    def union_identity(self):
+        """
+        Function:
+            Overlays the gar cells with all of the identity features in a single Union and keeps only the parts that
+            fall within the gar cells, giving the same result as running Identity once per layer; each identity
+            layer is clipped to the gar cells first so the Union only builds topology where the cells are
+        Returns:
+            bool: True if the overlay succeeded, False if the per layer identity needs to be run instead
+        """
+        union_fc = os.path.join('memory', 'union_temp')
+        lst_inputs = [self.fc_gar_cells_erase]
+        lst_clip = []
+        fld_fid = 'FID_{0}'.format(os.path.basename(self.fc_gar_cells_erase))
+
+        self.logger.info('Adding {0} to gar cells'.format(
+            ', '.join(os.path.basename(fc) for fc in self.gar_class.gar_config.identity_fcs)))
+        try:
+            for i, ident_lyr in enumerate(self.gar_class.gar_config.identity_fcs):
+                if ident_lyr == self.fc_vri_clip:
+                    lst_inputs.append(ident_lyr)
+                    continue
+                clip_fc = os.path.join('memory', 'union_clip_{0}'.format(i))
+                arcpy.analysis.PairwiseClip(in_features=ident_lyr, clip_features=self.fc_gar_cells_erase,
+                                            out_feature_class=clip_fc)
+                lst_clip.append(clip_fc)
+                lst_inputs.append(clip_fc)
+            arcpy.Union_analysis(in_features=lst_inputs, out_feature_class=union_fc, join_attributes='ALL')
+            arcpy.Select_analysis(in_features=union_fc, out_feature_class=self.fc_gar_cells_identity,
+                                  where_clause='{0} <> -1'.format(fld_fid))
+        except (ValueError, Exception):
+            self.logger.warning('...Union failed, adding features one at a time')
+            return False
+        finally:
+            for fc in [union_fc] + lst_clip:
+                if arcpy.Exists(fc):
+                    arcpy.Delete_management(in_data=fc)
+
+        # Drop the FID fields so the schema matches the NO_FID identity output
+        lst_fid = ['FID_{0}'.format(os.path.basename(fc)) for fc in lst_inputs]
+        lst_drop = [f.name for f in arcpy.ListFields(dataset=self.fc_gar_cells_identity) if f.name in lst_fid]
+        if lst_drop:
+            arcpy.DeleteField_management(in_table=self.fc_gar_cells_identity, drop_field=lst_drop)
+        return True
+
     def fix_slivers(self):
         """
         Function:
@@ -1018,36 +1177,34 @@ class GARAnalysis:
         self.logger.info('Repairing geometry')
         arcpy.RepairGeometry_management(in_features=single_part_output)
 
-        # Update the area field with the updated shape areas
-        arcpy.AddField_management(in_table=single_part_output, field_name=fld_area, field_type='DOUBLE')
-        with arcpy.da.UpdateCursor(single_part_output, ['SHAPE@AREA', fld_area]) as u_cursor:
-            for row in u_cursor:
-                row[1] = row[0]
-                u_cursor.updateRow(row)
+        # Add the area field holding the updated shape areas; the tool creates the field as it calculates
+        arcpy.CalculateGeometryAttributes_management(in_features=single_part_output,
+                                                     geometry_property=[[fld_area, 'AREA']],
+                                                     area_unit='SQUARE_METERS')
         prev_selection = 9999999999
-        output_fc = os.path.join(self.scratch_gdb, 'out_temp')
-        output_temp_fc = output_fc
+        # The pass outputs are short lived, keep them in the memory workspace
+        output_fc = os.path.join('memory', 'out_temp')
+        output_temp_fc = os.path.join('memory', 'out_temp_1')
 
         # Run eliminate polygons for the first time
         current_selection = self.eliminate_small_polygons(inputfc=single_part_output, outputfc=output_fc,
                                                           area_field=fld_area)
 
         self.logger.info('Merge 1m polygons with biggest neighbour')
-        # do eliminates until there are no more polygons neighbouring to join to.
-        while prev_selection > current_selection:
+        # do eliminates until there are no more polygons neighbouring to join to. Each pass reads the output of
+        # the previous pass, the two scratch outputs swap roles between passes
+        while 0 < current_selection < prev_selection:
             self.logger.info('{} polygon(s) remaining'.format(current_selection))
-            # run it again:
-            input_fc = output_fc
-            output_temp_fc = os.path.join(self.scratch_gdb, 'out_temp_1')
             prev_selection = current_selection
+            output_fc, output_temp_fc = output_temp_fc, output_fc
             # Run eliminate polygons
-            current_selection = self.eliminate_small_polygons(inputfc=input_fc, outputfc=output_temp_fc,
+            current_selection = self.eliminate_small_polygons(inputfc=output_temp_fc, outputfc=output_fc,
                                                               area_field=fld_area)
 
         # Once all slivers have beeen eliminated create resultant
-        arcpy.DeleteField_management(in_table=output_temp_fc, drop_field=fld_area)
+        arcpy.DeleteField_management(in_table=output_fc, drop_field=fld_area)
         self.logger.info('Creating resultant')
-        arcpy.CopyFeatures_management(in_features=output_temp_fc, out_feature_class=self.fc_resultant)
+        arcpy.CopyFeatures_management(in_features=output_fc, out_feature_class=self.fc_resultant)
         for f in [output_fc, output_temp_fc, single_part_output]:
             if arcpy.Exists(dataset=f):
                 arcpy.Delete_management(in_data=f)
@@ -1069,39 +1226,66 @@ class GARAnalysis:
         arcpy.SelectLayerByAttribute_management(in_layer_or_view=temp_layer, selection_type='NEW_SELECTION',
                                                 where_clause='{0} < 1'.format(area_field))
         current_selection = int(arcpy.GetCount_management(in_rows=temp_layer).getOutput(0))
-        gc.collect()
-        arcpy.Delete_management(in_data='in_memory')
+        if not current_selection:
+            # Nothing left to merge, pass the input through without another eliminate and area update
+            arcpy.Delete_management(in_data=temp_layer)
+            arcpy.CopyFeatures_management(in_features=inputfc, out_feature_class=outputfc)
+            return current_selection
         try:
             # Run eliminate on the selected polygons
             arcpy.Eliminate_management(in_features=temp_layer, out_feature_class=outputfc, selection='AREA')
+            arcpy.Delete_management(in_data=temp_layer)
         except:
+            # The selection layer is not needed by the per cell fallback; release it before the workers make their own
+            if arcpy.Exists(temp_layer):
+                arcpy.Delete_management(in_data=temp_layer)
             # If eliminate fails, run eliminate on each gar cell instead and merge to create final file
             self.logger.warning('Eliminate failed due to large dataset size, '
                                 'running eliminate based on {0}'.format(self.gar_class.gar_config.cell_field))
-            temp_fc = os.path.join(self.scratch_gdb, 'eliminate_temp')
-            lst_ids = sorted(list(set([row[0] for row in
-                                       arcpy.da.SearchCursor(inputfc, self.gar_class.gar_config.cell_field)])))
-            if arcpy.Exists(dataset=outputfc):
-                arcpy.Delete_management(in_data=outputfc)
-            for cell_id in lst_ids:
+            cell_field = self.gar_class.gar_config.cell_field
+            # Let the geodatabase return each cell id once instead of reading the field from every record
+            lst_ids = sorted(set(row[0] for row in arcpy.da.SearchCursor(inputfc, cell_field,
+                                                                         sql_clause=('DISTINCT', None))))
+            # Cells still to eliminate, keyed by their position which names each worker's layer and geodatabase
+            dict_remaining = dict(enumerate(lst_ids))
+            worker_folder = os.path.dirname(self.scratch_gdb)
+            lst_outputs = []
+            # Worker processes cannot read the memory workspace of this process, so stage that input on disk for them
+            worker_input = inputfc
+            if os.path.dirname(inputfc).lower() == 'memory':
+                worker_input = os.path.join(self.scratch_gdb, 'eliminate_input')
+                arcpy.CopyFeatures_management(in_features=inputfc, out_feature_class=worker_input)
+            # The cells are independent of each other, so eliminate them in parallel worker processes
+            try:
+                with ProcessPoolExecutor(max_workers=min(len(dict_remaining), max((os.cpu_count() or 1) // 2, 1))) \
+                        as executor:
+                    dict_futures = {
+                        index: executor.submit(eliminate_worker, index, cell_id, worker_input, cell_field,
+                                               area_field, worker_folder)
+                        for index, cell_id in dict_remaining.items()
+                    }
+                    for index, future in dict_futures.items():
+                        lst_outputs.append(future.result())
+                        del dict_remaining[index]
+            except (ValueError, Exception):
+                self.logger.warning('...Parallel eliminate failed, running remaining cells one at a time')
+
+            for index, cell_id in dict_remaining.items():
                 self.logger.info('Working on {0}'.format(cell_id))
-                temp_layer = \
-                    arcpy.MakeFeatureLayer_management(in_features=inputfc, out_layer='temp_lyr',
-                                                      where_clause='{0} = \'{1}\''.format(
-                                                          self.gar_class.gar_config.cell_field, cell_id))
-                arcpy.SelectLayerByAttribute_management(in_layer_or_view=temp_layer, selection_type='NEW_SELECTION',
-                                                        where_clause='{0} < 1'.format(area_field))
-                arcpy.Eliminate_management(in_features=temp_layer, out_feature_class=temp_fc, selection='AREA')
-                if not arcpy.Exists(dataset=outputfc):
-                    arcpy.CopyFeatures_management(in_features=temp_fc, out_feature_class=outputfc)
-                else:
-                    arcpy.Append_management(inputs=temp_fc, target=outputfc, schema_type='NO_TEST')
+                lst_outputs.append(eliminate_worker(index=index, cell_id=cell_id, inputfc=worker_input,
+                                                    cell_field=cell_field, area_field=area_field,
+                                                    worker_folder=worker_folder))
+
+            # One merge builds the output instead of an append per cell
+            arcpy.Merge_management(inputs=lst_outputs, output=outputfc)
+            for worker_fc in lst_outputs:
+                arcpy.Delete_management(in_data=os.path.dirname(worker_fc))
+            if worker_input != inputfc:
+                arcpy.Delete_management(in_data=worker_input)
 
         # Update area field with new shape area
-        with arcpy.da.UpdateCursor(outputfc, ['SHAPE@AREA', area_field]) as u_cursor:
-            for row in u_cursor:
-                row[1] = row[0]
-                u_cursor.updateRow(row)
+        arcpy.CalculateGeometryAttributes_management(in_features=outputfc, geometry_property=[[area_field, 'AREA']],
+                                                     area_unit='SQUARE_METERS')
 
         return current_selection
 
@@ -1113,57 +1297,95 @@ class GARAnalysis:
         Returns:
             None
         """
-        # Add required fields
-        for fld in [self.fld_age_cur, self.fld_height_cur, self.fld_height_text, self.fld_level, self.fld_rank_oa,
-                    self.fld_rank_cell, self.fld_bec_version, self.fld_date_created, self.fld_calc_cflb]:
-            field_type = 'TEXT'
-            if fld in self.fld_age_cur:
-                field_type = 'SHORT'
-            elif fld == self.fld_date_created:
-                field_type = 'DATE'
-            elif fld == self.fld_height_cur:
-                field_type = 'DOUBLE'
-            try:
-                arcpy.AddField_management(in_table=self.fc_resultant, field_name=fld, field_type=field_type)
-            except (ValueError, Exception):
-                pass
+        # Add the required fields that are not on the resultant yet in a single call
+        set_fields = {field.name for field in arcpy.ListFields(dataset=self.fc_resultant)}
+        dict_types = {self.fld_age_cur: 'SHORT', self.fld_date_created: 'DATE', self.fld_height_cur: 'DOUBLE'}
+        lst_add = [[fld, dict_types.get(fld, 'TEXT')] for fld in
+                   [self.fld_age_cur, self.fld_height_cur, self.fld_height_text, self.fld_level, self.fld_rank_oa,
+                    self.fld_rank_cell, self.fld_bec_version, self.fld_date_created, self.fld_calc_cflb]
+                   if fld not in set_fields]
+        if lst_add:
+            arcpy.AddFields_management(in_table=self.fc_resultant, field_description=lst_add)
+            set_fields.update(fld for fld, field_type in lst_add)
+
+        # Columns that hold the same value on every record are written in one bulk calculation
+        self.logger.info('Updating bec version and date created')
+        date_created = self.run_date
+        arcpy.CalculateFields_management(in_table=self.fc_resultant, expression_type='PYTHON3',
+                                         fields=[[self.fld_bec_version, repr(self.bec_version)],
+                                                 [self.fld_date_created,
+                                                  'datetime.datetime({0}, {1}, {2})'.format(
+                                                      date_created.year, date_created.month, date_created.day)]],
+                                         code_block='import datetime')
 
         self.logger.info('Updating age and collecting areas')
-        current_year = dt.now().year
+        current_year = self.cur_year
         field_list = [self.fld_proj_date, self.fld_proj_age, self.fld_age_cur, self.fld_road_buffer, self.fld_cc_status,
-                      self.fld_cc_harv_date, self.fld_bec_version, self.fld_date_created, self.fld_bec, self.fld_level,
+                      self.fld_cc_harv_date, self.fld_bec, self.fld_level,
                       self.fld_species, self.fld_crown_closure, self.fld_slope, self.fld_thlb, self.fld_diameter,
                       self.fld_percent, self.fld_notes, self.fld_op_area, self.fld_shp_area, self.fld_calc_cflb,
                       self.fld_bclcs_2, self.fld_open_ind, self.fld_line_7b_dist_hist,
                       self.gar_class.gar_config.cell_field, self.fld_proj_height, self.fld_height_cur,
                       self.fld_height_text, self.fld_for_mgmt_ind]
-        field_list = [f for f in field_list if f in
-                      [field.name for field in arcpy.ListFields(dataset=self.fc_resultant)] or f == self.fld_shp_area]
+        field_list = [f for f in field_list if f in set_fields or f == self.fld_shp_area]
+        dict_idx = {fld: i for i, fld in enumerate(field_list)}
+        idx_slope = dict_idx.get(self.fld_slope)
+        idx_thlb = dict_idx.get(self.fld_thlb)
+        idx_notes = dict_idx.get(self.fld_notes)
+        idx_proj_date = dict_idx[self.fld_proj_date]
+        idx_proj_age = dict_idx[self.fld_proj_age]
+        idx_proj_height = dict_idx[self.fld_proj_height]
+        idx_cc_status = dict_idx[self.fld_cc_status]
+        idx_cc_harv_date = dict_idx[self.fld_cc_harv_date]
+        idx_bec = dict_idx[self.fld_bec]
+        idx_species = dict_idx[self.fld_species]
+        idx_crown_closure = dict_idx[self.fld_crown_closure]
+        idx_diameter = dict_idx[self.fld_diameter]
+        idx_percent = dict_idx[self.fld_percent]
+        idx_cell = dict_idx[self.gar_class.gar_config.cell_field]
+        idx_op_area = dict_idx[self.fld_op_area]
+        idx_shp_area = dict_idx[self.fld_shp_area]
+        idx_for_mgmt_ind = dict_idx[self.fld_for_mgmt_ind]
+        idx_road_buffer = dict_idx[self.fld_road_buffer]
+        idx_calc_cflb = dict_idx[self.fld_calc_cflb]
+        idx_level = dict_idx[self.fld_level]
+        idx_age_cur = dict_idx[self.fld_age_cur]
+        idx_height_cur = dict_idx[self.fld_height_cur]
+        idx_height_text = dict_idx[self.fld_height_text]
+        # The level calculation for 8-232 runs on the dissolved resultant below instead
+        calculate_level = self.gar_class.calculate_level if self.gar != 'u-8-232' else None
+        # Cell notes repeat on every record of the cell, so each distinct note is only parsed once
+        dict_targets = {}
+        # Only a handful of bec labels occur, so each is stripped of spaces once and reused by both cursor loops
+        dict_bec = {}
         # Loop through resultant calculating values needed for this analysis
         with arcpy.da.UpdateCursor(self.fc_resultant, field_list) as u_cursor:
             for row in u_cursor:
                 # Read in values from resultant record
-                proj_date = row[field_list.index(self.fld_proj_date)]
-                proj_age = row[field_list.index(self.fld_proj_age)]
-                proj_hgt = row[field_list.index(self.fld_proj_height)]
-                rd_buffer = row[field_list.index(self.fld_road_buffer)]
-                cc_status = row[field_list.index(self.fld_cc_status)]
-                cc_harv_date = row[field_list.index(self.fld_cc_harv_date)]
-                bec = str(row[field_list.index(self.fld_bec)]).replace(' ', '')
-                spp = str(row[field_list.index(self.fld_species)])
-                cc = row[field_list.index(self.fld_crown_closure)]
-                slp = row[field_list.index(self.fld_slope)] if self.fld_slope in field_list else None
-                thlb = (float(row[field_list.index(self.fld_thlb)]) if row[field_list.index(self.fld_thlb)] else 0) \
-                    if self.fld_thlb in field_list else None
-                diam = row[field_list.index(self.fld_diameter)]
-                pct = row[field_list.index(self.fld_percent)]
-                notes = row[field_list.index(self.fld_notes)] if self.fld_notes in field_list else ''
-                target = int(notes[notes.find('=') + 2:]) \
-                    if any(char.isdigit() for char in notes) and '=' in notes else None
-                pcell = row[field_list.index(self.gar_class.gar_config.cell_field)]
-                op_area = row[field_list.index(self.fld_op_area)]
-                shp_area = row[field_list.index(self.fld_shp_area)] / 10000
-                for_ind = row[field_list.index(self.fld_for_mgmt_ind)]
+                proj_date = row[idx_proj_date]
+                proj_age = row[idx_proj_age]
+                proj_hgt = row[idx_proj_height]
+                rd_buffer = row[idx_road_buffer]
+                cc_status = row[idx_cc_status]
+                cc_harv_date = row[idx_cc_harv_date]
+                bec = dict_bec.get(row[idx_bec])
+                if bec is None:
+                    bec = dict_bec[row[idx_bec]] = str(row[idx_bec]).replace(' ', '')
+                spp = str(row[idx_species])
+                cc = row[idx_crown_closure]
+                slp = row[idx_slope] if idx_slope is not None else None
+                thlb = (float(row[idx_thlb]) if row[idx_thlb] else 0) if idx_thlb is not None else None
+                diam = row[idx_diameter]
+                pct = row[idx_percent]
+                notes = row[idx_notes] if idx_notes is not None else ''
+                if notes not in dict_targets:
+                    match_target = RE_TARGET.search(notes) if notes else None
+                    dict_targets[notes] = int(match_target.group(1)) if match_target else None
+                target = dict_targets[notes]
+                pcell = row[idx_cell]
+                op_area = row[idx_op_area]
+                shp_area = row[idx_shp_area] / 10000
+                for_ind = row[idx_for_mgmt_ind]
                 calc_cflb = None
                 height_cur = None
                 height_text = None
@@ -1191,7 +1413,7 @@ class GARAnalysis:
                         pass
 
                 if cc_status == 'ROAD':  # Find road buffered and set the age to none
-                    row[field_list.index(self.fld_road_buffer)] = 'Yes'
+                    row[idx_road_buffer] = 'Yes'
                     age_cur = None
 
                 if rd_buffer == 'Yes':
@@ -1199,42 +1421,45 @@ class GARAnalysis:
 
                 if for_ind == 'Y':  # Check if the polygon is part of the cflb
                     calc_cflb = 'Y'
-                    row[field_list.index(self.fld_calc_cflb)] = calc_cflb
+                    row[idx_calc_cflb] = calc_cflb
 
-                if self.gar != 'u-8-232':  # Run the gar class level calculation if the gar is not 8-232
-                    level = self.gar_class.calculate_level(bec=bec, age=age_cur, spp=spp, cc=cc, slp=slp, thlb=thlb,
-                                                           diam=diam, pct=pct, gfa=calc_cflb, notes=notes,
-                                                           op_area=op_area, pcell=pcell, shp_area=shp_area,
-                                                           target=target, height=height_cur)
-                    row[field_list.index(self.fld_level)] = level
+                if calculate_level:  # Run the gar class level calculation if the gar is not 8-232
+                    level = calculate_level(bec=bec, age=age_cur, spp=spp, cc=cc, slp=slp, thlb=thlb, diam=diam,
+                                            pct=pct, gfa=calc_cflb, notes=notes, op_area=op_area, pcell=pcell,
+                                            shp_area=shp_area, target=target, height=height_cur)
+                    row[idx_level] = level
 
                 # Update row records
-                row[field_list.index(self.fld_age_cur)] = age_cur
-                row[field_list.index(self.fld_height_cur)] = height_cur
-                row[field_list.index(self.fld_height_text)] = height_text
-                row[field_list.index(self.fld_bec_version)] = self.bec_version
-                row[field_list.index(self.fld_date_created)] = dt.now().strftime('%d/%m/%Y')
+                row[idx_age_cur] = age_cur
+                row[idx_height_cur] = height_cur
+                row[idx_height_text] = height_text
 
                 u_cursor.updateRow(row)
 
         if self.gar == 'u-8-232':  # Run level caluclation for gar 8-232 as its different than all others
             lst_fields = [self.fld_op_area, self.fld_lu, self.fld_bec_zone_alt, self.fld_bec_subzone_alt,
                           self.fld_level, self.fld_height_text]
-            arcpy.Dissolve_management(in_features=self.fc_resultant, out_feature_class=self.fc_resultant_dissolve,
-                                      dissolve_field=lst_fields)
+            try:
+                arcpy.analysis.PairwiseDissolve(in_features=self.fc_resultant,
+                                                out_feature_class=self.fc_resultant_dissolve, dissolve_field=lst_fields)
+            except (ValueError, Exception):
+                self.logger.warning('...Pairwise dissolve failed, running standard dissolve')
+                arcpy.Dissolve_management(in_features=self.fc_resultant, out_feature_class=self.fc_resultant_dissolve,
+                                          dissolve_field=lst_fields)
             lst_fields.append('SHAPE@AREA')
+            dict_idx = {fld: i for i, fld in enumerate(lst_fields)}
             with arcpy.da.UpdateCursor(self.fc_resultant_dissolve, lst_fields) as u_cursor:
                 for row in u_cursor:
-                    hgt = row[lst_fields.index(self.fld_height_text)]
-                    shp_area = row[lst_fields.index('SHAPE@AREA')] / 10000
-                    bec = '{0} {1}'.format(row[lst_fields.index(self.fld_bec_zone_alt)],
-                                           row[lst_fields.index(self.fld_bec_subzone_alt)])
-                    op_area = row[lst_fields.index(self.fld_op_area)]
-                    lu = row[lst_fields.index(self.fld_lu)]
+                    hgt = row[dict_idx[self.fld_height_text]]
+                    shp_area = row[dict_idx['SHAPE@AREA']] / 10000
+                    bec = '{0} {1}'.format(row[dict_idx[self.fld_bec_zone_alt]],
+                                           row[dict_idx[self.fld_bec_subzone_alt]])
+                    op_area = row[dict_idx[self.fld_op_area]]
+                    lu = row[dict_idx[self.fld_lu]]
 
                     level = self.gar_class.calculate_level(op_area=op_area, pcell='{0}: {1}'.format(lu, bec),
                                                            shp_area=shp_area, height=hgt)
-                    row[lst_fields.index(self.fld_level)] = level
+                    row[dict_idx[self.fld_level]] = level
                     u_cursor.updateRow(row)
 
         # Calculate targets
@@ -1245,20 +1470,45 @@ class GARAnalysis:
             self.logger.info('Updating resultant with ranks')
             field_list = [self.gar_class.gar_config.cell_field, self.fld_level, self.fld_op_area, self.fld_rank_oa,
                           self.fld_rank_cell, self.fld_bec]
+            dict_idx = {fld: i for i, fld in enumerate(field_list)}
+            # Flatten the nested area objects into (op area, cell, level[, bec]) keyed ranks once, rather than walking
+            # the nested dictionaries on every row; 8-006 ranks by level only
+            b_bec = self.gar != 'u-8-006'
+            dict_oa_rank = {}
+            dict_cell_rank = {}
+            for op_area, total_area in self.gar_class.dict_total_area.items():
+                for pcell, cell_area in total_area.pcell.items():
+                    for level, level_area in cell_area.level.items():
+                        if not b_bec:
+                            dict_oa_rank[(op_area, pcell, level)] = level_area.rank
+                            continue
+                        for bec, bec_area in level_area.bec.items():
+                            dict_oa_rank[(op_area, pcell, level, bec)] = bec_area.rank
+            for pcell, cell_area in self.gar_class.dict_cell_area.items():
+                for level, level_area in cell_area.level.items():
+                    if not b_bec:
+                        dict_cell_rank[(pcell, level)] = level_area.rank
+                        continue
+                    for bec, bec_area in level_area.bec.items():
+                        dict_cell_rank[(pcell, level, bec)] = bec_area.rank
+
             with arcpy.da.UpdateCursor(self.fc_resultant, field_list) as u_cursor:
                 for row in u_cursor:
-                    pcell = row[field_list.index(self.gar_class.gar_config.cell_field)]
-                    level = str(row[field_list.index(self.fld_level)])
-                    op_area = row[field_list.index(self.fld_op_area)]
-                    bec = str(row[field_list.index(self.fld_bec)]).replace(' ', '')
-                    if self.gar == 'u-8-006':
-                        oa_rank = self.gar_class.dict_total_area[op_area].pcell[pcell].level[level].rank
-                        cell_rank = self.gar_class.dict_cell_area[pcell].level[level].rank
+                    pcell = row[dict_idx[self.gar_class.gar_config.cell_field]]
+                    level = str(row[dict_idx[self.fld_level]])
+                    op_area = row[dict_idx[self.fld_op_area]]
+                    if b_bec:
+                        bec = dict_bec.get(row[dict_idx[self.fld_bec]])
+                        if bec is None:
+                            bec = dict_bec[row[dict_idx[self.fld_bec]]] = \
+                                str(row[dict_idx[self.fld_bec]]).replace(' ', '')
+                        oa_rank = dict_oa_rank.get((op_area, pcell, level, bec))
+                        cell_rank = dict_cell_rank.get((pcell, level, bec))
                     else:
-                        oa_rank = self.gar_class.dict_total_area[op_area].pcell[pcell].level[level].bec[bec].rank
-                        cell_rank = self.gar_class.dict_cell_area[pcell].level[level].bec[bec].rank
-                    row[field_list.index(self.fld_rank_oa)] = oa_rank
-                    row[field_list.index(self.fld_rank_cell)] = cell_rank
+                        oa_rank = dict_oa_rank.get((op_area, pcell, level))
+                        cell_rank = dict_cell_rank.get((pcell, level))
+                    row[dict_idx[self.fld_rank_oa]] = oa_rank
+                    row[dict_idx[self.fld_rank_cell]] = cell_rank
                     u_cursor.updateRow(row)
 
             if self.gar == 'u-8-006':  # Calculate mature stands for 8-006
@@ -1286,32 +1536,39 @@ class GARAnalysis:
         # Select subset and dissolve
         result_lyr = arcpy.MakeFeatureLayer_management(in_features=self.fc_resultant, out_layer='result_lyr',
                                                        where_clause=where_clause)
-        fc_dissolve = os.path.join(self.scratch_gdb, 'dissolve_temp')
-        arcpy.Dissolve_management(in_features=result_lyr, out_feature_class=fc_dissolve,
-                                  dissolve_field=dissolve_fields, multi_part='SINGLE_PART')
+        fc_dissolve = os.path.join('memory', 'dissolve_temp')
+        try:
+            arcpy.analysis.PairwiseDissolve(in_features=result_lyr, out_feature_class=fc_dissolve,
+                                            dissolve_field=dissolve_fields, multi_part='SINGLE_PART')
+        except (ValueError, Exception):
+            self.logger.warning('...Pairwise dissolve failed, running standard dissolve')
+            arcpy.Dissolve_management(in_features=result_lyr, out_feature_class=fc_dissolve,
+                                      dissolve_field=dissolve_fields, multi_part='SINGLE_PART')
         arcpy.Delete_management(in_data=result_lyr)
         lst_fields = dissolve_fields + ['SHAPE@AREA']
 
-        if self.fld_op_area in lst_fields:  # If operating area based, loop through and calculate mature stands
-            for row in arcpy.da.SearchCursor(fc_dissolve, lst_fields):
-                shp = row[lst_fields.index('SHAPE@AREA')] / 10000
-                pcell = row[lst_fields.index(self.gar_class.gar_config.cell_field)]
-                op_area = row[lst_fields.index(self.fld_op_area)]
-                if shp >= 20:
-                    if run_type == 'Mature':
-                        self.gar_class.dict_total_area[op_area].pcell[pcell]. \
-                            level[self.gar_class.str_mature].stand_hectares += shp
-                    else:
-                        self.gar_class.dict_total_area[op_area].pcell[pcell].stand_hectares += shp
-        else:  # If planning cell based, loop through and calculate mature stands
-            for row in arcpy.da.SearchCursor(fc_dissolve, lst_fields):
-                shp = row[lst_fields.index('SHAPE@AREA')] / 10000
-                pcell = row[lst_fields.index(self.gar_class.gar_config.cell_field)]
+        # Sum the stands of 20 hectares or more per key first, then write each total into the area objects once
+        dict_stands = {}
+        with arcpy.da.SearchCursor(fc_dissolve, lst_fields) as s_cursor:
+            for row in s_cursor:
+                shp = row[-1] / 10000
                 if shp >= 20:
-                    if run_type == 'Mature':
-                        self.gar_class.dict_cell_area[pcell].level[self.gar_class.str_mature].stand_hectares += shp
-                    else:
-                        self.gar_class.dict_cell_area[pcell].stand_hectares += shp
+                    key = row[:-1]
+                    dict_stands[key] = dict_stands.get(key, 0) + shp
+
+        b_op_area = self.fld_op_area in lst_fields
+        idx_cell = lst_fields.index(self.gar_class.gar_config.cell_field)
+        idx_op_area = lst_fields.index(self.fld_op_area) if b_op_area else None
+        for key, shp in dict_stands.items():
+            pcell = key[idx_cell]
+            if b_op_area:  # If operating area based, add to the operating area totals
+                cell_area = self.gar_class.dict_total_area[key[idx_op_area]].pcell[pcell]
+            else:  # If planning cell based, add to the planning cell totals
+                cell_area = self.gar_class.dict_cell_area[pcell]
+            if run_type == 'Mature':
+                cell_area.level[self.gar_class.str_mature].stand_hectares += shp
+            else:
+                cell_area.stand_hectares += shp
         arcpy.Delete_management(in_data=fc_dissolve)
 
     def dissolve_resultant(self):
@@ -1324,10 +1581,16 @@ class GARAnalysis:
         self.logger.info('Dissolving resultant')
         lst_fields = [self.fld_uwr_num, self.fld_notes, self.fld_op_area, self.fld_level, self.fld_rank_cell,
                       self.fld_rank_oa, self.fld_bec, self.fld_bec_version, self.fld_date_created]
-        lst_fields = [f for f in lst_fields if f in
-                      [field.name for field in arcpy.ListFields(dataset=self.fc_resultant)]]
-        arcpy.Dissolve_management(in_features=self.fc_resultant, out_feature_class=self.fc_resultant_rank,
-                                  dissolve_field=lst_fields, multi_part='SINGLE_PART')
+        set_fields = {field.name for field in arcpy.ListFields(dataset=self.fc_resultant)}
+        lst_fields = [f for f in lst_fields if f in set_fields]
+        try:
+            # Pairwise dissolve runs the union work across all cores
+            arcpy.analysis.PairwiseDissolve(in_features=self.fc_resultant, out_feature_class=self.fc_resultant_rank,
+                                            dissolve_field=lst_fields, multi_part='SINGLE_PART')
+        except (ValueError, Exception):
+            self.logger.warning('...Pairwise dissolve failed, running standard dissolve')
+            arcpy.Dissolve_management(in_features=self.fc_resultant, out_feature_class=self.fc_resultant_rank,
+                                      dissolve_field=lst_fields, multi_part='SINGLE_PART')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,215 @@
+"""
+----------------------------------------------------------------------------------------------------------------
+    PYTHON SCRIPT: gar_cache.py
+
+    Author:       BCTS TOC - Graydon Shevchenko
+    Purpose:      Caches the subsets of the BCGW and local source layers extracted for a GAR analysis so
+                  repeat runs within the cache lifetime skip the remote reads
+    Date Created: October 15, 2026
+----------------------------------------------------------------------------------------------------------------
+"""
+import arcpy
+import hashlib
+import json
+import os
+
+from datetime import datetime as dt
+
+MANIFEST_NAME = 'gar_cache.json'
+
+
+def cache_key(gar_input, key_suffix='', ttl_days=1):
+    """
+    Function:
+        Builds the cache key for an input from its source path, sql and the current time to live bucket
+    Args:
+        gar_input (GARInput): input class object
+        key_suffix (str): extra text that identifies the selection area, e.g. the gar being run
+        ttl_days (int): number of days a cached extract stays valid
+
+    Returns:
+        str: the hexadecimal cache key
+    """
+    ttl_bucket = str(dt.now().toordinal() // max(ttl_days, 1))
+    key_text = '|'.join([gar_input.path, gar_input.sql or '', key_suffix, ttl_bucket])
+    return hashlib.sha1(key_text.encode('utf-8')).hexdigest()
+
+
+def read_manifest(cache_gdb):
+    """
+    Function:
+        Reads the cache manifest stored beside the cache geodatabase
+    Args:
+        cache_gdb (str): path to the cache geodatabase
+
+    Returns:
+        dict: cache key to entry dictionary
+    """
+    manifest = os.path.join(os.path.dirname(cache_gdb), MANIFEST_NAME)
+    if not os.path.exists(manifest):
+        return {}
+    try:
+        with open(manifest, 'r') as f:
+            return json.load(f)
+    except (ValueError, OSError):
+        return {}
+
+
+def write_manifest(cache_gdb, dict_manifest):
+    """
+    Function:
+        Writes the cache manifest beside the cache geodatabase
+    Args:
+        cache_gdb (str): path to the cache geodatabase
+        dict_manifest (dict): cache key to entry dictionary
+
+    Returns:
+        None
+    """
+    manifest = os.path.join(os.path.dirname(cache_gdb), MANIFEST_NAME)
+    with open(manifest, 'w') as f:
+        json.dump(dict_manifest, f, indent=2)
+
+
+def prune_cache(cache_gdb, ttl_days=1, logger=None):
+    """
+    Function:
+        Deletes cached extracts that are older than the time to live and removes them from the manifest
+    Args:
+        cache_gdb (str): path to the cache geodatabase
+        ttl_days (int): number of days a cached extract stays valid
+        logger (logger): logger object
+
+    Returns:
+        None
+    """
+    dict_manifest = read_manifest(cache_gdb)
+    today = dt.now().toordinal()
+    for key in list(dict_manifest):
+        if today - dict_manifest[key]['created'] < ttl_days:
+            continue
+        cached_fc = os.path.join(cache_gdb, dict_manifest[key]['name'])
+        if arcpy.Exists(cached_fc):
+            arcpy.Delete_management(in_data=cached_fc)
+        if logger:
+            logger.info('Removed stale cache entry {0}'.format(dict_manifest[key]['path']))
+        del dict_manifest[key]
+    write_manifest(cache_gdb, dict_manifest)
+
+
+def get_cached(gar_input, cache_gdb, key_suffix='', ttl_days=1):
+    """
+    Function:
+        Finds the cached extract of an input
+    Args:
+        gar_input (GARInput): input class object
+        cache_gdb (str): path to the cache geodatabase
+        key_suffix (str): extra text that identifies the selection area, e.g. the gar being run
+        ttl_days (int): number of days a cached extract stays valid
+
+    Returns:
+        str: path to the cached feature class, None if the input has not been cached
+    """
+    key = cache_key(gar_input=gar_input, key_suffix=key_suffix, ttl_days=ttl_days)
+    cached_fc = os.path.join(cache_gdb, 'cache_{0}'.format(key[:16]))
+    return cached_fc if arcpy.Exists(cached_fc) else None
+
+
+def add_to_cache(gar_input, cache_gdb, key_suffix='', ttl_days=1):
+    """
+    Function:
+        Stores a copy of the extracted input output in the cache and records it in the manifest
+    Args:
+        gar_input (GARInput): input class object
+        cache_gdb (str): path to the cache geodatabase
+        key_suffix (str): extra text that identifies the selection area, e.g. the gar being run
+        ttl_days (int): number of days a cached extract stays valid
+
+    Returns:
+        None
+    """
+    key = cache_key(gar_input=gar_input, key_suffix=key_suffix, ttl_days=ttl_days)
+    cached_fc = os.path.join(cache_gdb, 'cache_{0}'.format(key[:16]))
+    arcpy.CopyFeatures_management(in_features=gar_input.output, out_feature_class=cached_fc)
+    dict_manifest = read_manifest(cache_gdb)
+    dict_manifest[key] = {'name': os.path.basename(cached_fc), 'path': gar_input.path, 'sql': gar_input.sql,
+                          'created': dt.now().toordinal()}
+    write_manifest(cache_gdb, dict_manifest)
+
+
+def extract(path, sql, select_features, output):
+    """
+    Function:
+        Selects the features of a source layer that intersect the selection features and copies them to the output
+    Args:
+        path (str): path to the source layer
+        sql (str): where clause applied to the source layer
+        select_features (str|Layer): features used to select the input subset
+        output (str): path to the output feature class
+
+    Returns:
+        None
+    """
+    input_lyr = arcpy.MakeFeatureLayer_management(in_features=path, out_layer='input_lyr', where_clause=sql)
+    arcpy.SelectLayerByLocation_management(in_layer=input_lyr, overlap_type='INTERSECT',
+                                           select_features=select_features)
+    arcpy.CopyFeatures_management(in_features=input_lyr, out_feature_class=output)
+    arcpy.Delete_management(in_data=input_lyr)
+
+
+def extract_worker(name, path, sql, select_fc, worker_folder):
+    """
+    Function:
+        Process pool entry point; extracts one input into a geodatabase private to this worker so parallel
+        extracts never write to the same geodatabase
+    Args:
+        name (str): name of the input in the gar input dictionary
+        path (str): path to the source layer
+        sql (str): where clause applied to the source layer
+        select_fc (str): path to the feature class used to select the input subset
+        worker_folder (str): folder the worker geodatabase is created in
+
+    Returns:
+        str: path to the extracted feature class
+    """
+    arcpy.env.overwriteOutput = True
+    # Workers do not inherit the parent environment; limiting the extent to the selection features lets the
+    # database apply a bounding box filter before the where clause and location select are evaluated
+    arcpy.env.extent = arcpy.Describe(value=select_fc).extent
+    worker_gdb = os.path.join(worker_folder, 'GAR_Extract_{0}.gdb'.format(name))
+    if not arcpy.Exists(dataset=worker_gdb):
+        arcpy.CreateFileGDB_management(out_folder_path=worker_folder, out_name=os.path.basename(worker_gdb))
+    output = os.path.join(worker_gdb, name)
+    extract(path=path, sql=sql, select_features=select_fc, output=output)
+    return output
+
+
+def get_or_extract(gar_input, select_features, cache_gdb, key_suffix='', ttl_days=1, logger=None, use_cached=True):
+    """
+    Function:
+        Copies the cached extract of the input to its output if one exists, otherwise selects the input features that
+        intersect the selection features, writes them to the output and stores a copy in the cache
+    Args:
+        gar_input (GARInput): input class object
+        select_features (str|Layer): features used to select the input subset
+        cache_gdb (str): path to the cache geodatabase
+        key_suffix (str): extra text that identifies the selection area, e.g. the gar being run
+        ttl_days (int): number of days a cached extract stays valid
+        logger (logger): logger object
+        use_cached (bool): False to always extract, e.g. when the source was rebuilt during this run; the fresh
+            extract still replaces the cached copy
+
+    Returns:
+        bool: True if the output was copied from the cache
+    """
+    cached_fc = get_cached(gar_input=gar_input, cache_gdb=cache_gdb, key_suffix=key_suffix,
+                           ttl_days=ttl_days) if use_cached else None
+    if cached_fc:
+        if logger:
+            logger.info('...Using cached extract')
+        arcpy.CopyFeatures_management(in_features=cached_fc, out_feature_class=gar_input.output)
+        return True
+
+    extract(path=gar_input.path, sql=gar_input.sql, select_features=select_features, output=gar_input.output)
+    add_to_cache(gar_input=gar_input, cache_gdb=cache_gdb, key_suffix=key_suffix, ttl_days=ttl_days)
+    return False
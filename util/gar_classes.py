@@ -92,6 +92,8 @@ class SICReplacement:
     Class:
         SIC replacement class object
     """
+    __slots__ = ('zone', 'sub', 'var', 'age', 'dbh', 'hgt', 'cc', 'slp', 'sp1', 'per1', 'sp2', 'per2', 'sp3', 'per3',
+                 'sp4', 'per4', 'sp5', 'per5', 'sp6', 'per6', 'survey_dt')
 
     def __init__(self, zone=None, sub=None, var=None, age=None, dbh=None, hgt=None, cc=None, slp=None,
                  sp1=None, per1=None, sp2=None, per2=None, sp3=None, per3=None, sp4=None, per4=None, sp5=None,
@@ -186,3 +188,110 @@ class GARExcel:
             else:
                 return round(value, 2)
         return value
+
+
+class GARSheet:
+    """
+    Class:
+        Buffered worksheet used to collect cell writes as a flat (row, col, value, style) record stream before
+        emitting them to an xlsxwriter worksheet in a single top to bottom pass
+    """
+    def __init__(self):
+        self.records = []
+        self.merges = []
+        self.row_heights = {}
+
+    def write(self, row, col, value, style=None):
+        """
+        Function:
+            Adds a cell write to the record stream
+        Args:
+            row (int): zero based row index
+            col (int): zero based column index
+            value: cell value
+            style (Format): xlsxwriter format object
+
+        Returns:
+            None
+        """
+        self.records.append((row, col, value, style))
+
+    def write_blank(self, row, col, style=None):
+        """
+        Function:
+            Adds a formatted blank cell to the record stream
+        Args:
+            row (int): zero based row index
+            col (int): zero based column index
+            style (Format): xlsxwriter format object
+
+        Returns:
+            None
+        """
+        self.records.append((row, col, None, style))
+
+    def merge_range(self, first_row, first_col, last_row, last_col, value, style=None):
+        """
+        Function:
+            Adds a merged range to be applied once the cell records have been written
+        Args:
+            first_row (int): first row of the range
+            first_col (int): first column of the range
+            last_row (int): last row of the range
+            last_col (int): last column of the range
+            value: cell value
+            style (Format): xlsxwriter format object
+
+        Returns:
+            None
+        """
+        self.merges.append((first_row, first_col, last_row, last_col, value, style))
+
+    def set_row(self, row, height):
+        """
+        Function:
+            Records the height of a row
+        Args:
+            row (int): zero based row index
+            height (float): row height
+
+        Returns:
+            None
+        """
+        self.row_heights[row] = height
+
+    def flush(self, worksheet):
+        """
+        Function:
+            Emits the sorted record stream, merged ranges and row heights to the worksheet; values are written with
+            the typed xlsxwriter methods so each cell skips the generic write() type sniffing; any other type
+            (bools, Decimals, numpy numbers) goes through write() so it is stored the same way as before
+        Args:
+            worksheet (Worksheet): xlsxwriter worksheet object
+
+        Returns:
+            None
+        """
+        write_number = worksheet.write_number
+        write_string = worksheet.write_string
+        write_blank = worksheet.write_blank
+        for row, col, value, style in sorted(self.records, key=lambda r: (r[0], r[1])):
+            if value is None:
+                write_blank(row, col, None, style)
+            elif isinstance(value, str):
+                if value:
+                    write_string(row, col, value, style)
+                else:
+                    write_blank(row, col, None, style)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                write_number(row, col, value, style)
+            else:
+                worksheet.write(row, col, value, style)
+        for first_row, first_col, last_row, last_col, value, style in self.merges:
+            worksheet.merge_range(first_row, first_col, last_row, last_col, value, style)
+        for row in sorted(self.row_heights):
+            worksheet.set_row(row, self.row_heights[row])
+
+        self.records = []
+        self.merges = []
+        self.row_heights = {}
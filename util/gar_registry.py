@@ -0,0 +1,142 @@
+"""
+----------------------------------------------------------------------------------------------------------------
+    PYTHON SCRIPT: gar_registry.py
+
+    Author:       BCTS TOC - Graydon Shevchenko
+    Purpose:      Registry of the GAR and LRMP analyses that can be run, holding the Gar class and the
+                  configuration values used to build each analysis' GARConfig
+    Date Created: October 15, 2026
+----------------------------------------------------------------------------------------------------------------
+"""
+from gar.gar_4001 import Gar4001
+from gar.gar_4007 import Gar4007
+from gar.gar_4010 import Gar4010
+from gar.gar_8001 import Gar8001
+from gar.gar_8005 import Gar8005
+from gar.gar_8006 import Gar8006
+from gar.gar_8012 import Gar8012
+from gar.gar_8232 import Gar8232
+from gar.lrmp_sheep import LrmpSheep
+
+# Values are attribute names on the GARAnalysis object; names starting with __ are the private source layers.
+# The sql templates are formatted with gar (the gar name without the tfl49 suffix) and tag (the gar without the
+# leading 'u-')
+UWR_SQL = 'UWR_NUMBER = \'{gar}\' AND FEATURE_NOTES NOT LIKE \'%SIC = 0%\''
+IDENTITY_FCS = ['fc_op_areas', 'fc_bec', 'fc_road_dissolve', 'fc_consolidated_cb', 'fc_vri_clip']
+
+REGISTRY = {
+    'u-4-001': {
+        'class': Gar4001,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_federal_land', 'fc_csrd_parks', 'fc_prov_parks', 'fc_nat_parks',
+                      'fc_crown_grants', 'fc_broadleaf_stands'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'u-4-007': {
+        'class': Gar4007,
+        'sql': None,
+        'cells': '__uwr_golden',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_federal_land', 'fc_prov_parks', 'fc_nat_parks', 'fc_xmas_trees'],
+        'identity_fcs': IDENTITY_FCS + ['fc_slope']
+    },
+    'u-4-010': {
+        'class': Gar4010,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_notes',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_federal_land', 'fc_prov_parks', 'fc_nat_parks'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'u-8-001': {
+        'class': Gar8001,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots'],
+        'identity_fcs': ['fc_op_areas', 'fc_bec', 'fc_road_dissolve', 'fc_consolidated_cb', 'fc_thlb', 'fc_vri_clip',
+                         'fc_slope']
+    },
+    'u-8-001-tfl49': {
+        'class': Gar8001,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_tfl49',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots'],
+        'identity_fcs': ['fc_op_areas', 'fc_bec', 'fc_road_dissolve', 'fc_consolidated_cb', 'fc_thlb', 'fc_vri_clip',
+                         'fc_slope']
+    },
+    'u-8-005': {
+        'class': Gar8005,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'u-8-006': {
+        'class': Gar8006,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'u-8-012': {
+        'class': Gar8012,
+        'sql': UWR_SQL,
+        'cells': '__uwr',
+        'cell_field': 'fld_bec',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'u-8-232': {
+        'class': Gar8232,
+        'sql': 'TAG = \'{tag}\' AND ORG_ORGANIZATION_ID IN (4, 8)',
+        'cells': '__wha',
+        'cell_field': 'fld_lu',
+        'aoi': 'fc_op_areas',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots', 'fc_federal_land'],
+        'identity_fcs': ['fc_op_areas', 'fc_lu', 'fc_bec', 'fc_road_dissolve', 'fc_consolidated_cb', 'fc_vri_clip']
+    },
+    'lrmp-bhs': {
+        'class': LrmpSheep,
+        'sql': 'STRGC_LAND_RSRCE_PLAN_NAME = \'Okanagan Shuswap Land and Resource Management Plan\' '
+               'AND LEGAL_FEAT_OBJECTIVE = \'Big Horn Sheep Areas\'',
+        'cells': '__lrmp2',
+        'cell_field': 'fld_lrmp2',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots', 'fc_federal_land'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'lrmp-ds': {
+        'class': LrmpSheep,
+        'sql': 'STRGC_LAND_RSRCE_PLAN_NAME = \'Okanagan Shuswap Land and Resource Management Plan\' '
+               'AND NON_LEGAL_FEAT_OBJECTIVE = \'Derenzy Bighorn Sheep Habitat RMZ\' '
+               'AND NON_LEGAL_FEAT_ATRB_1_VALUE = \'2\'',
+        'cells': '__lrmp',
+        'cell_field': 'fld_lrmp',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots'],
+        'identity_fcs': IDENTITY_FCS
+    },
+    'section-7': {
+        'class': Gar8006,
+        'sql': None,
+        'cells': '__sec7',
+        'cell_field': 'fld_uwr_num',
+        'aoi': 'fc_toc_area',
+        'erase_fcs': ['fc_private_land', 'fc_woodlots'],
+        'identity_fcs': IDENTITY_FCS
+    }
+}
@@ -134,12 +134,17 @@ class SICReplacement:
                       self.fld_perc5, self.fld_spec6, self.fld_perc6, self.fld_survey_date, 'SHAPE@']
 
         with arcpy.da.Editor(os.path.dirname(self.sic_replacement)) as edit:
+            sr_bcalbers = arcpy.SpatialReference(3005)
             with arcpy.da.SearchCursor(self.in_poly, 'SHAPE@') as s_cursor:
                 for row in s_cursor:
-                    new_shp = row[0].projectAs(arcpy.SpatialReference(3005))
+                    new_shp = row[0].projectAs(sr_bcalbers)
+                    new_ext = new_shp.extent
                     with arcpy.da.UpdateCursor(self.sic_replacement, 'SHAPE@') as u_cursor:
                         for u_row in u_cursor:
                             old_shp = u_row[0]
+                            # Areas whose bounding boxes do not touch cannot be equal or overlap, skip the ring tests
+                            if new_ext.disjoint(old_shp.extent):
+                                continue
                             if new_shp == old_shp:
                                 self.logger.info('New shape is the same as an existing shape, removing old shape')
                                 u_cursor.deleteRow()